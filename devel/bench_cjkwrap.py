@@ -0,0 +1,89 @@
+#!/usr/bin/python
+'''
+Benchmark for the CJK width functions
+
+Compares pyradio.cjkwrap.cjklen and cjkslices with the
+functions used up to 0.9.3.11.31 on Latin, CJK, emoji
+and mixed station names, checking that they return the
+same results.
+
+Usage (from the repository directory):
+
+    python devel/bench_cjkwrap.py [-n LOOPS] [-w WIDTH]
+
+WIDTH is the column the names are cut at (default: 40),
+as when drawing a station line.
+'''
+import os
+import sys
+import random
+import argparse
+import unicodedata
+from timeit import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pyradio.cjkwrap import cjklen, cjkslices
+
+
+def legacy_is_wide(char):
+    try:
+        return unicodedata.east_asian_width(char) in ('F', 'W')
+    except TypeError:
+        return False
+
+
+def legacy_cjklen(text):
+    return sum(2 if legacy_is_wide(char) else 1 for char in text)
+
+
+def legacy_cjkslices(text, index):
+    if legacy_cjklen(text) <= index:
+        return text, u''
+    i = 1
+    while legacy_cjklen(text[:i]) <= index:
+        i = i + 1
+    return text[:i-1], text[i-1:]
+
+
+def make_corpora(count=200, seed=1):
+    rnd = random.Random(seed)
+    latin = 'abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ 0123456789 éèüöñ-'
+    cjk = '这显然不是巧合美国敌视中国之情绪正在加深加剧日本語放送局한국어라디오ラジオ'
+    emoji = '🎵🎶📻🎸🎹🎺🎻🥁🎤🎧'
+
+    def names(alphabet, low=20, high=80):
+        return [''.join(rnd.choice(alphabet) for _ in range(rnd.randint(low, high)))
+                for _ in range(count)]
+
+    return {
+        'latin': names(latin),
+        'cjk': names(cjk, 10, 50),
+        'emoji': names(latin + emoji * 3),
+        'mixed': names(latin + cjk + emoji),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CJK width functions benchmark')
+    parser.add_argument('-n', '--loops', type=int, default=20,
+                        help='times to process each corpus (default: 20)')
+    parser.add_argument('-w', '--width', type=int, default=40,
+                        help='column to cut the names at (default: 40)')
+    args = parser.parse_args()
+
+    for name, corpus in make_corpora().items():
+        for text in corpus:
+            if cjklen(text) != legacy_cjklen(text) or \
+                    cjkslices(text, args.width) != legacy_cjkslices(text, args.width):
+                print(f'{name}: result mismatch for "{text}"')
+        old = timeit(lambda: [(legacy_cjklen(x), legacy_cjkslices(x, args.width)) for x in corpus],
+                     number=args.loops)
+        new = timeit(lambda: [(cjklen(x), cjkslices(x, args.width)) for x in corpus],
+                     number=args.loops)
+        total = len(corpus) * args.loops
+        print('{0:6} legacy: {1:8.2f} us/name  cjkwrap: {2:6.2f} us/name  ({3:.0f}x)'.format(
+            name, 1e6 * old / total, 1e6 * new / total, old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+'''
+Micro-benchmark for the player output classifier
+
+Replays captured player stdout through
+pyradio.player.PlayerOutputClassifier and through the
+substring chain previously used by Player.updateStatus.
+
+Usage (from the repository directory):
+
+    python devel/bench_player_output.py [-n LOOPS] [-r REPEAT] [capture_file ...]
+
+A capture file is the raw stdout of a player, e.g.
+    mplayer -quiet http://... > mplayer.txt 2>&1
+    vlc -Irc -vv http://... > vlc.txt 2>&1
+The player is detected from the file name (mpv, mplayer
+or vlc). When no files are given, the built in sample
+captures are used.
+'''
+import os
+import sys
+import argparse
+from timeit import repeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pyradio.player import PlayerOutputClassifier, MpvPlayer, MpPlayer, VlcPlayer
+
+''' the tokens of the player classes, as passed to
+    PlayerOutputClassifier by Player._get_output_classifier '''
+TOKENS = {
+    x.PLAYER_NAME: (
+        x.volume_string,
+        x._playback_token_tuple,
+        x.icy_tokens,
+        x.icy_audio_tokens
+    ) for x in (MpvPlayer, MpPlayer, VlcPlayer)
+}
+
+SAMPLES = {
+    'mpv': [
+        ' (+) Audio --aid=1 (mp3 2ch 44100Hz)',
+        'AO: [pulse] 44100Hz stereo 2ch float',
+        'File tags:',
+        ' icy-title: Artist - Song',
+        'A: 00:00:01 / 00:00:00 Cache: 9.8s/164KB',
+        'A: 00:00:02 / 00:00:00 Cache: 9.9s/166KB',
+        'A: 00:00:03 / 00:00:00 Cache: 9.7s/163KB',
+        'Volume: 55 %',
+    ],
+    'mplayer': [
+        'Playing http://example.com/stream.',
+        'Name   : Example Radio',
+        'Genre  : Jazz',
+        'Website: http://example.com/',
+        'Bitrate: 128kbit/s',
+        'Cache size set to 320 KBytes',
+        'Opening audio decoder: [mpg123] MPEG 1.0/2.0/2.5 layers I, II, III',
+        'AO: [pulse] 44100Hz 2ch floatle (4 bytes per sample)',
+        "ICY Info: StreamTitle='Artist - Song';StreamUrl='';",
+        'A:   1.2 (01.1) of 0.0 (unknown)  0.4% 48%',
+        'A:   1.3 (01.2) of 0.0 (unknown)  0.4% 48%',
+        'A:   1.4 (01.3) of 0.0 (unknown)  0.4% 47%',
+        'A:   1.5 (01.4) of 0.0 (unknown)  0.4% 47%',
+        'Volume: 50 %',
+    ],
+    'vlc': [
+        '[00007f] http stream debug: protocol HTTP/1.1 answer code 200',
+        '[00007f] http stream debug: Icy-Name: Example Radio',
+        '[00007f] http stream debug: icy-br: 128',
+        '[00007f] main decoder debug: using audio decoder module "mpg123"',
+        '[00007f] main audio output debug: output format: f32l',
+        '[00007f] main input debug: Buffering 100%',
+        '[00007f] main input debug: Stream buffering done (1000 ms in 12 ms)',
+        '[00007f] http stream debug: New Icy-Title=Artist - Song',
+        '[00007f] main audio output debug: ( audio volume: 256 )',
+        '[00007f] main input debug: Decoder wait done in 0 ms',
+        '[00007f] main audio output debug: inserting 1176 zeroes',
+    ],
+}
+
+
+def legacy_classify(a_line, volume_string, playback_tokens, icy_tokens, icy_audio_tokens):
+    ''' the substring chain of Player.updateStatus (0.9.3.11.31) '''
+    http_error = False
+    if '404' in a_line and 'Not Available' in a_line:
+        http_error = 404
+    elif 'Name or service not known' in a_line or \
+            "Couldn't resolve name for AF_INET:" in a_line:
+        http_error = 1005
+    elif 'cannot connect to ' in a_line:
+        http_error = 1006
+    elif 'Server returned 503' in a_line or \
+            '503 All backends failed or unhealthy' in a_line or \
+            'HTTP 503 error' in a_line:
+        http_error = 503
+    elif 'debug: dead input' in a_line or \
+            'Failed to open http' in a_line or \
+            'debug: nothing to play' in a_line:
+        http_error = 1001
+    elif 'No stream found' in a_line:
+        http_error = 1002
+    elif 'Cannot find codec for audio format' in a_line or \
+            'Audio: no sound' in a_line:
+        http_error = 1008
+    if http_error:
+        return (0, http_error, ())
+    if volume_string in a_line:
+        return (1, False, ())
+    for n in playback_tokens:
+        if n in a_line:
+            return (2, False, ())
+    for n in icy_tokens:
+        if n in a_line:
+            return (3, False, ())
+    found = tuple(n for n in icy_audio_tokens if n in a_line)
+    if found:
+        return (4, False, found)
+    return (0, False, ())
+
+
+def read_capture(a_file):
+    with open(a_file, 'rb') as f:
+        return [x.decode('utf-8', 'replace').strip() for x in f]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Player output classifier benchmark')
+    parser.add_argument('-n', '--loops', type=int, default=2000,
+                        help='times to replay each capture (default: 2000)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of timings; the fastest one counts (default: 5)')
+    parser.add_argument('captures', nargs='*',
+                        help='player stdout capture files')
+    args = parser.parse_args()
+
+    captures = {}
+    for a_file in args.captures:
+        name = os.path.basename(a_file).lower()
+        for a_player in ('mplayer', 'mpv', 'vlc'):
+            if a_player in name:
+                captures.setdefault(a_player, []).extend(read_capture(a_file))
+                break
+        else:
+            print(f'Cannot detect player of "{a_file}"; skipping...')
+    if not captures:
+        captures = SAMPLES
+
+    for a_player, lines in captures.items():
+        tokens = TOKENS[a_player]
+        classifier = PlayerOutputClassifier(*tokens)
+        for a_line in lines:
+            if tuple(classifier.classify(a_line)) != legacy_classify(a_line, *tokens):
+                print(f'{a_player}: result mismatch for "{a_line}"')
+        new = min(repeat(lambda: [classifier.classify(x) for x in lines],
+                         number=args.loops, repeat=args.repeat))
+        old = min(repeat(lambda: [legacy_classify(x, *tokens) for x in lines],
+                         number=args.loops, repeat=args.repeat))
+        total = len(lines) * args.loops
+        print('{0:8} {1:7} lines  legacy: {2:7.3f} us/line  classifier: {3:7.3f} us/line'.format(
+            a_player, total, 1e6 * old / total, 1e6 * new / total))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+'''
+Benchmark for reading big playlists
+
+Writes a playlist of N stations (100000 by default) to a
+temporary file and loads it with
+pyradio.common.CsvReadWrite and with the reader used up
+to 0.9.3.11.31, reporting the load time and the memory
+held per station.
+
+Usage (from the repository directory):
+
+    python devel/bench_playlist_read.py [-n STATIONS] [playlist.csv]
+
+When a playlist is given, it is used instead of the
+generated one.
+'''
+import os
+import sys
+import csv
+import argparse
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pyradio.common import CsvReadWrite, Station
+
+
+def legacy_read(a_file):
+    ''' CsvReadWrite._read_csv of 0.9.3.11.31 '''
+    items = []
+    with open(a_file, 'r', encoding='utf-8') as cfgfile:
+        for row in csv.reader(filter(lambda row: row[0] != '#', cfgfile), skipinitialspace=True):
+            if not row:
+                continue
+            name = url = enc = icon = volume = http = referer = profile = buffering = player = ''
+            row_length = len(row)
+            name = row[0].strip()
+            url = row[1].strip()
+            if row_length > Station.encoding:
+                enc = row[Station.encoding].strip()
+            if row_length > Station.icon:
+                icon = row[Station.icon].strip()
+            if row_length > Station.profile:
+                profile = row[Station.profile].strip()
+            if row_length > Station.buffering:
+                buffering = row[Station.buffering].strip()
+            if row_length > Station.volume:
+                volume = row[Station.volume].strip()
+            if row_length > Station.http:
+                http = row[Station.http].strip()
+            if row_length > Station.referer:
+                referer = row[Station.referer].strip()
+            if row_length > Station.player:
+                player = row[Station.player].strip()
+            if buffering:
+                if '@' not in buffering:
+                    buffering += '@128'
+            else:
+                buffering = '0@128'
+            items.append([
+                name, url, enc, icon if icon else '',
+                profile, buffering, http, volume, referer, player
+            ])
+    ''' read_playlist_file copied the list once more '''
+    return list(items)
+
+
+def write_playlist(a_file, count):
+    with open(a_file, 'w', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['# PyRadio Playlist File Format:'])
+        for i in range(count):
+            if i % 500 == 0:
+                writer.writerow([f'Group {i // 500}', '-'])
+            row = [f'Station {i} - Some Radio', f'http://stream{i}.example.com:8000/live.mp3']
+            if i % 3 == 0:
+                row += ['', f'https://example.com/logos/{i}.png', '', '20', 'False', '', '', 'mpv']
+            elif i % 3 == 1:
+                row += ['utf-8']
+            writer.writerow(row)
+
+
+def measure(func):
+    ''' return (load time, memory held by the result) '''
+    start = perf_counter()
+    items = func()
+    elapsed = perf_counter() - start
+    del items
+    tracemalloc.start()
+    items = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(items), elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Playlist reading benchmark')
+    parser.add_argument('-n', '--stations', type=int, default=100000,
+                        help='number of stations to generate (default: 100000)')
+    parser.add_argument('playlist', nargs='?',
+                        help='a playlist to read instead of the generated one')
+    args = parser.parse_args()
+
+    a_file = args.playlist
+    tmp_dir = None
+    if a_file is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        a_file = os.path.join(tmp_dir.name, 'bench.csv')
+        write_playlist(a_file, args.stations)
+
+    try:
+        _, old_time, old_size = measure(lambda: legacy_read(a_file))
+        reader = CsvReadWrite(a_file)
+        count, new_time, new_size = measure(lambda: list(reader.iter_read()))
+        print(f'{count} stations, playlist version {reader.version}')
+        print('legacy:       {0:7.3f} sec  {1:6.1f} bytes/station'.format(old_time, old_size / count))
+        print('CsvReadWrite: {0:7.3f} sec  {1:6.1f} bytes/station'.format(new_time, new_size / count))
+    finally:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+'''
+Import time regression check
+
+Imports the command line entry point (pyradio.main) in a
+fresh interpreter with "python -X importtime" and fails
+(exit status 1) if
+
+  * the import takes longer than the budget (the best of
+    a few runs is used, to filter out a busy system), or
+
+  * any of the modules that are supposed to be imported
+    on first use (Radio Browser, the fuzzy finder, m3u,
+    the TUI itself, etc.) is imported.
+
+Usage (from the repository directory):
+
+    python devel/check_import_time.py [-m MODULE] [-b MS] [-n RUNS] [-t TOP]
+
+MODULE is the module to import (default: pyradio.main),
+MS the budget in milliseconds (default: 60) and TOP the
+number of slowest imports to list (default: 10).
+'''
+import os
+import sys
+import argparse
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+''' modules the entry point must not import '''
+LAZY_MODULES = (
+    'pyradio.radio',
+    'pyradio.browser',
+    'pyradio.m3u',
+    'pyradio.client',
+    'pyradio.logos',
+    'pyradio.validate_playlist',
+    'requests',
+    'dns.resolver',
+    'rapidfuzz',
+    'charset_normalizer',
+    'dateutil.rrule',
+    'dateutil.parser',
+    'win32com.client',
+)
+
+
+def import_times(module):
+    ''' Import module in a new interpreter; return
+        {module name: (self us, cumulative us)} '''
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    ''' "python -c" looks for modules in the current directory first '''
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        cwd=REPO_DIR, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        sys.exit(f'Error importing {module}:\n{proc.stderr}')
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+        except (IndexError, ValueError):
+            ''' the header line '''
+            pass
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time regression check')
+    parser.add_argument('-m', '--module', default='pyradio.main',
+                        help='module to import (default: pyradio.main)')
+    parser.add_argument('-b', '--budget', type=float, default=60,
+                        help='import time budget in ms (default: 60)')
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help='number of imports; the fastest one counts (default: 5)')
+    parser.add_argument('-t', '--top', type=int, default=10,
+                        help='number of slowest imports to list (default: 10)')
+    args = parser.parse_args()
+
+    ''' the first run also compiles the byte code '''
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(max(args.runs, 1))]
+    best = min(runs, key=lambda x: x[args.module][1])
+    total = best[args.module][1] / 1000
+
+    failed = False
+    eager = [x for x in LAZY_MODULES if x in best]
+    if eager:
+        failed = True
+        print(f'{args.module} imports modules that should be imported on first use:')
+        for name in eager:
+            print(f'    {name:30} {best[name][1] / 1000:8.2f} ms')
+
+    print('\nSlowest imports (cumulative):')
+    for name, (_, cumulative) in sorted(
+            best.items(), key=lambda x: -x[1][1])[1:args.top + 1]:
+        print(f'    {name:30} {cumulative / 1000:8.2f} ms')
+
+    print(f'\n{args.module}: {total:.2f} ms (budget: {args.budget:.2f} ms)')
+    if total > args.budget:
+        failed = True
+        print('Import time budget exceeded!')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
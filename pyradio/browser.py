@@ -7,9 +7,12 @@ except ImportError:
     pass
 from copy import deepcopy
 from shutil import copyfile
-import random
 import json
-from os import path, remove
+import hashlib
+from os import path, remove, replace, makedirs, listdir
+from time import time, perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 import collections
 from operator import itemgetter
 try:
@@ -398,6 +401,7 @@ class RadioBrowser(PyRadioStationsBrowser):
         self._search_return_function = search_return_function
         self._cannot_delete_function = cannot_delete_function
         self._page = 0
+        self._cache = RadioBrowserCache(path.join(self._cnf.cache_dir, 'radio-browser'))
 
     def reset_dirty_config(self):
         self.browser_config.dirty = False
@@ -406,7 +410,8 @@ class RadioBrowser(PyRadioStationsBrowser):
         return self.browser_config.dirty if self.browser_config else False
 
     def initialize(self):
-        self._dns_info = RadioBrowserDns()
+        self._dns_info = RadioBrowserDns(path.join(self._cnf.state_dir, 'radio-browser-servers.json'))
+        self._cache.prune()
 
         return self.read_config()
 
@@ -718,12 +723,31 @@ class RadioBrowser(PyRadioStationsBrowser):
         ''' keep server results here '''
         new_raw_stations = []
 
-        try:
-            r = self._session.get(url=url, headers=self._headers, params=post_data, timeout=(self._search_timeout, 2 * self._search_timeout))
-            self._log_response(r)
-            r.raise_for_status()
+        ''' a cached response is used at once; if it has
+            expired, it is refreshed in the background, so
+            that the next visit to this page gets fresh data
+        '''
+        timeout = (self._search_timeout, 2 * self._search_timeout)
+        text = cache_key = None
+        if self._cache.enabled:
+            cache_key = self._cache.key(url, post_data)
+            text, fresh = self._cache.get(cache_key)
+            if text is not None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('RadioBrowser: using {} cached response'.format('fresh' if fresh else 'expired'))
+                if not fresh:
+                    self._cache.refresh(cache_key, url, post_data, self._headers, timeout)
 
-            new_raw_stations = self._extract_data(json.loads(r.text))
+        try:
+            if text is None:
+                r = self._search_request(url, post_data, timeout)
+                self._log_response(r)
+                r.raise_for_status()
+                new_raw_stations = self._extract_data(json.loads(r.text))
+                if cache_key is not None:
+                    self._cache.put(cache_key, r.text)
+            else:
+                new_raw_stations = self._extract_data(json.loads(text))
             # logger.error('DE new_raw_stations\n\n{}'.format(new_raw_stations))
             ret = True, len(new_raw_stations), go_back_in_history
         except requests.exceptions.RequestException as e:
@@ -739,6 +763,28 @@ class RadioBrowser(PyRadioStationsBrowser):
         if self._search_return_function:
             self._search_return_function(ret)
 
+    def _search_request(self, url, post_data, timeout):
+        ''' Execute a search query
+
+            If the server does not respond, switch to the
+            next best one and execute the query once more
+        '''
+        try:
+            r = self._session.get(url=url, headers=self._headers, params=post_data, timeout=timeout)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            server = self._dns_info.fail_over(self._server) if self._dns_info else None
+            if server is None:
+                raise
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f'RadioBrowser: server {self._server} failed ({e}); switching to {server}')
+            self._server = server
+            self._get_title()
+            url = self._format_url(self._search_history[self._search_history_index])
+            r = self._session.get(url=url, headers=self._headers, params=post_data, timeout=timeout)
+        if self._dns_info:
+            self._dns_info.report(self._server, True)
+        return r
+
     def next_page(self, msg_function=None):
         self._page += 1
         # post_data = self._get_post_data()
@@ -1448,6 +1494,7 @@ class RadioBrowser(PyRadioStationsBrowser):
         self._default_server = self.browser_config.server
         self._default_ping_count = self.browser_config.ping_count
         self._default_ping_timeout = self.browser_config.ping_timeout
+        self._cache.ttl = self.browser_config.cache_ttl
         self._calculate_do_ping()
         self._server = None
         if self._default_server:
@@ -1579,6 +1626,110 @@ class RadioBrowser(PyRadioStationsBrowser):
         self.keyboard_handler = self._config_win
         self._config_win.show(parent=parent)
 
+class RadioBrowserCache():
+    ''' On-disk cache of RadioBrowser search responses
+
+        The raw JSON of each response is saved in cache_dir,
+        in a file named after the hash of the query (the url
+        path, without the server, and the query parameters),
+        so that the same query to any server hits the same
+        entry.
+
+        Parameters:
+            cache_dir : string
+            ttl       : int (seconds a response is considered
+                        fresh; 0 disables the cache)
+    '''
+
+    ''' expired responses older than this are removed '''
+    MAX_AGE = 7 * 24 * 3600
+
+    def __init__(self, cache_dir, ttl=600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.ttl > 0
+
+    @staticmethod
+    def key(url, post_data):
+        parts = urlsplit(url)
+        query = json.dumps([parts.path, parts.query, post_data], sort_keys=True, default=str)
+        return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+    def _file(self, key):
+        return path.join(self.cache_dir, key + '.json')
+
+    def get(self, key):
+        ''' Returns (text, fresh)
+            text is None if the response is not in the cache
+        '''
+        a_file = self._file(key)
+        try:
+            age = time() - path.getmtime(a_file)
+            with open(a_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None, False
+        return text, age < self.ttl
+
+    def put(self, key, text):
+        a_file = self._file(key)
+        tmp_file = a_file + '.tmp'
+        try:
+            makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            replace(tmp_file, a_file)
+        except OSError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f'RadioBrowser: cannot write cache file "{a_file}": {e}')
+
+    def prune(self):
+        ''' remove responses older than MAX_AGE '''
+        try:
+            files = listdir(self.cache_dir)
+        except OSError:
+            return
+        now = time()
+        for n in files:
+            a_file = path.join(self.cache_dir, n)
+            try:
+                if now - path.getmtime(a_file) > self.MAX_AGE:
+                    remove(a_file)
+            except OSError:
+                pass
+
+    def refresh(self, key, url, post_data, headers, timeout):
+        ''' fetch an expired response in a background thread '''
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key, url, dict(post_data), dict(headers), timeout),
+            daemon=True
+        ).start()
+
+    def _refresh(self, key, url, post_data, headers, timeout):
+        try:
+            r = requests.get(url=url, headers=headers, params=post_data, timeout=timeout)
+            r.raise_for_status()
+            json.loads(r.text)
+            self.put(key, r.text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'RadioBrowser: refreshed cached response for "{url}"')
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f'RadioBrowser: cannot refresh cached response: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
 class RadioBrowserConfig():
     ''' RadioBrowser config calss
 
@@ -1588,6 +1739,7 @@ class RadioBrowserConfig():
             default      : int (id on terms)
             ping_timeout : int (ping timeout is seconds)
             ping_count   : int (number of ping packages)
+            cache_ttl    : int (seconds a cached response is fresh)
             terms        : list of dicts (the actual search paremeters)
     '''
 
@@ -1600,6 +1752,7 @@ class RadioBrowserConfig():
         self.dirty = False
         self.ping_count = 1
         self.ping_timeout = 1
+        self.cache_ttl = 600
         self.config_file = path.join(stations_dir, 'radio-browser.conf')
         self.search_terms_file = path.join(data_dir, 'radio-browser-search-terms')
 
@@ -1620,6 +1773,7 @@ class RadioBrowserConfig():
         self.limit = 100
         self.ping_count = 1
         self.ping_timeout = 1
+        self.cache_ttl = 600
         lines = []
         term_str = []
         try:
@@ -1664,6 +1818,11 @@ class RadioBrowserConfig():
                         self.ping_timeout = int(value)
                     except (IndexError, ValueError):
                         self.ping_timeout = 1
+                elif key == 'CACHE_TTL':
+                    try:
+                        self.cache_ttl = int(value)
+                    except (IndexError, ValueError):
+                        self.cache_ttl = 600
 
         if path.exists(self.search_terms_file):
             try:
@@ -1767,6 +1926,17 @@ PING_COUNT = '''
 PING_TIMEOUT = '''
 
         txt += str(default_ping_timeout)
+
+        txt += '''
+
+# Search results cache
+# Number of seconds a cached search result is considered
+# fresh. Expired results are displayed at once and updated
+# in the background. Set to 0 to disable the cache.
+# Default value: 600
+CACHE_TTL = '''
+
+        txt += str(self.cache_ttl)
         try:
             with open(self.config_file, 'w', encoding='utf-8') as cfgfile:
                 cfgfile.write(txt)
@@ -3662,9 +3832,18 @@ class RadioBrowserData():
 
         parameters are:
             tags, countries(and states), codecs, languages
+
+        If snapshot_file is given, the data is saved in it
+        and loaded from it at once when start() is called;
+        the server is then asked only for what has changed
+        (using the ETag and Last-Modified headers it sent).
     '''
 
-    def __init__(self, url, pyradio_info, timeout=3):
+    SNAPSHOT_VERSION = 1
+
+    _endpoints = ('tags', 'codecs', 'languages', 'countrycodes', 'states')
+
+    def __init__(self, url, pyradio_info, timeout=3, snapshot_file=None):
         self._data = {}
         self._connection_error = False
         self._lock = threading.Lock()
@@ -3675,9 +3854,13 @@ class RadioBrowserData():
         self._url = url
         self._timeout = timeout
         self._pyradio_info = pyradio_info
+        self._snapshot_file = snapshot_file
+        self._snapshot = {}
 
     def start(self, force_update=False):
         ''' Start data acquisition thread '''
+        if not self._data:
+            self._load_snapshot()
         self.data_thread = threading.Thread(
             target=self._get_all_data_thread,
             args=(
@@ -3771,89 +3954,171 @@ class RadioBrowserData():
 
     def _update_data(self, data, connection_error):
         self._connection_error = connection_error
-        self._data = data
+        if data:
+            self._data = data
+
+    def _load_snapshot(self):
+        ''' read the snapshot saved by a previous session '''
+        if not self._snapshot_file:
+            return
+        try:
+            with open(self._snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        try:
+            if snapshot['version'] != self.SNAPSHOT_VERSION:
+                return
+            endpoints = {n: snapshot['endpoints'][n] for n in self._endpoints}
+            data = self._compose_data({k: v['data'] for k, v in endpoints.items()})
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return
+        self._snapshot = endpoints
+        with self._lock:
+            self._data = data
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'RadioBrowser: data loaded from "{self._snapshot_file}"')
+
+    def _save_snapshot(self, endpoints):
+        if not self._snapshot_file:
+            return
+        tmp_file = self._snapshot_file + '.tmp'
+        try:
+            makedirs(path.dirname(self._snapshot_file), exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'version': self.SNAPSHOT_VERSION, 'endpoints': endpoints},
+                    f, separators=(',', ':')
+                )
+            replace(tmp_file, self._snapshot_file)
+        except OSError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f'RadioBrowser: cannot save data snapshot: {e}')
+
+    @staticmethod
+    def _compact(endpoint, json_data):
+        ''' keep only what we need from a server response '''
+        if endpoint == 'states':
+            return [[n['country'], n['name'], n['stationcount']] for n in json_data]
+        return {n['name']: n['stationcount'] for n in json_data}
+
+    @staticmethod
+    def _compose_data(endpoints):
+        from .countries import countries
+        my_countries = {}
+        for code, count in endpoints['countrycodes'].items():
+            if code in countries:
+                my_countries[countries[code]] = {
+                    'code': code,
+                    'stationcount': count,
+                    'states': {}
+                }
+        for country, name, count in endpoints['states']:
+            if country in my_countries:
+                my_countries[country]['states'][name] = count
+        return {
+            'tags': endpoints['tags'],
+            'countries': my_countries,
+            'codecs': endpoints['codecs'],
+            'languages': endpoints['languages']
+        }
 
     def _get_all_data_thread(self, lock, force_update, stop, callback): # noqa
+        ''' Fetch all endpoints concurrently over one session
+
+            An endpoint the server reports as not modified
+            (HTTP 304) is taken from the snapshot.
+        '''
 
-        def get_data(data):
-            ret = {}
-            json_data = []
-            connection_error, json_data = get_data_dict(data)
-            if connection_error:
-                return True, {}
-            if json_data:
-                for a_tag in json_data:
-                    ret[a_tag['name']] = a_tag['stationcount']
-                return False, ret
-
-        def get_countries(stop):
-            ret = {}
-            connection_error, json_countrycodes = get_data_dict('countrycodes')
-            if connection_error:
-                return True, {}
-            from .countries import countries
-            st = 'stationcount'
-            for n in json_countrycodes:
-                if n['name'] in countries:
-                    ret[countries[n['name']]] = {}
-                    ret[countries[n['name']]]['code'] = n['name']
-                    ret[countries[n['name']]]['stationcount'] = n[st]
-                    ret[countries[n['name']]]['states'] = {}
-            connection_error, json_states = get_data_dict('states')
-            if connection_error:
-                return True, {}
-            for n in json_states:
-                if n['country'] in ret:
-                    ret[n['country']]['states'][n['name']] = n['stationcount']
-            return False, ret
-
-        def get_data_dict(data):
-            url = 'http://' + self._url + '/json/' + data
-            jdata = {'hidebroken': 'true'}
-            headers = {'user-agent': 'PyRadio/dev',
-                       'encoding': 'application/json'}
-            if self._pyradio_info:
-                headers['user-agent'] = self._pyradio_info.replace(' ', '/')
+        def get_endpoint(endpoint):
+            ''' Returns (endpoint data, validators)
+                endpoint data is None on error '''
+            url = 'http://' + self._url + '/json/' + endpoint
+            a_headers = dict(headers)
+            old = self._snapshot.get(endpoint)
+            if old and not force_update:
+                if old.get('etag'):
+                    a_headers['If-None-Match'] = old['etag']
+                if old.get('last-modified'):
+                    a_headers['If-Modified-Since'] = old['last-modified']
             try:
-                r = requests.get(url, headers=headers, json=jdata, timeout=self._timeout)
+                r = session.get(url, headers=a_headers, json=jdata, timeout=self._timeout)
+                if r.status_code == 304 and old:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f'RadioBrowser: "{endpoint}" not modified')
+                    return old
                 r.raise_for_status()
-                return False, json.loads(r.text)
-                # if r.status_code == 200:
-                #     return False, json.loads(r.text)
-                # else:
-                #     return True, []
-            except requests.exceptions.RequestException as e:
-                if logger.isEnabledFor(logger.ERROR):
-                    logger.error(e)
-                return True, []
+                return {
+                    'etag': r.headers.get('ETag', ''),
+                    'last-modified': r.headers.get('Last-Modified', ''),
+                    'data': self._compact(endpoint, json.loads(r.text))
+                }
+            except (requests.exceptions.RequestException, ValueError, KeyError, TypeError) as e:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f'RadioBrowser: cannot get "{endpoint}": {e}')
+                return None
+
+        jdata = {'hidebroken': 'true'}
+        headers = {'user-agent': 'PyRadio/dev',
+                   'encoding': 'application/json'}
+        if self._pyradio_info:
+            headers['user-agent'] = self._pyradio_info.replace(' ', '/')
+
+        with requests.Session() as session:
+            with ThreadPoolExecutor(max_workers=len(self._endpoints)) as executor:
+                results = dict(zip(
+                    self._endpoints,
+                    executor.map(get_endpoint, self._endpoints)
+                ))
+
+        if stop():
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Asked to stop after getting data...')
+            self._terminated = True
+            return
 
+        connection_error = None in results.values()
         my_data = {}
-        data_items = ['tags', 'countries', 'codecs', 'languages']
-        for an_item in data_items:
-            if an_item == 'countries':
-                ret, my_data['countries'] = get_countries(stop)
-            else:
-                ret, my_data[an_item] = get_data(an_item)
-            if stop():
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.info(f'Asked to stop after working on "{an_item}"...')
-                self._terminated = True
-                return
-        lock.acquire()
-        callback(my_data, ret)
-        lock.release()
+        if not connection_error:
+            my_data = self._compose_data(
+                {k: v['data'] for k, v in results.items()}
+            )
+            if results != self._snapshot:
+                self._snapshot = results
+                self._save_snapshot(results)
+        with lock:
+            callback(my_data, connection_error)
 
 
 class RadioBrowserDns():
     ''' Preforms query the DNS SRV record of
         _api._tcp.radio-browser.info which
         gives the list of server names directly
-        without reverse dns lookups '''
+        without reverse dns lookups
+
+        Servers are ranked by the response time of a
+        /json/stats request (all of them are probed
+        at the same time) and their error rate. The
+        ranking is saved in state_file and reused for
+        RANKING_TTL seconds.
+    '''
+
+    PROBE_TIMEOUT = 2
+    RANKING_TTL = 3600
+
+    ''' request and error counters are halved when
+        requests reach this number, so that old errors
+        are gradually forgotten '''
+    MAX_REQUESTS = 20
 
-    def __init__(self):
+    def __init__(self, state_file=None):
         self._urls = None
         self._countries = None
         self._names_and_urls = None
+        self._state_file = state_file
+        self._health = {}
+        self._lock = threading.Lock()
+        self._read_health()
 
     @property
     def connected(self):
@@ -3907,6 +4172,9 @@ class RadioBrowserDns():
         if result:
             for n in result:
                 self._urls.append(str(n).split(' ')[-1][:-1])
+        elif self._health:
+            ''' DNS failed; use the servers we already know '''
+            self._urls = list(self._health)
         else:
             self._urls = None
 
@@ -3916,33 +4184,141 @@ class RadioBrowserDns():
             self._countries.append(country_from_server(n))
         logger.error(f'DE countries = {self._countries}')
 
+    def _read_health(self):
+        if not self._state_file:
+            return
+        try:
+            with open(self._state_file, 'r', encoding='utf-8') as f:
+                health = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(health, dict):
+            self._health = {
+                k: v for k, v in health.items()
+                if isinstance(v, dict) and
+                {'rtt', 'requests', 'errors', 'checked'} <= v.keys()
+            }
+
+    def _save_health(self):
+        if not self._state_file:
+            return
+        tmp_file = self._state_file + '.tmp'
+        with self._lock:
+            health = json.dumps(self._health, indent=2)
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(health)
+            replace(tmp_file, self._state_file)
+        except OSError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f'RadioBrowser: cannot save servers ranking: {e}')
+
+    def _update_health(self, server, ok, rtt=None):
+        with self._lock:
+            h = self._health.setdefault(
+                server,
+                {'rtt': None, 'requests': 0, 'errors': 0, 'checked': 0}
+            )
+            h['requests'] += 1
+            if not ok:
+                h['errors'] += 1
+            if h['requests'] >= self.MAX_REQUESTS:
+                h['requests'] //= 2
+                h['errors'] //= 2
+            if rtt is not None or not ok:
+                h['rtt'] = rtt
+                h['checked'] = time()
+
+    def _probe(self, server):
+        ''' Returns the response time of a /json/stats
+            request, or None if the server failed '''
+        start = perf_counter()
+        try:
+            r = requests.get(
+                url='http://' + server + '/json/stats',
+                headers=RadioBrowser._headers,
+                timeout=self.PROBE_TIMEOUT
+            )
+            r.raise_for_status()
+        except requests.exceptions.RequestException:
+            return None
+        return perf_counter() - start
+
+    def _score(self, server):
+        h = self._health.get(server)
+        if h is None or h['rtt'] is None:
+            return None
+        return h['rtt'] * (1 + 4 * h['errors'] / max(h['requests'], 1))
+
+    def ranked_servers(self):
+        ''' Returns the responsive servers, fastest first '''
+        if self._urls is None:
+            self._get_urls()
+        if not self._urls:
+            return []
+        with self._lock:
+            scores = [(self._score(n), n) for n in self._urls]
+        return [n for s, n in sorted(x for x in scores if x[0] is not None)]
+
+    def rank_servers(self):
+        ''' Probe all servers concurrently and rank them '''
+        if self._urls is None:
+            self._get_urls()
+        if not self._urls:
+            return []
+        with ThreadPoolExecutor(max_workers=len(self._urls)) as executor:
+            rtts = list(executor.map(self._probe, self._urls))
+        for server, rtt in zip(self._urls, rtts):
+            self._update_health(server, rtt is not None, rtt)
+            if logger.isEnabledFor(logging.INFO):
+                if rtt is None:
+                    logger.info(f'RadioBrowser: server {server} is not responding')
+                else:
+                    logger.info(f'RadioBrowser: server {server} responded in {rtt:.3f} sec')
+        self._save_health()
+        return self.ranked_servers()
+
+    def _ranking_is_current(self):
+        now = time()
+        with self._lock:
+            return all(
+                n in self._health and
+                now - self._health[n]['checked'] < self.RANKING_TTL
+                for n in self._urls
+            )
+
     def give_me_a_server_url(self):
-        ''' Returns a random server '''
+        ''' Returns the fastest server
+
+            The saved ranking is used if it is recent
+            enough; otherwise all servers are probed.
+        '''
         if self._urls is None:
             self._get_urls()
 
         if self._urls:
-            ping_response = [-2] * len(self._urls)
-            start_num = num = random.randint(0, len(self._urls) - 1)
-            while ping_response[num] == -2:
-                if logger.isEnabledFor(logging.INFO):
-                    logger.info('pinging random server: ' + self._urls[num])
-                ping_response[num] = ping(self._urls[num], count=1, timeout_in_seconds=1)
-                if ping_response[num] == 1:
-                    ''' ping was ok '''
-                    if logger.isEnabledFor(logging.INFO):
-                        logger.info('ping was successful!')
-                    break
-                if logger.isEnabledFor(logging.INFO):
-                    logger.info('ping was unsuccessful!')
-                num += 1
-                if num == len(self._urls):
-                    num = 0
-                if num == start_num:
-                    return None
-            return self._urls[num]
+            ranking = self.ranked_servers() if self._ranking_is_current() else []
+            if not ranking:
+                ranking = self.rank_servers()
+            if ranking:
+                return ranking[0]
         return None
 
+    def report(self, server, ok):
+        ''' Record the outcome of a request to a server '''
+        self._update_health(server, ok)
+        if not ok:
+            self._save_health()
+
+    def fail_over(self, server):
+        ''' Record a failed request to server and return
+            the next best server (None if there is none) '''
+        self.report(server, False)
+        ranking = [n for n in self.ranked_servers() if n != server]
+        if not ranking:
+            ranking = [n for n in self.rank_servers() if n != server]
+        return ranking[0] if ranking else None
+
     def servers(self):
         ''' server urls as generator '''
         if self._urls is None:
@@ -28,6 +28,9 @@ __version__ = '2.2'
 
 import textwrap
 import unicodedata
+import functools
+from bisect import bisect_right
+from itertools import accumulate
 
 import locale
 locale.setlocale(locale.LC_ALL, "")
@@ -35,6 +38,38 @@ locale.setlocale(locale.LC_ALL, "")
 text_type = str
 
 
+class _CharWidths(dict):
+    """Memoized display width (1 or 2) of single characters."""
+    def __missing__(self, char):
+        width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
+        self[char] = width
+        return width
+
+_char_widths = _CharWidths()
+
+
+def _first_wide_char():
+    """Return the first codepoint that is Fullwidth or Wide."""
+    cp = 0
+    while _char_widths[chr(cp)] == 1:
+        cp += 1
+    return chr(cp)
+
+# Strings whose every character is below this one
+# (ASCII and most Latin scripts) are as wide as they are long
+_NARROW_BELOW = _first_wide_char()
+
+
+@functools.lru_cache(maxsize=1024)
+def _prefix_widths(text):
+    """_prefix_widths(unicode) -> tuple
+
+    Return the widths of all the prefixes of a text containing
+    wide characters: item i is the width of text[:i+1].
+    """
+    return tuple(accumulate(map(_char_widths.__getitem__, text)))
+
+
 def is_wide(char):
     """is_wide(unicode_char) -> boolean
 
@@ -42,7 +77,8 @@ def is_wide(char):
     Fullwidth and Wide CJK chars are double-width.
     """
     try:
-        return unicodedata.east_asian_width(char) in ('F', 'W')
+        return _char_widths[char] == 2 if len(char) == 1 else \
+            unicodedata.east_asian_width(char) in ('F', 'W')
     except TypeError:
         return False
 
@@ -53,7 +89,9 @@ def cjklen(text):
     """
     if not isinstance(text, text_type):
         return len(text)
-    return sum(2 if is_wide(char) else 1 for char in text)
+    if not text or max(text) < _NARROW_BELOW:
+        return len(text)
+    return _prefix_widths(text)[-1]
 
 
 def cjkslices(text, index):
@@ -63,13 +101,17 @@ def cjkslices(text, index):
     """
     if not isinstance(text, text_type):
         return text[:index], text[index:]
-    if cjklen(text) <= index:
-        return text, u''
-    i = 1
-    # <= and i-1 to catch the last double length char of odd line
-    while cjklen(text[:i]) <= index:
-        i = i + 1
-    return text[:i-1], text[i-1:]
+    if not text or max(text) < _NARROW_BELOW:
+        if len(text) <= index:
+            return text, u''
+        i = max(index, 0)
+    else:
+        widths = _prefix_widths(text)
+        if widths[-1] <= index:
+            return text, u''
+        # the longest prefix that fits in index
+        i = bisect_right(widths, index)
+    return text[:i], text[i:]
 
 def cjkljust(text, width, char=None):
     if char is None:
@@ -3,14 +3,20 @@ import logging
 import locale
 import io
 import csv
+import re
 import curses
 import hashlib
-from os import rename, remove, access, X_OK, getenv, makedirs
+import json
+from bisect import bisect_right
+from itertools import filterfalse
+from operator import methodcaller
+from os import rename, replace, remove, access, X_OK, getenv, makedirs
 from os.path import exists, dirname, join, expanduser, basename
 from shutil import which, move, Error as shutil_Error
 from enum import IntEnum
 from sys import platform
 from pathlib import Path
+from time import time
 from rich import print
 try:
     # Python ≥ 3.9
@@ -827,6 +833,25 @@ def install_dbus_next_or_fast(the_module, dbus_next_file):
 class CsvReadWrite():
     ''' A base class to read and write a PyRadio playlist '''
 
+    ''' playlist version implied by the number of columns of a row '''
+    _row_version = (
+        Station.url, Station.url, Station.url,
+        Station.encoding, Station.icon, Station.profile,
+        Station.buffering, Station.http, Station.http,
+        Station.referer, Station.player
+    )
+
+    _empty_row = ('', ) * (Station.player + 1)
+
+    ''' columns whose values are shared between stations,
+        by number of columns of a row '''
+    _shared_fields = tuple(
+        tuple(x for x in (
+            Station.encoding, Station.profile, Station.http,
+            Station.volume, Station.referer, Station.player
+        ) if x < n) for n in range(Station.player + 2)
+    )
+
     def __init__(self, a_file=None, encoding_to_remove=None):
         self._items = None
         self._version = Station.url
@@ -890,104 +915,107 @@ class CsvReadWrite():
             Populates self._items and self._version
             Returns True or False (if error)
         '''
-        current_version = Station.url
-        # Use a_file if given, otherwise use self._file
-        in_file = a_file if a_file is not None else self._file
-
-        if in_file is None:
+        self._items = []
+        if a_file is None and self._file is None:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug('No file specified for reading')
             return False
-
-        # Path normalization
-        in_file = self._normalize_file_path(in_file)
-        self._items = []
-
         try:
-            # We handle Traversable differently from the others
-            if isinstance(in_file, Traversable):
-                # We open Traversable with its own open() method
-                with in_file.open(encoding='utf-8') as cfgfile:
-                    return self._read_csv(cfgfile, current_version)
-            # We open a file with the plain open()
-            with open(str(in_file), 'r', encoding='utf-8') as cfgfile:
-                return self._read_csv(cfgfile, current_version)
-
+            self._items = list(self.iter_read(a_file))
         except (FileNotFoundError, IOError, OSError) as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f'Cannot open playlist file: {e}')
             self._items = []
-            self._version = current_version
             return False
-
-    def _read_csv(self, file_handle, current_version):
-        """Internal function to read a CSV from a file handle."""
-        try:
-            for row in csv.reader(filter(lambda row: row[0] != '#', file_handle), skipinitialspace=True):
-                if not row:
-                    continue
-
-                # Initialize variables with default values
-                name = url = enc = icon = volume = http = referer = profile = buffering = player = ''
-                this_row_version = Station.url
-                # Assign values based on the length of the row
-                row_length = len(row)
-                name = row[0].strip()
-                url = row[1].strip()
-                if row_length > Station.encoding:
-                    enc = row[Station.encoding].strip()
-                    this_row_version = Station.encoding
-                if row_length > Station.icon:
-                    icon = row[Station.icon].strip()
-                    this_row_version = Station.icon
-                if row_length > Station.profile:
-                    profile = row[Station.profile].strip()
-                    this_row_version = Station.profile
-                if row_length > Station.buffering:
-                    buffering = row[Station.buffering].strip()
-                    this_row_version = Station.buffering
-                if row_length > Station.volume:
-                    volume = row[Station.volume].strip()
-                    this_row_version = Station.volume
-                if row_length > Station.http:
-                    http = row[Station.http].strip()
-                    this_row_version = Station.http
-                if row_length > Station.referer:
-                    referer = row[Station.referer].strip()
-                    this_row_version = Station.referer
-                if row_length > Station.player:
-                    player = row[Station.player].strip()
-                    this_row_version = Station.player
-
-                if buffering:
-                    if '@' not in buffering:
-                        buffering += '@128'
-                else:
-                    buffering = '0@128'
-
-                if self.encoding_to_remove is not None:
-                    if enc == self.encoding_to_remove:
-                        enc = ''
-
-                # Append the parsed values to the reading stations list
-                station_info = [
-                    name, url, enc, icon if icon else '',
-                    profile, buffering, http, volume, referer, player
-                ]
-                self._items.append(station_info)
-
-                # Update playlist version based on the presence of optional fields
-                current_version = max(this_row_version, current_version)
-                self._version = current_version
-
-            return True
-
         except (csv.Error, ValueError) as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f'Playlist is malformed: {e}')
             self._items = []
-            self._version = current_version
             return False
+        return True
+
+    def iter_read(self, a_file=None):
+        ''' Read a PyRadio playlist, one station at a time
+
+            Same as read(), but the stations are yielded
+            as they are read instead of being collected in
+            self._items; self._version is final when the
+            generator is exhausted.
+
+            Raises OSError, csv.Error and ValueError
+        '''
+        self._version = Station.url
+        # Use a_file if given, otherwise use self._file
+        in_file = a_file if a_file is not None else self._file
+
+        if in_file is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('No file specified for reading')
+            return
+
+        # Path normalization
+        in_file = self._normalize_file_path(in_file)
+        # We handle Traversable differently from the others
+        if isinstance(in_file, Traversable):
+            # We open Traversable with its own open() method
+            cfgfile = in_file.open(encoding='utf-8')
+        else:
+            # We open a file with the plain open()
+            cfgfile = open(str(in_file), 'r', encoding='utf-8')
+        with cfgfile:
+            yield from self._iter_csv(cfgfile)
+
+    def _iter_csv(self, file_handle):
+        ''' Yield the stations read from a file handle
+
+            Each station is a list of Station.player + 1
+            stripped strings. Values other than name, url
+            and icon are mostly the same across a playlist
+            (i.e. '', '0@128', 'False'), so a single copy of
+            each one is kept.
+        '''
+        shared = {}
+        share = shared.setdefault
+        strip = str.strip
+        empty = self._empty_row
+        row_version = self._row_version
+        shared_fields = self._shared_fields
+        encoding_to_remove = self.encoding_to_remove
+        version = self._version
+        for row in csv.reader(
+            filterfalse(methodcaller('startswith', '#'), file_handle),
+            skipinitialspace=True
+        ):
+            row_length = len(row)
+            if row_length < 2:
+                if row and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f'Skipping playlist row without URL: {row}')
+                continue
+            if row_length < Station.player + 1:
+                row.extend(empty[row_length:])
+            else:
+                del row[Station.player + 1:]
+                row_length = Station.player + 1
+            ''' going through a tuple gives a list without spare slots '''
+            station = list(tuple(map(strip, row)))
+            for n in shared_fields[row_length]:
+                if station[n]:
+                    station[n] = share(station[n], station[n])
+
+            buffering = station[Station.buffering]
+            if not buffering:
+                station[Station.buffering] = '0@128'
+            elif '@' not in buffering:
+                station[Station.buffering] = share(buffering + '@128', buffering + '@128')
+
+            if encoding_to_remove is not None and \
+                    station[Station.encoding] == encoding_to_remove:
+                station[Station.encoding] = ''
+
+            # Update playlist version based on the presence of optional fields
+            if row_version[row_length] > version:
+                version = self._version = row_version[row_length]
+            yield station
 
     def _format_playlist_row(self, a_row):
         ''' Return a formatted row (list)
@@ -1062,6 +1090,335 @@ class CsvReadWrite():
         return 0
 
 
+class _StationsIndexBlock():
+    ''' A run of consecutive rows of a StationsIndex '''
+
+    __slots__ = ('names', 'urls', '_texts', '_starts')
+
+    def __init__(self, names, urls):
+        self.names = names
+        self.urls = urls
+        self._texts = {}
+        self._starts = {}
+
+    def invalidate(self):
+        self._texts = {}
+        self._starts = {}
+
+    def text(self, field):
+        ''' Return the rows of field, each one followed by "\n",
+        and the offsets of the rows in it '''
+        if field not in self._texts:
+            rows = self.names if field == 'name' else self.urls
+            starts = []
+            pos = 0
+            for n in rows:
+                starts.append(pos)
+                pos += len(n) + 1
+            starts.append(pos)
+            self._texts[field] = '\n'.join(rows) + '\n'
+            self._starts[field] = starts
+        return self._texts[field], self._starts[field]
+
+
+class StationsIndex():
+    ''' Casefolded search index of a stations list
+
+    The "find next / previous" search used to lower() every
+    station name on each key press. The index keeps the
+    casefolded names and URLs in blocks of at most
+    BLOCK_SIZE rows, each one joined in a single string, so
+    that a search is one str.find() or re.search() per block.
+
+    Inserting, removing, moving or replacing a station only
+    touches the block it belongs to.
+
+    Parameters
+    ==========
+    items
+        a list of stations (lists) or of strings
+    generation
+        the value of PyRadioStations.playlist_generation
+        the index was built for (or -1)
+    '''
+
+    BLOCK_SIZE = 1024
+
+    ''' search modes '''
+    SUBSTRING = 0
+    WORD = 1
+    REGEX = 2
+
+    def __init__(self, items=None, generation=-1):
+        self.items = None
+        self.generation = generation
+        self._blocks = []
+        self._len = 0
+        self.rebuild([] if items is None else items, generation)
+
+    def __len__(self):
+        return self._len
+
+    def rebuild(self, items, generation=-1):
+        self._blocks = []
+        for i in range(0, len(items), self.BLOCK_SIZE):
+            names = []
+            urls = []
+            for n in items[i:i+self.BLOCK_SIZE]:
+                name, url = self._fields(n)
+                names.append(name)
+                urls.append(url)
+            self._blocks.append(_StationsIndexBlock(names, urls))
+        if not self._blocks:
+            self._blocks.append(_StationsIndexBlock([], []))
+        self._len = len(items)
+        self.bind(items, generation)
+
+    def bind(self, items, generation):
+        ''' Declare the index current for items at generation '''
+        self.items = items
+        self.generation = generation
+
+    def is_current(self, items, generation):
+        return self.items is items and \
+                self.generation == generation and \
+                self._len == len(items)
+
+    def is_group(self, row):
+        block, row = self._locate(row)
+        return block.urls[row] == '-'
+
+    def insert(self, row, item):
+        if row >= self._len:
+            block = self._blocks[-1]
+            row = len(block.names)
+        else:
+            block, row = self._locate(row)
+        name, url = self._fields(item)
+        block.names.insert(row, name)
+        block.urls.insert(row, url)
+        block.invalidate()
+        self._len += 1
+        if len(block.names) > 2 * self.BLOCK_SIZE:
+            x = self._blocks.index(block)
+            self._blocks[x:x+1] = [
+                _StationsIndexBlock(block.names[:self.BLOCK_SIZE], block.urls[:self.BLOCK_SIZE]),
+                _StationsIndexBlock(block.names[self.BLOCK_SIZE:], block.urls[self.BLOCK_SIZE:])
+            ]
+
+    def remove(self, row):
+        block, row = self._locate(row)
+        del block.names[row]
+        del block.urls[row]
+        block.invalidate()
+        self._len -= 1
+        if not block.names and len(self._blocks) > 1:
+            self._blocks.remove(block)
+
+    def replace(self, row, item):
+        block, row = self._locate(row)
+        block.names[row], block.urls[row] = self._fields(item)
+        block.invalidate()
+
+    def move(self, source, target, item):
+        ''' Same as list.insert(target, list.pop(source)) '''
+        self.remove(source)
+        self.insert(target, item)
+
+    def find(self, term, start=0, backwards=False, mode=SUBSTRING, field='name'):
+        ''' Return the index of the first row matching term,
+        starting at row start (inclusive) and wrapping around
+        the end (or the start, when searching backwards) of
+        the list. Return None if not found.
+
+        field is either "name" or "url".
+        '''
+        if not term or self._len == 0:
+            return None
+        matcher = self._get_matcher(term, mode)
+        if matcher is None:
+            return None
+        start = max(0, min(start, self._len - 1))
+        first, local = self._locate(start, as_index=True)
+        if backwards:
+            order = list(range(first, -1, -1)) + list(range(len(self._blocks) - 1, first - 1, -1))
+        else:
+            order = list(range(first, len(self._blocks))) + list(range(0, first + 1))
+        offsets = [0]
+        for x in self._blocks:
+            offsets.append(offsets[-1] + len(x.names))
+        for i, b in enumerate(order):
+            block = self._blocks[b]
+            if not block.names:
+                continue
+            if i == 0:
+                ''' the part of the starting block after (before) start '''
+                rng = (local, len(block.names) - 1)
+                if backwards:
+                    rng = (0, local)
+            elif b == first:
+                ''' wrapped around back to the starting block '''
+                rng = (0, local - 1) if not backwards else (local + 1, len(block.names) - 1)
+            else:
+                rng = (0, len(block.names) - 1)
+            if rng[0] > rng[1]:
+                continue
+            row = self._search_block(block, matcher, field, rng, backwards)
+            if row is not None:
+                return offsets[b] + row
+        return None
+
+    def _search_block(self, block, matcher, field, rng, backwards):
+        ''' Search rows rng[0] to rng[1] (inclusive) of block '''
+        text, starts = block.text(field)
+        begin = starts[rng[0]]
+        end = starts[rng[1] + 1] - 1
+        if isinstance(matcher, str):
+            if backwards:
+                pos = text.rfind(matcher, begin, end)
+            else:
+                pos = text.find(matcher, begin, end)
+            if pos == -1:
+                return None
+            return bisect_right(starts, pos) - 1
+        found = None
+        for m in matcher.finditer(text, begin, end):
+            row = bisect_right(starts, m.start()) - 1
+            if m.end() >= starts[row + 1]:
+                ''' match spans more than one row '''
+                continue
+            if not backwards:
+                return row
+            found = row
+        return found
+
+    def _get_matcher(self, term, mode):
+        if mode == self.SUBSTRING:
+            term = term.casefold()
+            if '\n' in term:
+                return None
+            return term
+        if mode == self.WORD:
+            pattern = r'(?<!\w)' + re.escape(term.casefold()) + r'(?!\w)'
+        else:
+            pattern = term
+        try:
+            return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'invalid search regular expression "{term}": {e}')
+            return None
+
+    def _locate(self, row, as_index=False):
+        for i, block in enumerate(self._blocks):
+            if row < len(block.names):
+                return (i if as_index else block), row
+            row -= len(block.names)
+        raise IndexError('StationsIndex row out of range')
+
+    def _fields(self, item):
+        if isinstance(item, str):
+            return item.casefold().replace('\n', ' '), ''
+        try:
+            url = item[1].casefold().replace('\n', ' ')
+        except (IndexError, AttributeError):
+            url = ''
+        return item[0].casefold().replace('\n', ' '), url
+
+
+
+class StationHealthStore():
+    ''' Results of the last check of station URLs
+
+    Used by playlist validation to skip URLs checked
+    recently; a URL that keeps failing is re-checked at
+    growing intervals (FAIL_BACKOFF, doubled on every
+    failure, up to FAIL_BACKOFF_MAX).
+
+    The TUI can use is_dead() to tell known-dead stations.
+
+    Each entry is kept as a list:
+        [ok, content type, audio signature, latency, checked, failures]
+    '''
+
+    FAIL_BACKOFF = 3600
+    FAIL_BACKOFF_MAX = 7 * 24 * 3600
+
+    def __init__(self, a_file, window=24 * 3600):
+        self._file = a_file
+        self.window = window
+        self._urls = {}
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._urls)
+
+    def read(self):
+        try:
+            with open(self._file, 'r', encoding='utf-8') as f:
+                urls = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if isinstance(urls, dict):
+            self._urls = urls
+        return True
+
+    def write(self):
+        ''' Save the store, if changed
+            Returns True on success '''
+        if not self._dirty:
+            return True
+        tmp_file = self._file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._urls, f, separators=(',', ':'))
+            replace(tmp_file, self._file)
+        except OSError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f'Cannot save station health file: {e}')
+            return False
+        self._dirty = False
+        return True
+
+    def get(self, url):
+        ''' Return the last result of url as a dict, or None '''
+        entry = self._urls.get(url)
+        if entry is None:
+            return None
+        return dict(zip(
+            ('ok', 'content_type', 'signature', 'latency', 'checked', 'failures'),
+            entry
+        ))
+
+    def is_fresh(self, url, now=None):
+        ''' True if url need not be checked again '''
+        entry = self._urls.get(url)
+        if entry is None or self.window <= 0:
+            return False
+        age = (now or time()) - entry[4]
+        if entry[0]:
+            return age < self.window
+        return age < min(
+            self.FAIL_BACKOFF * 2 ** (entry[5] - 1),
+            self.FAIL_BACKOFF_MAX
+        )
+
+    def is_dead(self, url):
+        ''' True if the last check of url failed '''
+        entry = self._urls.get(url)
+        return entry is not None and not entry[0]
+
+    def update(self, url, ok, content_type='', signature='', latency=None, now=None):
+        old = self._urls.get(url)
+        failures = 0 if ok else (old[5] + 1 if old else 1)
+        self._urls[url] = [
+            bool(ok), content_type, signature,
+            None if latency is None else round(latency, 3),
+            now or time(), failures
+        ]
+        self._dirty = True
+
+
 class ProfileManager():
 
     def __init__(self):
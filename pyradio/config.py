@@ -8,6 +8,7 @@ import curses
 import collections
 import json
 from pathlib import Path
+from importlib.util import find_spec
 # import socket
 from os import path, getenv, makedirs, remove, rename, readlink, SEEK_END, SEEK_CUR, getpid, listdir, access, R_OK, environ, fspath, unlink
 from time import ctime, sleep
@@ -29,16 +30,14 @@ except ImportError:
     from importlib_resources import files, as_file
     from importlib_resources.abc import Traversable
 from pyradio import version
-from .common import validate_resource_opener_path, is_rasberrypi, Station, describe_playlist, CsvReadWrite, ProfileManager
+from .common import validate_resource_opener_path, is_rasberrypi, Station, describe_playlist, CsvReadWrite, ProfileManager, StationsIndex
 from .keyboard import read_keyboard_shortcuts, read_localized_keyboard, set_lkbkey
-from .browser import probeBrowsers
 from .player import pywhich
 from .server import IPsWithNumbers
 from .xdg import XdgDirs, XdgMigrate, CheckDir
 from .install import get_a_linux_resource_opener
 from .html_help import is_graphical_environment_running
 from .log import TIME_FORMATS
-from .m3u import parse_m3u
 
 try:
     from subprocess import Popen, DEVNULL
@@ -48,18 +47,10 @@ if system().lower() == 'windows':
     from os import startfile
 else:
     pass
-HAS_REQUESTS = True
-
-try:
-    import requests
-except:
-    HAS_REQUESTS = False
-
-HAS_DNSPYTHON = True
-try:
-    from dns import resolver
-except:
-    HAS_DNSPYTHON = False
+''' requests and dnspython are only imported
+    when used (they are slow to import) '''
+HAS_REQUESTS = find_spec('requests') is not None
+HAS_DNSPYTHON = find_spec('dns') is not None
 HAS_PSUTIL = True
 try:
     import psutil
@@ -117,6 +108,18 @@ class PyRadioStations():
     PLAYLIST_HAS_NAME_URL_ENCODING_ICON_VOL_HTTP = 4
     PLAYLIST_HAS_NAME_URL_ENCODING_ICON_VOL_HTTP_REF = 5
 
+    ''' bumped whenever the stations or playlists lists
+        change, so that readers (i.e. the remote control
+        server) can tell if their copy is still current
+    '''
+    _playlist_generation = 0
+    _dirty_playlist = False
+
+    ''' StationsIndex of self.stations '''
+    _search_index = None
+
+    PLAYLIST_JOURNAL_SIZE = 200
+
     def __init__(self, stationFile='', user_config_dir=None):
         self.foreign_title = ''
         self.previous_station_path = ''
@@ -128,6 +131,9 @@ class PyRadioStations():
         ''' True if playlist not in config dir '''
         self.foreign_file = False
 
+        ''' undo steps of the edits of self.stations '''
+        self._playlist_journal = collections.deque(maxlen=self.PLAYLIST_JOURNAL_SIZE)
+
         self.stations = []
         self._reading_stations = []
         self.playlists = []
@@ -358,6 +364,75 @@ class PyRadioStations():
     def online_browser(self, value):
         self._online_browser = value
 
+    @property
+    def stations(self):
+        return self._stations
+
+    @stations.setter
+    def stations(self, value):
+        self._stations = value
+        self._playlist_generation += 1
+        ''' the journal refers to the previous list '''
+        self._playlist_journal.clear()
+
+    @property
+    def playlists(self):
+        return self._playlists
+
+    @playlists.setter
+    def playlists(self, value):
+        self._playlists = value
+        self._playlist_generation += 1
+
+    @property
+    def dirty_playlist(self):
+        return self._dirty_playlist
+
+    @dirty_playlist.setter
+    def dirty_playlist(self, value):
+        ''' setting the playlist dirty means that
+            a station has been added, edited or removed
+        '''
+        self._dirty_playlist = value
+        if value:
+            self._playlist_generation += 1
+
+    @property
+    def playlist_generation(self):
+        return self._playlist_generation
+
+    @playlist_generation.setter
+    def playlist_generation(self, value):
+        raise ValueError('property is read only')
+
+    @property
+    def search_index(self):
+        ''' The search index of self.stations
+
+            Built when a playlist is read and updated in place
+            when stations are inserted, removed or moved; any
+            other change to self.stations makes it rebuild on
+            first use.
+        '''
+        if self._search_index is None or \
+                not self._search_index.is_current(self.stations, self._playlist_generation):
+            self._search_index = StationsIndex(self.stations, self._playlist_generation)
+        return self._search_index
+
+    def _current_search_index(self):
+        ''' Return the search index, if it is in sync with
+            self.stations, so that it can be updated in place '''
+        if self._search_index is not None and \
+                self._search_index.is_current(self.stations, self._playlist_generation):
+            return self._search_index
+        return None
+
+    def bump_playlist_generation(self):
+        ''' to be called after changing self.stations
+            in place without marking the playlist dirty
+        '''
+        self._playlist_generation += 1
+
     @property
     def playlist_version(self):
         return self._playlist_version
@@ -667,6 +742,7 @@ class PyRadioStations():
             print('Converting [green]M3U[/green] to [green]CSV[/green]...')
             # Coming from -s command line parameter
             # Try to convert m3u to csv
+            from .m3u import parse_m3u
             stations, error = parse_m3u(stationFile)
             if error:
                 print(f'[bold red]Error:[/bold red] Cannot convert file: "{stationFile}" : "[red]{error}[/red]"')
@@ -737,7 +813,8 @@ class PyRadioStations():
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('===> {} = {}'.format(describe_playlist(self._playlist_version), self._playlist_version))
 
-        self.stations = list(self._reading_stations)
+        self.stations = self._reading_stations
+        self._search_index = StationsIndex(self.stations, self._playlist_generation)
         # logger.error('DE stations\n{}\n\n'.format(self.stations))
         self.set_playlist_data(stationFile, prev_file, is_register)
         self.number_of_stations = len(self.stations)
@@ -1029,14 +1106,13 @@ class PyRadioStations():
             return -2
 
     def remove_station(self, target):
-        self.dirty_playlist = True
-        d = collections.deque(self.stations)
-        d.rotate(-target)
-        ret = d.popleft()
-        d.rotate(target)
-        self.stations = list(d)
-        #ret = self.stations.pop(target)
+        index = self._current_search_index()
+        ret = self.stations.pop(target)
+        self._journal_change(('remove', target, ret))
         self.number_of_stations = len(self.stations)
+        if index:
+            index.remove(target)
+            index.bind(self.stations, self._playlist_generation)
         return ret, self.number_of_stations
 
     def insert_station(self, station, target):
@@ -1047,18 +1123,15 @@ class PyRadioStations():
                 target > self.number_of_stations or \
                 self.number_of_stations == 0:
             return False, self.number_of_stations
+        index = self._current_search_index()
         if station[2] == 'utf-8':
             station[2] = ''
-        if target == self.number_of_stations:
-            self.stations.append(station)
-        else:
-            d = collections.deque(self.stations)
-            d.rotate(-target)
-            d.appendleft(station)
-            d.rotate(target)
-            self.stations = list(d)
-        self.dirty_playlist = True
+        self.stations.insert(target, station)
+        self._journal_change(('insert', target, station))
         self.number_of_stations = len(self.stations)
+        if index:
+            index.insert(target, station)
+            index.bind(self.stations, self._playlist_generation)
         # logger.error('DE number_of_stations = {}'.format(self.number_of_stations))
         return True, self.number_of_stations
 
@@ -1075,17 +1148,14 @@ class PyRadioStations():
                 self.number_of_stations == 0:
             # logger.error('DE \n\nreturning False\n\n')
             return False
-        d = collections.deque(self.stations)
-        d.rotate(-source)
-        source_item = d.popleft()
-        # logger.error('DE source_item = "{}"'.format(source_item))
-        d.rotate(source)
-        d.rotate(-target)
-        d.appendleft(source_item)
-        d.rotate(target)
-        self.stations = list(d)
+        index = self._current_search_index()
+        source_item = self.stations.pop(source)
+        self.stations.insert(target, source_item)
+        self._journal_change(('move', source, target))
         self.number_of_stations = len(self.stations)
-        self.dirty_playlist = True
+        if index:
+            index.move(source, target, source_item)
+            index.bind(self.stations, self._playlist_generation)
         return True
 
     def switch_stations(self, source, target):
@@ -1096,21 +1166,30 @@ class PyRadioStations():
                 target >= self.number_of_stations or \
                 self.number_of_stations == 0:
             return False, self.number_of_stations
-        target_item = self.stations[target]
-        d = collections.deque(self.stations)
-        self.stations.clear()
-        d.rotate(-source)
-        source_item = d.popleft()
-        d.appendleft(target_item)
-        d.rotate(source)
-        d.rotate(-target)
-        d.popleft()
-        d.appendleft(source_item)
-        d.rotate(target)
-        self.stations = list(d)
+        index = self._current_search_index()
+        self.stations[source], self.stations[target] = \
+                self.stations[target], self.stations[source]
+        self._journal_change(('switch', source, target))
         self.number_of_stations = len(self.stations)
+        if index:
+            index.replace(source, self.stations[source])
+            index.replace(target, self.stations[target])
+            index.bind(self.stations, self._playlist_generation)
         return True, self.number_of_stations
 
+    def _journal_change(self, change):
+        ''' Record an edit of self.stations and mark the
+            playlist dirty
+
+            change is one of
+                ('insert', index, station)
+                ('remove', index, station)
+                ('move', source, target)
+                ('switch', source, target)
+        '''
+        self._playlist_journal.append(change)
+        self.dirty_playlist = True
+
     def registers_exist(self):
         return glob.glob(path.join(self.registers_dir, '*.[Cc][Ss][Vv]'))
 
@@ -1201,6 +1280,7 @@ class PyRadioStations():
         return -1
 
     def open_browser(self, url, search_return_function, message_function, cannot_delete_function):
+        from .browser import probeBrowsers
         self._online_browser = probeBrowsers(url)(
             self,
             search_return_function=search_return_function,
@@ -4105,6 +4185,7 @@ class PyRadioBase16Themes():
             # logger.error('w_path = {}'.format(w_path))
             requests_response = None
             written = False
+            import requests
             for n in range(0,5):
                 requests_response = None
                 try:
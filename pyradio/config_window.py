@@ -31,7 +31,6 @@ from .encodings import get_encodings
 from .themes import PyRadioTheme
 from .server import IPsWithNumbers
 from .simple_curses_widgets import SimpleCursesLineEdit, SimpleCursesHorizontalPushButtons, SimpleCursesMenu
-from .client import PyRadioClient
 from .keyboard import kbkey, kbkey_orig, ctrl_code_to_string, is_valid_char, is_invalid_key, is_ctrl_key, conflicts, read_keyboard_shortcuts, check_localized, LetterDisplay, get_kb_letter, to_str, add_l10n_to_functions_dict, remove_l10n_from_global_functions
 from .log import TIME_FORMATS
 from .tts import TTSManager, Priority, Context
@@ -1032,6 +1031,8 @@ class PyRadioConfigWindow():
         elif val[0] == 'recording_dir':
             if self._is_recording() > 0:
                 return 5, []
+            # The client (and requests) is only needed here
+            from .client import PyRadioClient
             client = PyRadioClient(
                     server_file=path.join(
                         self._cnf.state_dir, 'server-headless.txt'
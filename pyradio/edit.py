@@ -2,13 +2,13 @@
 import locale
 import curses
 import curses.ascii
+import select
 from time import sleep
 import logging
-from sys import platform, modules
+from sys import platform, modules, stdin
 from os import path, remove, sep, access, X_OK, environ, makedirs
 from string import punctuation as string_punctuation
 from pathlib import Path
-from rapidfuzz import fuzz, process
 try:
     # python 3
     from urllib.parse import urlparse
@@ -21,7 +21,7 @@ from .cjkwrap import cjkslices
 from .xdg import CheckDir
 from .html_help import HtmlHelp
 from .keyboard import kbkey, kb2str, kb2chr, check_localized
-from .common import M_STRINGS, Station
+from .common import M_STRINGS, Station, StationsIndex
 from .cjkwrap import cjklen, cjkljust
 
 locale.setlocale(locale.LC_ALL, '')    # set your locale
@@ -250,66 +250,64 @@ class PyRadioSearch(SimpleCursesLineEdit):
                  start=0,
                  stop=None,
                  search_term=None,
-                 search_function=None
+                 search_function=None,
+                 index=None
                  ):
-        if self.string:
-            active_search_term = self.string[1:] if self.string[0] == '+' else self.string
-            if search_function and self.string[0] == '+':
-                ''' use online browser search instead '''
-                return search_function(
-                    active_search_term,
-                    start=start,
-                    stop=stop
-                )
-
-            for n in range(start, len(a_list)):
-                if active_search_term.lower() in self._get_string(a_list[n]):
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f'forward search term "{self.string}" found at {n}')
-                    return n
-            """ if not found start from list top """
-            for n in range(0, start):
-                if active_search_term.lower() in self._get_string(a_list[n]):
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f'forward search term "{self.string}" found at {n}')
-                    return n
-            """ if not found return None """
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f'forward search term "{self.string}" not found')
-        return None
+        return self._search(a_list, start, stop, search_function, index, backwards=False)
 
     def get_previous(self,
                      a_list,
                      start=0,
                      stop=None,
                      search_term=None,
-                     search_function=None
+                     search_function=None,
+                     index=None
                      ):
+        return self._search(a_list, start, stop, search_function, index, backwards=True)
+
+    def _search(self, a_list, start, stop, search_function, index, backwards):
+        ''' Find the next / previous item of a_list matching
+            the search string, wrapping around the list.
+
+            index is the StationsIndex of a_list, if it has
+            one (i.e. PyRadioStations.search_index); a
+            temporary one is used otherwise.
+        '''
+        if not self.string:
+            return None
         active_search_term = self.string[1:] if self.string[0] == '+' else self.string
-        if self.string:
-            if search_function and self.string[0] == '+':
-                ''' use online browser search instead '''
-                return search_function(
-                    active_search_term,
-                    start=start,
-                    stop=stop
-                )
+        if search_function and self.string[0] == '+':
+            ''' use online browser search instead '''
+            return search_function(
+                active_search_term,
+                start=start,
+                stop=stop
+            )
 
-            for n in range(start, -1, -1):
-                if active_search_term.lower() in self._get_string(a_list[n]):
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f'backward search term "{self.string}" found at {n}')
-                    return n
-            """ if not found start from list end """
-            for n in range(len(a_list) - 1, start, -1):
-                if active_search_term.lower() in self._get_string(a_list[n]):
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f'backward search term "{self.string}" found at {n}')
-                    return n
-            """ if not found return None """
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f'backward search term "{self.string}" not found')
-        return None
+        term, mode = self._parse_search_term(active_search_term)
+        if index is None or index.items is not a_list or len(index) != len(a_list):
+            index = StationsIndex(a_list)
+        ret = index.find(term, start, backwards=backwards, mode=mode)
+        if logger.isEnabledFor(logging.DEBUG):
+            direction = 'backward' if backwards else 'forward'
+            if ret is None:
+                logger.debug(f'{direction} search term "{self.string}" not found')
+            else:
+                logger.debug(f'{direction} search term "{self.string}" found at {ret}')
+        return ret
+
+    def _parse_search_term(self, term):
+        ''' Return the search term and StationsIndex mode
+
+                /expression     regular expression
+                "words"         whole words
+                anything else   substring
+        '''
+        if len(term) > 1 and term[0] == '/':
+            return term[1:], StationsIndex.REGEX
+        if len(term) > 1 and term[0] == '"':
+            return term[1:-1] if term[-1] == '"' else term[1:], StationsIndex.WORD
+        return term, StationsIndex.SUBSTRING
 
     def print_not_found(self):
         self._edit_win.addstr(0, 0, 'Term not found!'.ljust(self._max_chars_to_display), self.edit_color)
@@ -317,11 +315,6 @@ class PyRadioSearch(SimpleCursesLineEdit):
         sleep(.3)
         self.refreshEditWindow()
 
-    def _get_string(self, item):
-        if isinstance(item, str):
-            return item.lower()
-        return item[0].lower()
-
 
 class PyRadioFuzzyStationFinder:
 
@@ -329,6 +322,15 @@ class PyRadioFuzzyStationFinder:
     _footer = 'Enter: select  Esc: cancel  Up/Down: move'
     _score_cutoff = 60
 
+    ''' lists this long are scored on all CPUs
+        (if numpy is available) '''
+    _parallel_min_items = 5000
+
+    ''' number of queries whose results are kept '''
+    _results_cache_size = 32
+
+    _numpy = None
+
     def __init__(self, parent, history_file, is_locked=False):
         self._parent = parent
         self._history_file = history_file
@@ -341,6 +343,15 @@ class PyRadioFuzzyStationFinder:
         self._query = ''
         self._win = None
         self._editor = None
+        ''' casefolded titles, built once in set_items '''
+        self._corpus = []
+        ''' the query self._matches were computed for '''
+        self._matches_query = None
+        ''' {query: [(position in self._items, score)]} '''
+        self._results_cache = {}
+        ''' set when a search was skipped because more
+            keys were already waiting to be processed '''
+        self._stale = False
 
     @property
     def history_file(self):
@@ -364,6 +375,9 @@ class PyRadioFuzzyStationFinder:
             else:
                 title = item[0]
             self._items.append((i, title))
+        self._corpus = [title.casefold() for _, title in self._items]
+        self._matches_query = None
+        self._results_cache = {}
         self._current_index = selected if 0 <= selected < len(self._items) else 0
         self._query = ''
         self._selection = 0
@@ -461,19 +475,34 @@ class PyRadioFuzzyStationFinder:
             return 0 if self._matches else 1
 
         ret = self._editor.keypress(self._editor._edit_win, char)
-        logger.error(f'**** {ret = }')
         self._query = self._editor.string
         if ret == 2:
             return 2
         if ret == -1:
             return -1
         if ret == 0:
+            if self._stale:
+                self._rebuild_matches()
             return 0 if self._matches else 1
 
+        if self._input_pending():
+            ''' the user is still typing; do not search
+                for a query that is about to change '''
+            self._stale = True
+            self._editor.refreshEditWindow()
+            return 1
         self._rebuild_matches()
         self.show()
         return 1
 
+    def _input_pending(self):
+        ''' Return True if there are keys waiting to be read '''
+        try:
+            return bool(select.select([stdin], [], [], 0)[0])
+        except (OSError, ValueError, TypeError):
+            ''' i.e. stdin is not selectable on Windows '''
+            return False
+
     def _results_height(self):
         if self._win is None:
             return 1
@@ -495,8 +524,10 @@ class PyRadioFuzzyStationFinder:
         self._start_pos = max(0, min(self._start_pos, max_start))
 
     def _rebuild_matches(self):
+        self._stale = False
         query = self._query.strip()
         if not query:
+            self._matches_query = None
             self._matches = [(idx, title, None) for idx, title in self._items]
             self._selection = self._current_index if self._matches else 0
             self._start_pos = max(0, self._selection - 2)
@@ -504,19 +535,59 @@ class PyRadioFuzzyStationFinder:
             return
 
         normalized_query = query.casefold()
-        choices = {idx: title.casefold() for idx, title in self._items}
-        display_titles = {idx: title for idx, title in self._items}
+        if normalized_query == self._matches_query:
+            return
+        positions = self._results_cache.get(normalized_query)
+        if positions is None:
+            positions = self._score(normalized_query)
+            if len(self._results_cache) >= self._results_cache_size:
+                self._results_cache.pop(next(iter(self._results_cache)))
+            self._results_cache[normalized_query] = positions
+        self._matches = [self._items[x] + (score,) for x, score in positions]
+        self._matches_query = normalized_query
+        self._selection = 0
+        self._start_pos = 0
+        self._make_selection_visible()
+
+    def _score(self, normalized_query):
+        ''' Return [(position in self._items, score)] of the
+            items matching normalized_query, best first '''
+        from rapidfuzz import fuzz, process
+        if len(self._corpus) >= self._parallel_min_items:
+            np = self._get_numpy()
+            if np is not None:
+                scores = process.cdist(
+                    [normalized_query],
+                    self._corpus,
+                    scorer=fuzz.WRatio,
+                    processor=None,
+                    score_cutoff=self._score_cutoff,
+                    workers=-1
+                )[0]
+                found = np.nonzero(scores >= self._score_cutoff)[0]
+                ''' best score first, then list order '''
+                found = found[np.argsort(-scores[found], kind='stable')]
+                return list(zip(found.tolist(), scores[found].tolist()))
         results = process.extract(
             normalized_query,
-            choices,
+            self._corpus,
             scorer=fuzz.WRatio,
+            processor=None,
             score_cutoff=self._score_cutoff,
-            limit=len(choices)
+            limit=None
         )
-        self._matches = [(item[2], display_titles[item[2]], item[1]) for item in results]
-        self._selection = 0
-        self._start_pos = 0
-        self._make_selection_visible()
+        return [(item[2], item[1]) for item in results]
+
+    def _get_numpy(self):
+        ''' rapidfuzz.process.cdist needs numpy, which is
+            not a PyRadio requirement '''
+        if PyRadioFuzzyStationFinder._numpy is None:
+            try:
+                import numpy
+                PyRadioFuzzyStationFinder._numpy = numpy
+            except ImportError:
+                PyRadioFuzzyStationFinder._numpy = False
+        return PyRadioFuzzyStationFinder._numpy or None
 
     def _draw_matches(self):
         if self._win is None:
@@ -28,19 +28,11 @@ try:
 except ImportError:
     pass
 
-try:
-    from urllib.request import urlopen
-except ImportError:
-    try:
-        from urllib2 import urlopen
-    except ImportError:
-        pass
+from importlib.util import find_spec
 
-try:
-    import requests
-    HAVE_REQUESTS = True
-except ImportError:
-    HAVE_REQUESTS = False
+''' urllib.request and requests are imported
+    when used (they are slow to import) '''
+HAVE_REQUESTS = find_spec('requests') is not None
 
 VERSION = ''
 
@@ -316,6 +308,7 @@ def get_github_long_description(
             else:
                 url += '?sha=master'
             url += '&per_page=50'
+        from urllib.request import urlopen
         try:
             with urlopen(url) as https_response:
                 ret = https_response.read()
@@ -1212,6 +1205,7 @@ class PyRadioUpdate():
                 ):
             print('  [magenta]** file found in cache![/magenta]')
         else:
+            import requests
             try:
                 r = requests.get(url)
             except:
@@ -7,7 +7,7 @@ from os.path import join, exists, dirname
 from sys import platform, stdout
 from platform import system as platform_system
 from copy import deepcopy
-from time import sleep
+from time import sleep, time
 from shutil import copy2
 from pathlib import Path
 import datetime
@@ -21,6 +21,7 @@ except ImportError:
 from .common import STATES, M_STRINGS
 from .cjkwrap import cjklen, cjkslices
 from .tts import Priority
+from .scheduler import default_scheduler
 
 locale.setlocale(locale.LC_ALL, "")
 
@@ -90,49 +91,47 @@ class PyRadioTimer:
     -----------
     current_time : str
         The current time as a formatted string.
-    _timer_thread : threading.Thread
-        The thread responsible for updating the current time.
+    _timer : ScheduledCall
+        The call, registered with the shared scheduler, that
+        updates the current time once a second.
     lock : threading.Lock
         A lock for thread-safe access to the current time.
 
     Methods:
     --------
     start()
-        Starts the timer thread.
+        Starts updating the time.
 
     stop()
-        Stops the timer thread if it is running.
+        Stops updating the time.
 
     update_time()
-        Updates the current_time every specified interval.
+        Updates the current_time; called once a second.
 
     get_current_time()
         Returns the current time in a thread-safe manner.
 
     is_active()
-        Checks if the timer thread is currently running.
-
-    Class Variables:
-    ----------------
-    SLEEP_INTERVAL : float
-        The duration (in seconds) to sleep between updates (default is 0.5 seconds).
+        Checks if the timer is currently running.
     """
 
     def __init__(self, update_functions, exit_thread, time_format=0, sleep_interval=0.24, check_start_time=None):
         self._exit = exit_thread
         self.current_time = ""
-        self._timer_thread = None
+        self._timer = None
+        self._old_time = None
         self._time_format = TIME_FORMATS[time_format]
         self.lock = threading.Lock()  # Lock for thread-safe access
         self.function_lock = threading.Lock()  # Lock for thread-safe access
-        self.SLEEP_INTERVAL = sleep_interval  # Set custom sleep interval
+        # Not used any more; the time is updated at the start of every second
+        self.SLEEP_INTERVAL = sleep_interval
         self._update_functions = update_functions  # Store the update function
         self._check_start_time = check_start_time
 
     @property
     def is_active(self):
-        """ Return True if the timer thread is active, otherwise False. """
-        return self._timer_thread is not None and self._timer_thread.is_alive()
+        """ Return True if the timer is active, otherwise False. """
+        return self._timer is not None and self._timer.is_alive()
 
     @property
     def update_functions(self):
@@ -157,53 +156,40 @@ class PyRadioTimer:
                     self._time_format = TIME_FORMATS[value]
 
     def start(self):
-        """ Start the timer thread if it's not already running. """
-        if self._timer_thread is None or not self._timer_thread.is_alive():
-            self._timer_thread = threading.Thread(target=self.update_time)
-            self._show_time()
-            self._timer_thread.start()
+        """ Start the timer if it's not already running. """
+        if not self.is_active:
+            self._old_time = self._show_time()
+            # run just after the start of every second
+            self._timer = default_scheduler.call_every(
+                1, self.update_time,
+                first=1.01 - time() % 1
+            )
         else:
             if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Timer thread is already running.")
+                logger.debug("Timer is already running.")
 
     def stop(self):
-        """ Stop the timer thread if it is running. """
-        if self._timer_thread is not None and self._timer_thread.is_alive():
-            self._timer_thread.join()
-            self._timer_thread = None
+        """ Stop the timer if it is running. """
+        if self.is_active:
+            self._timer.cancel()
+            self._timer.join()
+            self._timer = None
             self.current_time = None
         else:
             if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Timer thread is not running.")
+                logger.debug("Timer is not running.")
 
     def update_time(self):
         """
-        Update current_time based on the specified interval.
+        Update current_time; called by the scheduler once a second.
 
-        The function checks for exit conditions and updates
-        the current time every 1 second.
-        The update occurs in increments of SLEEP_INTERVAL seconds to ensure
-        responsiveness to exit requests.
+        Returns False, which stops the updates, when asked to exit.
         """
-        old_time = None
-        while True:
-            if self._exit():
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('Timer thread asked to stop. Stopping...')
-                return
-
-
-            # Calculate how many iterations based on 1 second
-            iterations = int(1 / self.SLEEP_INTERVAL)
-
-            for _ in range(iterations):
-                if self._exit():
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug('Timer thread asked to stop. Stopping...')
-                    return
-                sleep(self.SLEEP_INTERVAL)  # Sleep for SLEEP_INTERVAL seconds
-
-            old_time = self._show_time(old_time)
+        if self._exit():
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Timer asked to stop. Stopping...')
+            return False
+        self._old_time = self._show_time(self._old_time)
 
     def _show_time(self, old_time=None):
         with self.lock:  # Acquire lock before updating
@@ -223,21 +209,21 @@ class PyRadioTimer:
                 # do not update the display
                 return old_time
 
-        # Call _update_functions in a new thread without blocking
+        # Call _update_functions (already off the main thread)
         with self.function_lock:
             #logger.error(f'{self.current_time = }')
             for an_update_function in self._update_functions:
                 if self._exit():
                     if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug('Timer thread asked to stop. Stopping...')
+                        logger.debug('Timer asked to stop. Stopping...')
                     return old_time
-                threading.Thread(target=an_update_function, args=(self.current_time,)).start()
-                return self.current_time
+                an_update_function(self.current_time)
+        return self.current_time
 
     def get_current_time(self):
         """ Safely return the current time. Returns an empty string if the timer is not running. """
         with self.lock:  # Acquire lock before reading
-            return self.current_time if self._timer_thread and self._timer_thread.is_alive() else ""
+            return self.current_time if self.is_active else ""
 
 class Log():
     ''' Log class that outputs text to a curses screen '''
@@ -538,7 +524,8 @@ class Log():
                     self._player_stopped = True
                     return
                 if p_time is not None:
-                    self.cursesScreen.refresh()
+                    self.cursesScreen.noutrefresh()
+                    curses.doupdate()
                     return
 
                 ''' start normal execution '''
@@ -695,7 +682,7 @@ class Log():
                     except:
                         pass
                     first_print = self._do_i_print_last_char(first_print)
-                    self.cursesScreen.refresh()
+                    self.cursesScreen.noutrefresh()
                     self._active_width -= cjklen(d_msg)
                 if self._show_status_updates:
                     if logger.isEnabledFor(logging.DEBUG):
@@ -714,7 +701,7 @@ class Log():
                             self._active_width - len(d_msg),
                             d_msg)
                         first_print = self._do_i_print_last_char(first_print)
-                        self.cursesScreen.refresh()
+                        self.cursesScreen.noutrefresh()
                         self._active_width -= len(d_msg)
                         self.display_help_message = False
                         self.mpris_nav_caps(True)
@@ -748,7 +735,7 @@ class Log():
                                 suffix_string)
                         except:
                             pass
-                        self.cursesScreen.refresh()
+                        self.cursesScreen.noutrefresh()
                         self.display_help_message = True
                         if self._show_status_updates:
                             if logger.isEnabledFor(logging.DEBUG):
@@ -764,7 +751,8 @@ class Log():
                     self.counter = None
                     self._player_stopped = True
                     return
-                self.cursesScreen.refresh()
+                self.cursesScreen.noutrefresh()
+                curses.doupdate()
                 # logger.error('DE _player_stopped = {}'.format(self._player_stopped))
 
     def readline(self):
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import logging
+import tempfile
+import threading
+from os import path, remove, replace, scandir, utime
+from time import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+from .common import get_cached_icon_path
+
+logger = logging.getLogger(__name__)
+
+
+class StationLogoFetcher():
+    ''' Download station logos into the logos directory
+
+        Downloads run on a small pool of worker threads,
+        over one keep-alive session. Concurrent requests for
+        the same URL share one download.
+
+        The logos directory is kept under "quota" bytes by
+        removing the least recently used logos (a logo's
+        modification time is updated whenever it is used).
+    '''
+
+    CHUNK_SIZE = 16 * 1024
+    TIMEOUT = 10
+
+    ''' number of stations before and after the one
+        playing whose logos are prefetched (0 disables) '''
+    PREFETCH = 2
+
+    ''' leftovers of interrupted downloads older than
+        this (seconds) are removed '''
+    STALE_TEMP_AGE = 60
+
+    _headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
+
+    def __init__(self, logos_dir, quota=20 * 1024 * 1024, workers=2):
+        self._logos_dir = logos_dir
+        self.quota = quota
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='logo'
+        )
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._usage = None
+
+    def fetch(self, url, station_name, callback=None, stop=None):
+        ''' Get the logo of a station
+
+            callback is called with the logo's file name
+            once it is available (not called on failure)
+        '''
+        if not url:
+            return
+        submitted = False
+        with self._lock:
+            future = self._pending.get(url)
+            if future is None:
+                future = self._executor.submit(
+                    self._download, url, station_name,
+                    stop if stop else lambda: False
+                )
+                self._pending[url] = future
+                submitted = True
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug('+++ icon download: already in progress...')
+        if submitted:
+            ''' not under the lock: a done future runs the
+                callback right away, and _done takes the lock '''
+            future.add_done_callback(lambda f: self._done(url, f))
+        if callback:
+            future.add_done_callback(lambda f: self._call(callback, f))
+
+    def prefetch(self, stations, stop=None):
+        ''' Fetch the logos of stations (name, icon url tuples)
+            as long as no other downloads are waiting '''
+        for station_name, url in stations:
+            with self._lock:
+                if len(self._pending) >= self._workers:
+                    return
+            self.fetch(url, station_name, stop=stop)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def _done(self, url, future):
+        with self._lock:
+            if self._pending.get(url) is future:
+                del self._pending[url]
+
+    @staticmethod
+    def _call(callback, future):
+        if not future.cancelled() and future.exception() is None:
+            a_file = future.result()
+            if a_file:
+                callback(a_file)
+
+    def _download(self, url, station_name, stop):
+        file_to_write = get_cached_icon_path(self._logos_dir, station_name, url)
+        if path.exists(file_to_write):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('+++ icon download: aleready downloaded...')
+            try:
+                utime(file_to_write)
+            except OSError:
+                pass
+            return file_to_write
+        if stop():
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('+++ icon download: asked to stop. Stopping...')
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('+++ downloading icon...')
+        temp_file = None
+        size = 0
+        try:
+            with self._session.get(url, timeout=self.TIMEOUT, stream=True) as response:
+                if response.status_code != 200:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f'+++ icon download failed: HTTP {response.status_code}')
+                    return None
+                with tempfile.NamedTemporaryFile(
+                    delete=False, dir=self._logos_dir, suffix='.part'
+                ) as local_file:
+                    temp_file = local_file.name
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                        if stop():
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug('+++ icon download: asked to stop. Stopping...')
+                            return None
+                        local_file.write(chunk)
+                        size += len(chunk)
+            replace(temp_file, file_to_write)
+            temp_file = None
+        except requests.exceptions.RequestException as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'+++ icon download failed: {e}')
+            return None
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'+++ icon download: error saving icon: {e}')
+            return None
+        finally:
+            if temp_file:
+                try:
+                    remove(temp_file)
+                except OSError:
+                    pass
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('+++ icon downloaded...')
+        self._add_usage(size)
+        return file_to_write
+
+    def _add_usage(self, size):
+        with self._lock:
+            if self._usage is not None:
+                self._usage += size
+                if self._usage <= self.quota:
+                    return
+        self._enforce_quota()
+
+    def _enforce_quota(self):
+        ''' Remove the least recently used logos until the
+            directory is under 90% of the quota, as well as
+            leftovers of interrupted downloads '''
+        now = time()
+        logos = []
+        usage = 0
+        try:
+            with scandir(self._logos_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if entry.name.startswith('tmp') and \
+                            (entry.name.endswith('.part') or '.' not in entry.name):
+                        if now - st.st_mtime > self.STALE_TEMP_AGE:
+                            try:
+                                remove(entry.path)
+                            except OSError:
+                                pass
+                        continue
+                    logos.append((st.st_mtime, st.st_size, entry.path))
+                    usage += st.st_size
+        except OSError:
+            return
+        if usage > self.quota:
+            target = self.quota * 0.9
+            logos.sort()
+            for _, size, a_file in logos:
+                try:
+                    remove(a_file)
+                    usage -= size
+                except OSError:
+                    pass
+                if usage <= target:
+                    break
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'+++ logos cache reduced to {usage} bytes')
+        with self._lock:
+            self._usage = usage
@@ -5,14 +5,17 @@ Handles M3U file format with support for various metadata extensions.
 """
 import re
 import io
+import json
+import codecs
 import functools
 import locale
 import tempfile
+from array import array
 from html import unescape
 import urllib.request
 from urllib.parse import urlparse
 from os.path import dirname, exists
-from os import makedirs, unlink
+from os import makedirs, unlink, replace
 from charset_normalizer import detect
 
 from .common import Station
@@ -429,69 +432,111 @@ def clean_temp_file(a_file):
         except Exception:
             pass
 
-def parse_m3u(m3u_path, max_entries=10000):
-    """Convert M3U to playlist with enhanced safety checks"""
+class M3uReader:
+    """
+    Streaming M3U parser
 
-    temp_file_path = None
-    if m3u_path.startswith("http://") or m3u_path.startswith("https://"):
-        # Download remote m3u
-        try:
-            with urllib.request.urlopen(m3u_path) as response:
-                data = response.read()
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(data)
-                m3u_path = temp_file.name
-                temp_file_path = m3u_path
-        except Exception as e:
-            return None, f"Error parsing {m3u_path}: {str(e)}"
+    Iterating over it yields (group, station) tuples in file
+    order. The file (or URL) is read in chunks: the encoding
+    is detected from the first SNIFF_SIZE bytes (UTF-8 if they
+    are plain ASCII) and the rest is decoded incrementally, so
+    memory use does not depend on the size of the list.
 
-    # READ AS BINARY FIRST - FIXED
-    try:
-        with open(m3u_path, 'rb') as f:
-            raw_data = f.read()
-    except Exception as e:
-        clean_temp_file(temp_file_path)
-        return None, f"Error reading file: {str(e)}"
+    On error, iteration stops and error holds the message.
+    """
 
-    # DETECT ENCODING FROM BYTES - FIXED
-    try:
-        result = detect(raw_data)
-        encoding = result['encoding'] if result and result['encoding'] else 'utf-8'
-        # Normalize encoding names
-        if encoding.lower() in ['iso-8859-1', 'cp1252', 'windows-1252']:
-            encoding = 'latin-1'
-    except:
-        encoding = 'utf-8'
-
-    # DECODE PROPERLY - FIXED
-    try:
-        content = raw_data.decode(encoding, errors='replace')
-    except:
-        # Fallback sequence
-        for test_enc in ['utf-8', 'latin-1', 'cp1252']:
+    SNIFF_SIZE = 64 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    # safety limit for a single line
+    MAX_LINE_BYTES = 4096
+
+    _field_map = {
+        "PROFILE": Station.profile,
+        "HTTP": Station.http,
+        "VOLUME": Station.volume,
+        "PLAYER": Station.player,
+        "BITRATE": None,
+        "ENCODING": Station.encoding
+    }
+
+    def __init__(self, m3u_path, max_entries=10000):
+        self.m3u_path = m3u_path
+        self.max_entries = max_entries
+        self.encoding = 'utf-8'
+        self.error = None
+        self.count = 0
+
+    def _open(self):
+        if self.m3u_path.startswith("http://") or self.m3u_path.startswith("https://"):
             try:
-                content = raw_data.decode(test_enc, errors='replace')
-                encoding = test_enc
-                break
-            except:
-                continue
-        else:
-            content = raw_data.decode('latin-1', errors='replace')
-            encoding = 'latin-1'
+                return urllib.request.urlopen(self.m3u_path)
+            except Exception as e:
+                self.error = f"Error parsing {self.m3u_path}: {str(e)}"
+                return None
+        try:
+            return open(self.m3u_path, 'rb')
+        except Exception as e:
+            self.error = f"Error reading file: {str(e)}"
+            return None
 
-    # PROCESS LINES
-    lines = content.splitlines()
-    ungrouped = []
-    groups = {}
-    current_station = [''] * len(Station)
-    current_group = None
-    current_logo = ''
-    entry_count = 0
+    def _detect_encoding(self, prefix):
+        """Detect the encoding from the first bytes of the file"""
+        try:
+            result = detect(prefix)
+            encoding = result['encoding'] if result and result['encoding'] else 'utf-8'
+            # Normalize encoding names
+            if encoding.lower() in ['iso-8859-1', 'cp1252', 'windows-1252']:
+                encoding = 'latin-1'
+            # Only the prefix was checked; an ASCII prefix may be
+            # followed by UTF-8 names, so decode it as UTF-8
+            elif codecs.lookup(encoding).name == 'ascii':
+                encoding = 'utf-8'
+        except:
+            encoding = 'utf-8'
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        except LookupError:
+            encoding = 'utf-8'
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        return encoding, decoder
+
+    def _lines(self, stream):
+        """Yield the decoded lines of stream"""
+        chunk = stream.read(self.SNIFF_SIZE)
+        self.encoding, decoder = self._detect_encoding(chunk)
+        pending = ''
+        while chunk:
+            lines = (pending + decoder.decode(chunk)).splitlines(True)
+            # the last line may continue in the next chunk
+            pending = lines.pop() if lines and lines[-1][-1] not in '\r\n' else ''
+            yield from lines
+            chunk = stream.read(self.CHUNK_SIZE)
+        yield from (pending + decoder.decode(b'', True)).splitlines()
+
+    def __iter__(self):
+        self.error = None
+        self.count = 0
+        stream = self._open()
+        if stream is None:
+            return
+        try:
+            with stream:
+                yield from self._parse(self._lines(stream))
+        except Exception as e:
+            self.error = f"Error parsing {self.m3u_path}: {str(e)}"
+
+    def _parse(self, lines):
+        current_station = [''] * len(Station)
+        current_group = None
+        current_logo = ''
+        max_line_chars = self.MAX_LINE_BYTES // 4
 
-    try:
         for line in lines:
-            # Safety checks
-            if len(line.encode('utf-8')) > 4096:
+            # Safety checks (a line of up to MAX_LINE_BYTES / 4
+            # characters cannot be longer than MAX_LINE_BYTES)
+            if len(line) > max_line_chars and \
+                    len(line.rstrip('\r\n').encode('utf-8')) > self.MAX_LINE_BYTES:
                 continue
             line = line.strip()
             if not line or line.startswith("#EXTM3U"):
@@ -532,38 +577,29 @@ def parse_m3u(m3u_path, max_entries=10000):
                         field_name = field_part[0].strip()
                         value = field_part[1].strip()
 
-                        field_map = {
-                            "PROFILE": Station.profile,
-                            "HTTP": Station.http,
-                            "VOLUME": Station.volume,
-                            "PLAYER": Station.player,
-                            "BITRATE": None,
-                            "ENCODING": Station.encoding
-                        }
-
-                        if field_name in field_map and current_station:
+                        if field_name in self._field_map and current_station:
                             if field_name == "BITRATE" and current_station[Station.buffering]:
                                 seconds = current_station[Station.buffering].split('@')[0]
                                 current_station[Station.buffering] = f"{seconds}@{value}"
                             else:
-                                current_station[field_map[field_name]] = value
+                                current_station[self._field_map[field_name]] = value
                 except (ValueError, IndexError):
                     pass
 
             elif line.startswith("#EXTINF"):
-                if entry_count >= max_entries > 0:
-                    clean_temp_file(temp_file_path)
-                    return None, f"Maximum entries ({max_entries}) reached"
+                if self.count >= self.max_entries > 0:
+                    self.error = f"Maximum entries ({self.max_entries}) reached"
+                    return
 
                 if ',' in line:
                     name = clean_name(line.split(',', 1)[1].strip())[:255]
                     name = html_entities_to_unicode_chars(name)
 
                     # FIX: ENCODING RECOVERY FOR STATION NAMES
-                    if '�' in name and encoding != 'utf-8':
+                    if '�' in name and self.encoding != 'utf-8':
                         try:
                             # Try to recover from encoding mismatch
-                            byte_data = name.encode(encoding, errors='replace')
+                            byte_data = name.encode(self.encoding, errors='replace')
                             recovered_name = byte_data.decode('utf-8', errors='replace')
                             if '�' not in recovered_name:
                                 name = recovered_name
@@ -588,31 +624,92 @@ def parse_m3u(m3u_path, max_entries=10000):
                     if ';' in url:  # Remove ICY metadata
                         url = url.split(';')[0]
                     current_station[Station.url] = url
-                    entry_count += 1
+                    self.count += 1
 
-                    # Append the completed station to appropriate group
-                    if current_group:
-                        groups.setdefault(current_group, []).append(current_station)
-                    else:
-                        ungrouped.append(current_station)
+                    yield current_group, current_station
 
                     # Reset for next station
                     current_station = [''] * len(Station)
                     current_logo = ''
 
-        # Build playlist
-        playlist = []
-        playlist.extend(ungrouped)
-        for group in sorted(groups):
-            playlist.append([group, "-"])
-            playlist.extend(groups[group])
+    def playlist(self):
+        """
+        Yield the PyRadio playlist: ungrouped stations first,
+        as they are read, then each group (sorted by name),
+        preceded by its header
+
+        Grouped stations are kept in a temporary file, and
+        only their offsets in it are kept in memory.
+        """
+        with tempfile.TemporaryFile() as spool:
+            offsets = {}
+            pos = 0
+            for group, station in self:
+                if group:
+                    if group not in offsets:
+                        offsets[group] = array('Q')
+                    offsets[group].append(pos)
+                    row = json.dumps(station).encode('utf-8') + b'\n'
+                    spool.write(row)
+                    pos += len(row)
+                else:
+                    yield station
+            if self.error:
+                return
+            spool.flush()
+            for group in sorted(offsets):
+                yield [group, "-"]
+                for offset in offsets[group]:
+                    if offset != pos:
+                        spool.seek(offset)
+                    row = spool.readline()
+                    pos = offset + len(row)
+                    yield json.loads(row)
 
-        clean_temp_file(temp_file_path)
-        return playlist, None
 
-    except Exception as e:
-        clean_temp_file(temp_file_path)
-        return None, f"Error parsing {m3u_path}: {str(e)}"
+def parse_m3u(m3u_path, max_entries=10000):
+    """Convert M3U to playlist with enhanced safety checks"""
+    reader = M3uReader(m3u_path, max_entries)
+    ungrouped = []
+    groups = {}
+    for group, station in reader:
+        # Append the station to appropriate group
+        if group:
+            groups.setdefault(group, []).append(station)
+        else:
+            ungrouped.append(station)
+    if reader.error:
+        return None, reader.error
+
+    # Build playlist
+    playlist = []
+    playlist.extend(ungrouped)
+    for group in sorted(groups):
+        playlist.append([group, "-"])
+        playlist.extend(groups[group])
+    return playlist, None
+
+
+def m3u_to_csv(m3u_path, out_file, max_entries=10000):
+    """
+    Convert M3U to a PyRadio playlist, without reading the
+    whole list in memory
+
+    Returns None on success, an error message otherwise
+    """
+    from .common import CsvReadWrite
+    reader = M3uReader(m3u_path, max_entries)
+    part_file = out_file + '.part.csv'
+    ret = CsvReadWrite().write(a_file=part_file, items=reader.playlist())
+    if reader.error or ret < 0:
+        clean_temp_file(part_file)
+        return reader.error or f'Cannot write CSV file "{out_file}"'
+    try:
+        replace(part_file, out_file)
+    except OSError:
+        clean_temp_file(part_file)
+        return f'Cannot write CSV file "{out_file}"'
+    return None
 
 ##############################################################################
 #
@@ -660,7 +757,7 @@ def list_to_m3u(stations, out_file):
             f.write("#EXTM3U\n")
             current_group = None
 
-            for entry in stations:
+            for count, entry in enumerate(stations, 1):
                 # Handle group headers
                 # Skip empty group names entirely
                 if len(entry) >= 2 and entry[1] == "-":
@@ -729,7 +826,7 @@ def list_to_m3u(stations, out_file):
                         f.write(f"#PYRADIO-BITRATE: {bitrate}\n")
 
                 # Build EXTINF line
-                name = entry[Station.name] if entry[Station.name] else 'Station {}'.format(len(stations))
+                name = entry[Station.name] if entry[Station.name] else 'Station {}'.format(count)
                 # Apply display substitutions (centralized)
                 for n in M3U_SUBSTITUTIONS:
                     name = name.replace(*n)
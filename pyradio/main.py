@@ -19,23 +19,20 @@ try:
 except ImportError:
     from importlib_resources import files, as_file   # backport για 3.7–3.8
 from pathlib import Path
+from importlib.util import find_spec
 
-from .radio import PyRadio
 from .config import PyRadioConfig
 from .install import PyRadioUpdate, PyRadioUpdateOnWindows, PyRadioCache, \
     is_pyradio_user_installed, version_string_to_list, get_github_tag
 from .cjkwrap import cjklen, cjkslices
 from .log import Log
 from .common import StationsChanges, M_STRINGS, CsvReadWrite
-from .schedule import PyRadioScheduleList
 from .install import get_a_linux_resource_opener
 from .html_help import is_graphical_environment_running
-from .client import client
-HAS_CHARSET_NORMALIZER = True
-try:
-    from .m3u import list_to_m3u, parse_m3u
-except ImportError:
-    HAS_CHARSET_NORMALIZER = False
+# m3u (charset_normalizer), the schedule (dateutil), the client and
+# the TUI itself (radio) are imported when needed, so that command
+# line operations do not pay for their imports
+HAS_CHARSET_NORMALIZER = find_spec('charset_normalizer') is not None
 
 try:
     # Windows
@@ -180,6 +177,7 @@ def print_session_is_locked():
     print('       that are currently running and try again.')
 
 def print_active_schedule(a_file):
+    from .schedule import PyRadioScheduleList
     x = PyRadioScheduleList(a_file)
     tasks = x.get_info_of_tasks(HAS_RICH)
     if tasks:
@@ -468,6 +466,22 @@ If nothing else works, try the following command:
              'Prevents server banning by throttling requests to the same host.'
     )
 
+    gr_validate.add_argument(
+        '--recheck-hours',
+        type=int,
+        default=24,
+        help='Do not check again stations found working less than\n'
+             'RECHECK_HOURS ago (default: 24); 0 checks all stations.\n'
+             'Failed stations are checked again at growing intervals.'
+    )
+
+    gr_validate.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Do not resume an interrupted validation;\n'
+             'check all stations again.'
+    )
+
     gr_validate.add_argument(
         '--with-date',
         action='store_true',
@@ -547,7 +561,10 @@ If nothing else works, try the following command:
                 max_per_host=args.max_per_host,
                 with_date=args.with_date,
                 no_color=args.no_color,
-                verbose=not args.quiet
+                verbose=not args.quiet,
+                resume=not args.no_resume,
+                health_file=path.join(pyradio_config.data_dir, 'station-health.json'),
+                recheck_hours=args.recheck_hours
             )
 
             sys.exit(0)
@@ -594,6 +611,7 @@ If nothing else works, try the following command:
                     print(f'[red]Error:[/red] Cannot read CSV file "{in_file}"')
                     sys.exit(1)
 
+                from .m3u import list_to_m3u
                 result = list_to_m3u(csv_handler.items, out_file)
                 if result is not None:  # Returns None on success, error message on failure
                     print(result)
@@ -606,16 +624,12 @@ If nothing else works, try the following command:
                 except (ValueError, TypeError):
                     print(f'[red]Error:[/red] Invalid max entries value "{args.limit}"')
                     sys.exit(1)
-                stations, error = parse_m3u(in_file, max_entries=max_entries)
+                from .m3u import m3u_to_csv
+                error = m3u_to_csv(in_file, out_file, max_entries=max_entries)
                 if error:
                     print(f'[red]Error:[/red] {error}')
                     sys.exit(1)
 
-                ret = csv_handler.write(a_file=out_file, items=stations)
-                if ret < 0:
-                    print(f'[red]Error:[/red] Cannot write CSV file "{out_file}"')
-                    sys.exit(1)
-
                 print(f'[green]Success:[/green] Created CSV file: "{out_file}"')
 
             sys.exit(0)
@@ -1160,6 +1174,7 @@ that window to complete the update process.''')
         pyradio_config.active_remote_control_server_ip = pyradio_config.remote_control_server_ip
         pyradio_config.active_remote_control_server_port = pyradio_config.remote_control_server_port
 
+        from .radio import PyRadio
         pyradio = PyRadio(
             pyradio_config,
             play=args.play,
@@ -1580,6 +1595,7 @@ def csv_vs_m3u_output_filename(input_file, output_dir, resource_type="csv"):
     return in_file_path, out_file_path
 
 def run_client():
+    from .client import client
     client()
 
 if __name__ == '__main__':
@@ -1014,6 +1014,8 @@ Up|, |^P| / |Down|, |^N             <*> Get previous / next history item.
 \?| / |\\                           <*> Insert a "|?|" or a "|\|", respectively.
 Enter| / |Esc                       <*> Perform / cancel search.
 ~term                               <*> Fuzzy search stations on station lists.
+/expression                         <*> Search using a regular expression.
+"words"                             <*> Search for whole words.
 
 Global functions work when preceded with a "|\|".
 '''
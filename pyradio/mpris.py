@@ -7,12 +7,16 @@
 # - Main thread (curses): owns the real player and executes commands
 # - Communication:
 #     DBus thread -> main thread: cmd_queue  (PLAY/STOP/NEXT/PREV/SET_VOLUME)
-#     main thread -> DBus thread: state_queue (updates to properties)
+#         its wakeup_fd becomes readable when a command is queued
+#     main thread -> DBus thread: _MprisThread.post() (updates to properties),
+#         handed to the asyncio loop with call_soon_threadsafe and
+#         merged into one PropertiesChanged signal per burst
 #
 # Main loop integration point:
 #     c = getch()
 #     if c == -1:
-#         mpris.poll()   # drains cmd_queue; applies debounced volume; sends updates to DBus thread
+#         mpris.poll()   # drains cmd_queue; applies debounced volume
+#         mpris.wait()   # sleeps until a key, a command or a due volume change
 #         continue
 
 import os
@@ -311,18 +315,27 @@ class _MprisPlayer(ServiceInterface):
 # -----------------------------------
 
 class _MprisThread:
-    def __init__(self, bus_name, identity, cmd_queue, state_queue):
+    # property changes posted within this time are sent
+    # to D-Bus in one PropertiesChanged signal
+    COALESCE_DELAY = 0.02
+
+    def __init__(self, bus_name, identity, cmd_queue):
         self.bus_name = bus_name
         self.identity = identity
         self.cmdq = cmd_queue
-        self.stateq = state_queue
 
         self._loop = None
         self._thread = None
         self._stop = threading.Event()
+        self._stopped = None
 
         self._player_iface = None
 
+        # property changes waiting to be applied (latest wins)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_requested = False
+
     def start(self):
         if MessageBus is None:
             return False
@@ -339,7 +352,7 @@ class _MprisThread:
         self._stop.set()
         if self._loop:
             try:
-                self._loop.call_soon_threadsafe(lambda: None)
+                self._loop.call_soon_threadsafe(self._wake)
             except Exception:
                 pass
         if self._thread and self._thread.is_alive():
@@ -348,6 +361,43 @@ class _MprisThread:
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('OS-MEDIA: MPRIS Thread stopped')
 
+    def _wake(self):
+        if self._stopped is not None:
+            self._stopped.set()
+
+    def post(self, changed):
+        """
+        Queue property changes for D-Bus (called from any thread)
+
+        Changes posted close together are merged and sent
+        in one go, COALESCE_DELAY after the first one.
+        """
+        with self._pending_lock:
+            self._pending.update(changed)
+            if self._flush_requested:
+                return
+            self._flush_requested = True
+            loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(loop.call_later, self.COALESCE_DELAY, self._flush)
+            except RuntimeError:
+                # loop closed
+                pass
+
+    def _flush(self):
+        with self._pending_lock:
+            self._flush_requested = False
+            if self._player_iface is None or not self._pending:
+                # not on the bus yet; _main() flushes when it is
+                return
+            changed, self._pending = self._pending, {}
+        try:
+            self._player_iface.apply_changed(changed)
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"MPRIS: player.apply_changed failed: {changed = } - {e}")
+
     def _run(self):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('OS-MEDIA: MPRIS Thread starting')
@@ -389,7 +439,6 @@ class _MprisThread:
 
         root = _MprisRoot(identity=self.identity, has_track_list=False)
         player = _MprisPlayer(self.cmdq)
-        self._player_iface = player
 
         # Export FIRST so clients that react immediately can introspect safely
         bus.export(OBJ_PATH, root)
@@ -417,20 +466,19 @@ class _MprisThread:
             return
 
         try:
-            # Consume state updates coming from main thread and apply to DBus properties
-            while not self._stop.is_set():
-                try:
-                    changed = self.stateq.get_nowait()
-                except queue.Empty:
-                    await asyncio.sleep(0.01)
-                    continue
-                try:
-                    player.apply_changed(changed)
-                except Exception as e:
-                    if logger.isEnabledFor(logging.ERROR):
-                        logger.error(f"MPRIS: player.apply_changed failed: {changed = } - {e}")
+            # State updates from the main thread arrive through post();
+            # apply whatever was posted before we got on the bus and
+            # sleep until asked to stop
+            self._stopped = asyncio.Event()
+            with self._pending_lock:
+                self._player_iface = player
+            self._flush()
+            if not self._stop.is_set():
+                await self._stopped.wait()
 
         finally:
+            with self._pending_lock:
+                self._player_iface = None
             # Deterministic shutdown: unexport -> release name -> disconnect
             try:
                 bus.unexport(OBJ_PATH)
@@ -481,7 +529,7 @@ class MprisController(MediaControls):
         # self.bus_name = "org.mpris.MediaPlayer2." + instance_name
         self.bus_name = "org.mpris.MediaPlayer2.pyradio"
 
-        self._thread = _MprisThread(self.bus_name, self.identity, self._cmdq, self._stateq)
+        self._thread = _MprisThread(self.bus_name, self.identity, self._cmdq)
 
     # ------------- main-loop servicing -------------
 
@@ -563,4 +611,7 @@ class MprisController(MediaControls):
             md["xesam:url"] = url
         if art_url:
             md["mpris:artUrl"] = art_url
-        self._stateq.put({"Metadata": md})
+        self._post_state({"Metadata": md})
+
+    def _post_state(self, changed):
+        self._thread.post(changed)
@@ -7,11 +7,59 @@ import time
 import queue
 import locale
 import logging
+from select import select
 
 locale.setlocale(locale.LC_ALL, "")
 
 logger = logging.getLogger(__name__)
 
+class CommandQueue(queue.Queue):
+    """
+    A queue.Queue that also makes a pipe readable whenever
+    an item is put in it, so that the curses loop can
+    select() on it instead of polling.
+
+    fd is the pipe's read end (None where select() does
+    not work on pipes, i.e. on Windows).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.fd = self._wfd = None
+        if os.name != 'nt':
+            try:
+                self.fd, self._wfd = os.pipe()
+                os.set_blocking(self.fd, False)
+                os.set_blocking(self._wfd, False)
+            except OSError:
+                self.fd = self._wfd = None
+
+    def __del__(self):
+        for fd in (self.fd, self._wfd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _put(self, item):
+        super()._put(item)
+        if self._wfd is not None:
+            try:
+                os.write(self._wfd, b'.')
+            except OSError:
+                # pipe full: the reader is awake already
+                pass
+
+    def clear_wakeup(self):
+        if self.fd is not None:
+            try:
+                while os.read(self.fd, 512):
+                    pass
+            except OSError:
+                pass
+
+
 class MediaControls:
     """
     Main-thread owner. You:
@@ -29,7 +77,7 @@ class MediaControls:
         self.identity = identity
         self.default_icon = default_icon
 
-        self._cmdq = queue.Queue()
+        self._cmdq = CommandQueue()
         self._stateq = queue.Queue()
 
         # callbacks (set via set_callbacks)
@@ -66,6 +114,43 @@ class MediaControls:
 
     # ------------- main-loop servicing -------------
 
+    # longest time wait() blocks; curses takes the terminal's
+    # SIGWINCH, which does not wake select() up
+    IDLE_TIMEOUT = 0.5
+
+    @property
+    def wakeup_fd(self):
+        """
+        The fd that becomes readable when a command arrives,
+        or None if wait() cannot be used
+        """
+        return getattr(self._cmdq, 'fd', None)
+
+    def wait(self, input_fd):
+        """
+        Block until input_fd (the terminal) is readable, a
+        command arrives or a pending volume change is due.
+
+        Call it after poll(), when getch() returned -1.
+        Returns True if the terminal should be read.
+        """
+        timeout = self.IDLE_TIMEOUT
+        volume_due = False
+        if self._vol_pending is not None:
+            remaining = self._vol_debounce_sec - (time.monotonic() - self._vol_last_req_ts)
+            if remaining < timeout:
+                timeout = max(remaining, 0)
+                volume_due = True
+        try:
+            ready, _, _ = select([input_fd, self.wakeup_fd], [], [], timeout)
+        except (OSError, ValueError):
+            return True
+        if self.wakeup_fd in ready:
+            self._cmdq.clear_wakeup()
+        if input_fd in ready:
+            return True
+        return not ready and not volume_due
+
     def poll(self, enabled):
         if enabled:
             self._apply_pending_volume_if_due()
@@ -103,10 +188,10 @@ class MediaControls:
 
     def update_playback(self, is_playing):
         status = "Playing" if is_playing else "Stopped"
-        self._stateq.put({"PlaybackStatus": status})
+        self._post_state({"PlaybackStatus": status})
 
     def update_nav_caps(self, can_prev, can_next):
-        self._stateq.put({"CanGoPrevious": bool(can_prev), "CanGoNext": bool(can_next)})
+        self._post_state({"CanGoPrevious": bool(can_prev), "CanGoNext": bool(can_next)})
 
     def update_volume_percent(self, vol_percent):
         try:
@@ -117,11 +202,17 @@ class MediaControls:
             vp = 0
         elif vp > 100:
             vp = 100
-        self._stateq.put({"Volume": vp / 100.0})
+        self._post_state({"Volume": vp / 100.0})
 
     def update_metadata(self, trackid, title, station_name, playlist_name, url=None, art_url=None):
         pass
 
+    def _post_state(self, changed):
+        """
+        Send property changes to the OS media thread
+        """
+        self._stateq.put(changed)
+
     def make_trackid(self, playlist_gen, index):
         # stable object path
         return "/org/mpris/MediaPlayer2/track/pl_{}/st_{}".format(int(playlist_gen), int(index))
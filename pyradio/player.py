@@ -8,11 +8,15 @@ import logging
 from os.path import expanduser
 from platform import uname as platform_uname
 from sys import platform
-from time import sleep
+from time import sleep, monotonic
 from datetime import datetime
 import collections
+import codecs
+import re
 import json
 import socket
+import select
+import selectors
 from shutil import copyfile as shutil_copy_file
 import locale
 try:
@@ -266,6 +270,97 @@ def info_dict_to_list(info, fix_highlight, max_width, win_width):
     # logger.error('DE a_list\n\n{}\n\n'.format(a_list))
     return a_list
 
+''' PlayerOutputClassifier instances, keyed by PLAYER_NAME '''
+_OUTPUT_CLASSIFIERS = {}
+
+PlayerOutputEvent = collections.namedtuple(
+    'PlayerOutputEvent', ['kind', 'http_error', 'audio_tokens']
+)
+
+class PlayerOutputClassifier():
+    ''' Classify a line of player (mplayer, vlc) output
+
+        The HTTP error tokens are compiled into a single regular
+        expression, so that the thirteen error rules are only
+        examined for the (rare) lines that contain one of them;
+        the rest of the tokens are few, and plain substring tests
+        are faster for them than a regular expression would be.
+        The events that carry no data are created once, and the
+        audio info events are cached by their tokens.
+
+        The precedence of the original tests is kept:
+            http error > volume > playback > icy title > audio info
+    '''
+
+    NONE = 0
+    VOLUME = 1
+    PLAYBACK = 2
+    ICY_TITLE = 3
+    AUDIO_INFO = 4
+
+    ''' (http error, tokens); a rule matches when all its
+        tokens are found in the line, and rules are checked
+        in the order they appear here '''
+    HTTP_ERROR_RULES = (
+        (404, ('404', 'Not Available')),
+        (1005, ('Name or service not known', )),
+        (1005, ("Couldn't resolve name for AF_INET:", )),
+        (1006, ('cannot connect to ', )),
+        (503, ('Server returned 503', )),
+        (503, ('503 All backends failed or unhealthy', )),
+        (503, ('HTTP 503 error', )),
+        (1001, ('debug: dead input', )),
+        (1001, ('Failed to open http', )),
+        (1001, ('debug: nothing to play', )),
+        (1002, ('No stream found', )),
+        (1008, ('Cannot find codec for audio format', )),
+        (1008, ('Audio: no sound', )),
+    )
+
+    def __init__(self, volume_string, playback_tokens, icy_tokens, icy_audio_tokens):
+        self._volume_string = volume_string
+        self._playback_tokens = tuple(playback_tokens)
+        self._icy_tokens = tuple(icy_tokens)
+        ''' keep the order of the audio tokens dict '''
+        self._icy_audio_tokens = tuple(icy_audio_tokens)
+        self._http_search = re.compile('|'.join(
+            re.escape(x) for _, rule_tokens in self.HTTP_ERROR_RULES
+            for x in rule_tokens
+        )).search
+        self._audio_events = {}
+        self._no_event = PlayerOutputEvent(self.NONE, False, ())
+        self._volume_event = PlayerOutputEvent(self.VOLUME, False, ())
+        self._playback_event = PlayerOutputEvent(self.PLAYBACK, False, ())
+        self._icy_title_event = PlayerOutputEvent(self.ICY_TITLE, False, ())
+
+    def classify(self, a_line):
+        ''' Return a PlayerOutputEvent for a_line '''
+        if self._http_search(a_line) is not None:
+            for http_error, rule_tokens in self.HTTP_ERROR_RULES:
+                for x in rule_tokens:
+                    if x not in a_line:
+                        break
+                else:
+                    return PlayerOutputEvent(self.NONE, http_error, ())
+        if self._volume_string in a_line:
+            return self._volume_event
+        for x in self._playback_tokens:
+            if x in a_line:
+                return self._playback_event
+        for x in self._icy_tokens:
+            if x in a_line:
+                return self._icy_title_event
+        audio_tokens = tuple([x for x in self._icy_audio_tokens if x in a_line])
+        if audio_tokens:
+            try:
+                return self._audio_events[audio_tokens]
+            except KeyError:
+                event = self._audio_events[audio_tokens] = PlayerOutputEvent(
+                    self.AUDIO_INFO, False, audio_tokens
+                )
+                return event
+        return self._no_event
+
 class Player():
     ''' Media player class. Playing is handled by player sub classes '''
     process = None
@@ -310,7 +405,18 @@ class Player():
     _station_encoding = 'utf-8'
 
     # used to stop mpv update thread on python3
-    stop_mpv_status_update_thread = False
+    _stop_mpv_status_update_thread = False
+
+    # (read, write) pipe used to wake the mpv update thread up
+    _mpv_wakeup_fds = None
+
+    ''' limits (in seconds) of the exponential backoff
+        used while waiting for mpv to create its socket '''
+    MPV_CONNECT_MIN_DELAY = 0.01
+    MPV_CONNECT_MAX_DELAY = 0.25
+
+    # persistent mpv IPC connection (MpvIpcClient)
+    _mpv_ipc = None
 
     # used to stop vlc update thread on windows
     stop_win_vlc_status_update_thread = False
@@ -398,6 +504,16 @@ class Player():
         # per station buffering
         self._buffering_data = None
 
+    @property
+    def stop_mpv_status_update_thread(self):
+        return self._stop_mpv_status_update_thread
+
+    @stop_mpv_status_update_thread.setter
+    def stop_mpv_status_update_thread(self, value):
+        self._stop_mpv_status_update_thread = value
+        if value:
+            self._wake_mpv_status_thread()
+
     def _return_false(self):
         return False
 
@@ -862,6 +978,21 @@ class Player():
                 pass
             self.delay_thread = None
 
+    def _get_output_classifier(self):
+        ''' Return the (cached) PlayerOutputClassifier for this player '''
+        try:
+            return _OUTPUT_CLASSIFIERS[self.PLAYER_NAME]
+        except KeyError:
+            pass
+        classifier = PlayerOutputClassifier(
+            self.volume_string,
+            self._playback_token_tuple,
+            self.icy_tokens,
+            self.icy_audio_tokens
+        )
+        _OUTPUT_CLASSIFIERS[self.PLAYER_NAME] = classifier
+        return classifier
+
     def _is_in_playback_token(self, a_string):
         for a_token in self._playback_token_tuple:
             if a_token in a_string:
@@ -895,18 +1026,24 @@ class Player():
                 self.oldUserInput['Title'] = M_STRINGS['buffering_'] + self.name
             else:
                 self.oldUserInput['Title'] = M_STRINGS['playing_'] + self.name
+        classifier = self._get_output_classifier()
+        try:
+            encoding = codecs.lookup(self._station_encoding).name
+        except LookupError:
+            encoding = 'utf-8'
         try:
             out = self.process.stdout
             while True:
                 http_error=False
                 subsystemOutRaw = out.readline()
-                with recording_lock:
-                    try:
-                        subsystemOut = subsystemOutRaw.decode(self._station_encoding, 'replace')
-                    except:
-                        subsystemOut = subsystemOutRaw.decode('utf-8', 'replace')
+                subsystemOut = subsystemOutRaw.decode(encoding, 'replace')
+                a_line = subsystemOut.strip().replace('\r', '').replace('\n', '')
                 with recording_lock:
                     is_accepted = self._is_accepted_input(subsystemOut)
+                    is_new_input = is_accepted and \
+                        self.oldUserInput['Input'] != a_line
+                    if is_new_input:
+                        self.oldUserInput['Input'] = a_line
                 if logger.isEnabledFor(logging.DEBUG) and \
                         log_player_input() == 2:
                     logger.debug(
@@ -927,48 +1064,22 @@ class Player():
                 if not is_accepted:
                     continue
 
-                if '404' in subsystemOut and 'Not Available' in subsystemOut:
-                    http_error = 404
-                elif 'Name or service not known' in subsystemOut or \
-                        "Couldn't resolve name for AF_INET:" in subsystemOut:
-                        # ("Couldn't resolve name for AF_INET:" in subsystemOut and \
-                        # "Couldn't resolve name for AF_INET6:" in subsystemOut):
-                    http_error = 1005
-                elif 'cannot connect to ' in subsystemOut:
-                    http_error = 1006
-                elif 'Server returned 503' in subsystemOut or \
-                        '503 All backends failed or unhealthy' in subsystemOut or \
-                        'HTTP 503 error' in subsystemOut:
-                    http_error = 503
-                elif 'debug: dead input' in subsystemOut or \
-                        'Failed to open http' in subsystemOut or \
-                        'debug: nothing to play' in subsystemOut:
-                    http_error = 1001
-                elif 'No stream found' in subsystemOut:
-                    http_error = 1002
-                elif 'Cannot find codec for audio format' in subsystemOut or \
-                        'Audio: no sound' in subsystemOut:
-                    http_error = 1008
-
+                subsystemOut = a_line
+                event = classifier.classify(subsystemOut)
+                http_error = event.http_error
                 if http_error:
                     if logger.isEnabledFor(logging.INFO):
-                        logger.info('----==== playbak stopped, reason: "{}" ====----'.format(subsystemOut.strip()))
+                        logger.info('----==== playbak stopped, reason: "{}" ====----'.format(subsystemOut))
                     break
 
-                subsystemOut = subsystemOut.strip()
-                subsystemOut = subsystemOut.replace('\r', '').replace('\n', '')
                 # logger.error('DE subsystemOut = "{0}"'.format(subsystemOut))
                 if logger.isEnabledFor(logging.DEBUG) and \
                         log_player_input() == 1:
                     logger.debug(f'PLAYER: "{subsystemOut}"')
 
-                with recording_lock:
-                    tmp = self.oldUserInput['Input']
-                if tmp != subsystemOut:
-                    with recording_lock:
-                        self.oldUserInput['Input'] = subsystemOut
-                        self_volume_string = self.volume_string
-                    if self_volume_string in subsystemOut:
+                if is_new_input:
+                    self_volume_string = self.volume_string
+                    if event.kind == classifier.VOLUME:
                         # disable volume for mpv
                         if self.PLAYER_NAME != 'mpv':
                             # logger.error('***** volume')
@@ -1000,9 +1111,10 @@ class Player():
                                 if self_show_volume and self_oldUserInput_Title:
                                     self.outputStream.write(msg_id=STATES.VOLUME, msg=string_to_show, counter='')
                                     self.threadUpdateTitle()
-                    elif self._is_in_playback_token(subsystemOut):
+                    elif event.kind == classifier.PLAYBACK:
                         self.stop_timeout_counter_thread = True
                         try:
+                            self.connection_timeout_thread.cancel()
                             self.connection_timeout_thread.join()
                         except:
                             pass
@@ -1063,7 +1175,7 @@ class Player():
                                         counter=''
                                         )
                         # logger.error('DE 3 {}'.format(self._icy_data))
-                    elif self._is_icy_entry(subsystemOut):
+                    elif event.kind == classifier.ICY_TITLE:
                         if not subsystemOut.endswith('Icy-Title=(null)'):
                             if enable_crash_detection_function:
                                 enable_crash_detection_function()
@@ -1073,6 +1185,7 @@ class Player():
                             ok_to_display = False
                             self.stop_timeout_counter_thread = True
                             try:
+                                self.connection_timeout_thread.cancel()
                                 self.connection_timeout_thread.join()
                             except:
                                 pass
@@ -1135,42 +1248,42 @@ class Player():
                     #        self.oldUserInput['Title'] = M_STRINGS['connecting_'] + self.name
                     #        self.outputStream.write(msg=self.oldUserInput['Title'], counter='')
 
-                    else:
-                        for a_token in self.icy_audio_tokens:
-                            if a_token in subsystemOut:
-                                if not self.playback_is_on:
-                                    if logger.isEnabledFor(logging.INFO):
-                                        logger.info('*** updateStatus(): Start of playback detected (Icy audio token received) ***')
-                                        on_connect()
-                                        if self.mpris():
-                                            self.mpris().update_playback(True)
-                                            self.mpris().update_nav_caps(True, True)
-                                self.stop_timeout_counter_thread = True
-                                try:
-                                    self.connection_timeout_thread.join()
-                                except:
-                                    pass
-                                self.playback_is_on = True
-                                self.connecting = False
-                                self.stations_history_add_function()
-                                if enable_crash_detection_function:
-                                    enable_crash_detection_function()
-                                # logger.error('DE token = "{}"'.format(a_token))
-                                # logger.error('DE icy_audio_tokens[a_token] = "{}"'.format(self.icy_audio_tokens[a_token]))
-                                a_str = subsystemOut.split(a_token)
-                                # logger.error('DE str = "{}"'.format(a_str))
-                                with self.status_update_lock:
-                                    if self.icy_audio_tokens[a_token] == 'icy-br':
-                                        self._icy_data[self.icy_audio_tokens[a_token]] = a_str[1].replace('kbit/s', '')
-                                    else:
-                                        self._icy_data[self.icy_audio_tokens[a_token]] = a_str[1]
-                                    if self.icy_audio_tokens[a_token] == 'codec':
-                                        if '[' in self._icy_data['codec']:
-                                            self._icy_data['codec-name'] = self._icy_data['codec'].split('] ')[0].replace('[', '')
-                                            self._icy_data['codec'] = self._icy_data['codec'].split('] ')[1]
-                                    if 'codec-name' in self._icy_data:
-                                        self._icy_data['codec-name'] = self._icy_data['codec-name'].replace('"', '')
-                                # logger.error('DE audio data\n\n{}\n\n'.format(self._icy_data))
+                    elif event.kind == classifier.AUDIO_INFO:
+                        for a_token in event.audio_tokens:
+                            if not self.playback_is_on:
+                                if logger.isEnabledFor(logging.INFO):
+                                    logger.info('*** updateStatus(): Start of playback detected (Icy audio token received) ***')
+                                    on_connect()
+                                    if self.mpris():
+                                        self.mpris().update_playback(True)
+                                        self.mpris().update_nav_caps(True, True)
+                            self.stop_timeout_counter_thread = True
+                            try:
+                                self.connection_timeout_thread.cancel()
+                                self.connection_timeout_thread.join()
+                            except:
+                                pass
+                            self.playback_is_on = True
+                            self.connecting = False
+                            self.stations_history_add_function()
+                            if enable_crash_detection_function:
+                                enable_crash_detection_function()
+                            # logger.error('DE token = "{}"'.format(a_token))
+                            # logger.error('DE icy_audio_tokens[a_token] = "{}"'.format(self.icy_audio_tokens[a_token]))
+                            a_str = subsystemOut.split(a_token)
+                            # logger.error('DE str = "{}"'.format(a_str))
+                            with self.status_update_lock:
+                                if self.icy_audio_tokens[a_token] == 'icy-br':
+                                    self._icy_data[self.icy_audio_tokens[a_token]] = a_str[1].replace('kbit/s', '')
+                                else:
+                                    self._icy_data[self.icy_audio_tokens[a_token]] = a_str[1]
+                                if self.icy_audio_tokens[a_token] == 'codec':
+                                    if '[' in self._icy_data['codec']:
+                                        self._icy_data['codec-name'] = self._icy_data['codec'].split('] ')[0].replace('[', '')
+                                        self._icy_data['codec'] = self._icy_data['codec'].split('] ')[1]
+                                if 'codec-name' in self._icy_data:
+                                    self._icy_data['codec-name'] = self._icy_data['codec-name'].replace('"', '')
+                            # logger.error('DE audio data\n\n{}\n\n'.format(self._icy_data))
                         try:
                             if self._can_update_br(self._icy_data['icy-br']):
                                 self.update_bitrate(self._icy_data['icy-br'])
@@ -1306,24 +1419,51 @@ class Player():
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug('MPV updateStatus thread started.')
 
+        ''' wakeup is readable when the thread is asked to stop '''
+        wakeup = None
+        if not platform.startswith('win'):
+            wakeup = self._get_mpv_wakeup_pipe()
+
+        ''' wait for mpv to create the socket,
+            backing off exponentially between attempts '''
         sock = None
+        attempts = 0
+        delay = self.MPV_CONNECT_MIN_DELAY
+        connect_start = monotonic()
         while True:
             if stop():
                 if logger.isEnabledFor(logging.INFO):
                     logger.info('MPV updateStatus thread stopped (no connection to socket).')
                 return
+            attempts += 1
             try:
                 sock = self._connect_to_socket(self.mpvsocket)
                 if sock:
                     break
             except Exception:
                 pass
+            if wakeup is None:
+                sleep(delay)
+            else:
+                select.select([wakeup], [], [], delay)
+            delay = min(2 * delay, self.MPV_CONNECT_MAX_DELAY)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('MPV socket connected after {0} attempt(s) in {1:.3f} sec'.format(
+                attempts, monotonic() - connect_start))
         if stop():
             if logger.isEnabledFor(logging.INFO):
                 logger.info('MPV updateStatus thread was aeked to stopp. Terminating...')
             if sock:
                 self._close_pipe(sock)
             return
+        selector = None
+        if not platform.startswith('win'):
+            ''' share this connection with the command functions '''
+            sock = MpvIpcClient(sock)
+            self._mpv_ipc = sock
+            selector = selectors.DefaultSelector()
+            selector.register(sock, selectors.EVENT_READ)
+            selector.register(wakeup, selectors.EVENT_READ)
         # Send data
         message = b'{ "command": ["observe_property", 1, "metadata"] }\n'
         try:
@@ -1339,6 +1479,15 @@ class Player():
             while True:
                 if stop():
                     break
+                if selector is not None:
+                    ''' sleep until mpv sends data or
+                        we are asked to stop '''
+                    events = selector.select()
+                    if stop():
+                        break
+                    if not [x for x in events if x[0].fileobj is sock]:
+                        self._drain_mpv_wakeup_pipe()
+                        continue
                 try:
                     if platform.startswith('win'):
                         try:
@@ -1352,6 +1501,12 @@ class Player():
                             data = b''
                     self._chapter_time = datetime.now()
                     a_data = self._fix_returned_data(data)
+                    if a_data and self._mpv_ipc is sock:
+                        ''' keep only complete lines not
+                            claimed by a pending request '''
+                        a_data = sock.feed(a_data)
+                        if not a_data:
+                            continue
                     if logger.isEnabledFor(logging.DEBUG) and \
                             log_player_input() > 0:
                         logger.debug('PLAYER: "%r"', a_data)
@@ -1475,6 +1630,10 @@ class Player():
                                     pass
                 finally:
                     pass
+        if selector is not None:
+            selector.close()
+        if self._mpv_ipc is sock:
+            self._mpv_ipc = None
         self._close_pipe(sock)
 
         if not stop():
@@ -1494,6 +1653,36 @@ class Player():
             logger.info('MPV updateStatus thread stopped.')
         self._clear_empty_mkv()
 
+    def _get_mpv_wakeup_pipe(self):
+        ''' Return the read end of the pipe used to wake up
+            the mpv status thread when it is asked to stop
+
+            The pipe is created on first use and reused for
+            every mpv instance; stale wakeups are discarded.
+        '''
+        if self._mpv_wakeup_fds is None:
+            self._mpv_wakeup_fds = os.pipe()
+            for n in self._mpv_wakeup_fds:
+                os.set_blocking(n, False)
+        else:
+            self._drain_mpv_wakeup_pipe()
+        return self._mpv_wakeup_fds[0]
+
+    def _drain_mpv_wakeup_pipe(self):
+        try:
+            while os.read(self._mpv_wakeup_fds[0], 512):
+                pass
+        except (OSError, TypeError):
+            pass
+
+    def _wake_mpv_status_thread(self):
+        if self._mpv_wakeup_fds is not None:
+            try:
+                os.write(self._mpv_wakeup_fds[1], b'\0')
+            except OSError:
+                ''' pipe full; thread already woken up '''
+                pass
+
     def _close_pipe(self, sock):
         if platform.startswith('win'):
             win32file.CloseHandle(sock)
@@ -1601,6 +1790,7 @@ class Player():
                             break
                         self.stop_timeout_counter_thread = True
                         try:
+                            self.connection_timeout_thread.cancel()
                             self.connection_timeout_thread.join()
                         except:
                             pass
@@ -1653,6 +1843,7 @@ class Player():
                         if not self.playback_is_on:
                             self.stop_timeout_counter_thread = True
                             try:
+                                self.connection_timeout_thread.cancel()
                                 self.connection_timeout_thread.join()
                             except:
                                 pass
@@ -1662,6 +1853,7 @@ class Player():
                                 on_connect()
                         self.stop_timeout_counter_thread = True
                         try:
+                            self.connection_timeout_thread.cancel()
                             self.connection_timeout_thread.join()
                         except:
                             pass
@@ -1708,6 +1900,7 @@ class Player():
                             if a_token in subsystemOut:
                                 self.stop_timeout_counter_thread = True
                                 try:
+                                    self.connection_timeout_thread.cancel()
                                     self.connection_timeout_thread.join()
                                 except:
                                     pass
@@ -2000,6 +2193,7 @@ class Player():
     def _set_mpv_playback_is_on(self, stop, enable_crash_detection_function):
         self.stop_timeout_counter_thread = True
         try:
+            self.connection_timeout_thread.cancel()
             self.connection_timeout_thread.join()
         except:
             pass
@@ -2008,6 +2202,7 @@ class Player():
             logger.info('*** _set_mpv_playback_is_on(): Start of playback detected ***')
         self.stop_timeout_counter_thread = True
         try:
+            self.connection_timeout_thread.cancel()
             self.connection_timeout_thread.join()
         except:
             pass
@@ -2111,6 +2306,8 @@ class Player():
         '''
         with self._recording_lock:
             self.stop_timeout_counter_thread = True
+            if self.connection_timeout_thread is not None:
+                self.connection_timeout_thread.cancel()
             self.connecting = False
             self.playback_is_on = True
             the_title = self.oldUserInput['Title']
@@ -2278,6 +2475,11 @@ class Player():
             self.log.add_chapters_function = None
 
         # start playback check timer thread
+        ''' the flag is shared by all countdowns; make sure the
+            one of the previous station is not running anymore '''
+        if self.connection_timeout_thread is not None:
+            self.connection_timeout_thread.cancel()
+            self.connection_timeout_thread.join()
         self.stop_timeout_counter_thread = False
         if self.playback_timeout > 0:
             ''' set connecting here insead of Player.play()
@@ -2285,15 +2487,14 @@ class Player():
             '''
             self.connecting = True
             try:
-                self.connection_timeout_thread = threading.Thread(
-                    target=self.playback_timeout_counter,
-                    args=(self.playback_timeout,
-                          self.name,
-                          lambda: self.stop_timeout_counter_thread)
+                ''' returns the ScheduledCall counting down '''
+                self.connection_timeout_thread = self.playback_timeout_counter(
+                    self.playback_timeout,
+                    self.name,
+                    lambda: self.stop_timeout_counter_thread
                 )
-                self.connection_timeout_thread.start()
                 if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('playback detection thread started')
+                    logger.debug('playback detection timer started')
             except:
                 self.connecting = False
                 self.connection_timeout_thread = None
@@ -2395,6 +2596,7 @@ class Player():
         ''' Here is fallback solution and cleanup '''
         self.stop_timeout_counter_thread = True
         try:
+            self.connection_timeout_thread.cancel()
             self.connection_timeout_thread.join()
         except:
             pass
@@ -2585,6 +2787,144 @@ class Player():
             Currently implemented for vlc only.'''
         return True
 
+class MpvIpcClient():
+    ''' A long lived connection to mpv's JSON IPC socket
+
+        One instance is created by Player.updateMPVStatus for each
+        mpv process, wrapping the socket it already uses to observe
+        properties. The status thread keeps reading from it and
+        passes everything it receives through feed(); replies that
+        carry a request_id issued by request() are handed back to
+        the thread that asked for them, everything else (events,
+        observed properties, the status thread's own requests) is
+        returned to the status thread for processing.
+
+        Any other thread can send commands through request() without
+        opening a new connection to mpv.
+
+        Not used on Windows, where the named pipe is opened in
+        synchronous message mode and cannot be read and written
+        concurrently.
+    '''
+
+    ''' request ids below this are reserved for the
+        fixed requests sent by the status thread '''
+    FIRST_REQUEST_ID = 10000
+
+    def __init__(self, sock):
+        self._sock = sock
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}
+        self._request_id = self.FIRST_REQUEST_ID
+        self._buffer = b''
+        self._reader_id = threading.get_ident()
+        self.connected = True
+
+    def sendall(self, data):
+        ''' Write data to the socket; safe to call from any thread '''
+        with self._write_lock:
+            self._sock.sendall(data)
+
+    def fileno(self):
+        return self._sock.fileno()
+
+    def recvmsg(self, bufsize):
+        return self._sock.recvmsg(bufsize)
+
+    def close(self):
+        ''' Close the connection and release any thread
+            still waiting for a reply '''
+        self.connected = False
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending = {}
+        for a_request in pending:
+            a_request[0].set()
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    def usable(self):
+        ''' True if request() can be used by the calling thread '''
+        return self.connected and \
+            threading.get_ident() != self._reader_id
+
+    def request(self, command, timeout=1.0):
+        ''' Send a command to mpv and wait for its reply
+
+            Parameters
+            ==========
+            command
+                The command, as a list (e.g. ["get_property", "volume"])
+            timeout
+                Seconds to wait for the reply
+
+            Returns
+            =======
+            The reply as a (json_line, dict) tuple, or None if the
+            connection is not usable (closed, or called from the
+            status thread itself, which would dead lock) or no
+            reply arrived in time.
+        '''
+        if not self.usable():
+            return None
+        with self._pending_lock:
+            self._request_id += 1
+            request_id = self._request_id
+            a_request = [threading.Event(), None]
+            self._pending[request_id] = a_request
+        message = json.dumps(
+            {'command': command, 'request_id': request_id}
+        ).encode('utf-8') + b'\n'
+        try:
+            self.sendall(message)
+        except OSError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            return None
+        a_request[0].wait(timeout)
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
+        return a_request[1]
+
+    def feed(self, data):
+        ''' Process data read from the socket
+
+            Complete lines are extracted (partial lines are kept
+            until the rest of them arrives); replies to pending
+            requests are delivered to their callers.
+
+            Returns
+            =======
+            The remaining complete lines, joined with b'\\n'
+        '''
+        self._buffer += data
+        if b'\n' not in self._buffer:
+            return b''
+        lines = self._buffer.split(b'\n')
+        self._buffer = lines.pop()
+        remaining = []
+        for a_line in lines:
+            if not a_line:
+                continue
+            if b'"request_id"' in a_line and self._pending:
+                try:
+                    d = json.loads(a_line)
+                except ValueError:
+                    d = None
+                if d:
+                    with self._pending_lock:
+                        a_request = self._pending.get(d.get('request_id'))
+                    if a_request is not None:
+                        a_request[1] = (a_line, d)
+                        a_request[0].set()
+                        continue
+            remaining.append(a_line)
+        return b'\n'.join(remaining)
+
+
 class MpvPlayer(Player):
     '''Implementation of Player object for MPV'''
 
@@ -2603,13 +2943,16 @@ class MpvPlayer(Player):
     else:
         executable_found = False
 
-    if executable_found:
-        ''' items of this tuple are considered icy-title
-            and get displayed after first icy-title is received '''
-        icy_tokens = ('icy-title: ', 'Title: ')
+    ''' items of this tuple are considered icy-title
+        and get displayed after first icy-title is received '''
+    icy_tokens = ('icy-title: ', 'Title: ')
 
-        icy_audio_tokens = {}
+    icy_audio_tokens = {}
+
+    ''' String to denote volume change '''
+    volume_string = 'Volume: '
 
+    if executable_found:
         ''' USE_PROFILE
             -1 : not checked yet
              0 : do not use
@@ -2620,8 +2963,6 @@ class MpvPlayer(Player):
         ''' True if profile comes from ~/.config/mpv/mpv.conf '''
         PROFILE_FROM_USER = False
 
-        ''' String to denote volume change '''
-        volume_string = 'Volume: '
         if platform.startswith('win'):
             mpvsocket = r'\\.\pipe\mpvsocket.{}'.format(os.getpid())
         else:
@@ -2634,11 +2975,11 @@ class MpvPlayer(Player):
         max_vol = 130
 
         commands = {
-                'volume_up':   b'{ "command": ["cycle", "volume", "up"], "request_id": 1000 }\n',
-                'volume_down': b'{ "command": ["cycle", "volume", "down"], "request_id": 1001 }\n',
-                'mute':        b'{ "command": ["cycle", "mute"], "request_id": 1002 }\n',
-                'pause':       b'{ "command": ["cycle", "pause"], "request_id": 1003 }\n',
-                'quit':        b'{ "command": ["quit"], "request_id": 1004}\n',
+                'volume_up':   ['cycle', 'volume', 'up'],
+                'volume_down': ['cycle', 'volume', 'down'],
+                'mute':        ['cycle', 'mute'],
+                'pause':       ['cycle', 'pause'],
+                'quit':        ['quit'],
                 }
 
         ''' if found in built options, buffering is ON '''
@@ -2846,6 +3187,9 @@ class MpvPlayer(Player):
         return self._get_pause_status()
 
     def _get_pause_status(self):
+        ret = self._mpv_ipc_get_property('pause')
+        if isinstance(ret, bool):
+            return ret
         while True:
             sock = self._connect_to_socket(self.mpvsocket)
             try:
@@ -2892,6 +3236,9 @@ class MpvPlayer(Player):
         return self._get_mute_status()
 
     def _get_mute_status(self):
+        ret = self._mpv_ipc_get_property('mute')
+        if isinstance(ret, bool):
+            return ret
         while True:
             sock = self._connect_to_socket(self.mpvsocket)
             try:
@@ -3012,6 +3359,29 @@ class MpvPlayer(Player):
 
         '''
 
+        ipc = self._mpv_ipc
+        if ipc is not None:
+            if a_command in self.commands:
+                command = self.commands[a_command]
+            else:
+                try:
+                    command = json.loads(a_command)['command']
+                except (ValueError, KeyError, TypeError):
+                    command = None
+            if command is not None:
+                ret = ipc.request(command)
+                if ret is not None:
+                    if return_response:
+                        return ret[0]
+                    return True
+                if ipc.usable() and ipc is self._mpv_ipc:
+                    ''' no reply, but the connection is alive
+                        (the command has been sent)
+                    '''
+                    if return_response:
+                        return ''
+                    return True
+
         #while True:
         #    sock = self._connect_to_socket(self.mpvsocket)
         #    if sock:
@@ -3025,16 +3395,14 @@ class MpvPlayer(Player):
 
         # Send data
         try:
+            if a_command in self.commands:
+                a_command = json.dumps(
+                    {'command': self.commands[a_command]}
+                ).encode('utf-8') + b'\n'
             if platform.startswith('win'):
-                if a_command in self.commands:
-                    win32file.WriteFile(sock, self.commands[a_command])
-                else:
-                    win32file.WriteFile(sock, a_command)
+                win32file.WriteFile(sock, a_command)
             else:
-                if a_command in self.commands:
-                    sock.sendall(self.commands[a_command])
-                else:
-                    sock.sendall(a_command)
+                sock.sendall(a_command)
         except:
             self._close_pipe(sock)
             if return_response:
@@ -3072,8 +3440,30 @@ class MpvPlayer(Player):
             return data
         return True
 
+    def _mpv_ipc_get_property(self, a_property):
+        ''' Get a property's value through the persistent
+            IPC connection
+
+            Returns None if the connection is not available
+            or the request failed
+        '''
+        ipc = self._mpv_ipc
+        if ipc is None:
+            return None
+        ret = ipc.request(['get_property', a_property])
+        if ret is not None and ret[1].get('error') == 'success':
+            return ret[1].get('data')
+        return None
+
     def get_volume(self):
         ''' Display volume for MPV '''
+        ret = self._mpv_ipc_get_property('volume')
+        if ret is not None:
+            try:
+                self.volume = int(ret)
+                return
+            except (ValueError, TypeError):
+                pass
         vol = 0
         while True:
             sock = self._connect_to_socket(self.mpvsocket)
@@ -3162,22 +3552,24 @@ class MpPlayer(Player):
     else:
         executable_found = False
 
-    if executable_found:
-        ''' items of this tuple are considered icy-title
-            and get displayed after first icy-title is received
-        '''
-        icy_tokens = ('ICY Info:', 'Metadata update for StreamTitle: ')
-
-        # 'audio-data' comes from playback start
-        icy_audio_tokens = {
-                'Name   : ': 'icy-name',
-                'Genre  : ': 'icy-genre',
-                'Website: ': 'icy-url',
-                'Bitrate: ': 'icy-br',
-                'Opening audio decoder: ': 'codec',
-                }
+    ''' items of this tuple are considered icy-title
+        and get displayed after first icy-title is received
+    '''
+    icy_tokens = ('ICY Info:', 'Metadata update for StreamTitle: ')
+
+    # 'audio-data' comes from playback start
+    icy_audio_tokens = {
+            'Name   : ': 'icy-name',
+            'Genre  : ': 'icy-genre',
+            'Website: ': 'icy-url',
+            'Bitrate: ': 'icy-br',
+            'Opening audio decoder: ': 'codec',
+            }
 
+    ''' String to denote volume change '''
+    volume_string = 'Volume: '
 
+    if executable_found:
         ''' USE_PROFILE
             -1 : not checked yet
              0 : do not use
@@ -3188,9 +3580,6 @@ class MpPlayer(Player):
         ''' True if profile comes from ~/.mplayer/config '''
         PROFILE_FROM_USER = False
 
-        ''' String to denote volume change '''
-        volume_string = 'Volume: '
-
         ''' if found in built options, buffering is ON '''
         buffering_tokens = ('cache', )
 
@@ -3506,54 +3895,54 @@ class VlcPlayer(Player):
         else:
             executable_found = False
 
-    if executable_found:
-        ''' items of this tuple are considered icy-title
-            and get displayed after first icy-title is received '''
-        icy_tokens = ('New Icy-Title=', )
-
-        icy_audio_tokens = {
-                'Icy-Name:': 'icy-name',
-                'Icy-Genre:': 'icy-genre',
-                'icy-name:': 'icy-name',
-                'icy-genre:': 'icy-genre',
-                'icy-url:': 'icy-url',
-                'icy-br:': 'icy-br',
-                'format:': 'audio_format',
-                'using audio decoder module ': 'codec-name',
-                }
+    ''' items of this tuple are considered icy-title
+        and get displayed after first icy-title is received '''
+    icy_tokens = ('New Icy-Title=', )
+
+    icy_audio_tokens = {
+            'Icy-Name:': 'icy-name',
+            'Icy-Genre:': 'icy-genre',
+            'icy-name:': 'icy-name',
+            'icy-genre:': 'icy-genre',
+            'icy-url:': 'icy-url',
+            'icy-br:': 'icy-br',
+            'format:': 'audio_format',
+            'using audio decoder module ': 'codec-name',
+            }
 
-        muted = paused = False
+    ''' String to denote volume change '''
+    volume_string = '( audio volume: '
 
-        ''' String to denote volume change '''
-        volume_string = '( audio volume: '
+    ''' When found in station transmission, playback is on '''
+    if platform.startswith('win'):
+        _playback_token_tuple = (
+            # ' successfully opened',
+            # 'main audio ',
+            # 'Content-Type: audio',
+            ' Segment #',
+            'using audio decoder module',
+            'answer code 200',
+            ' buffering done',
+            'Buffering '
+        )
+        # max_volume = 1000
+    else:
+        _playback_token_tuple = (
+            # 'Content-Type: audio',
+            ' Segment #',
+            'using audio filter module',
+            'using audio decoder module',
+            'answer code 200',
+            ' buffering done'
+        )
+
+    if executable_found:
+        muted = paused = False
 
         ''' vlc reports volume in values 0..256 '''
         actual_volume = -1
         max_volume = 256
 
-        ''' When found in station transmission, playback is on '''
-        if platform.startswith('win'):
-            _playback_token_tuple = (
-                # ' successfully opened',
-                # 'main audio ',
-                # 'Content-Type: audio',
-                ' Segment #',
-                'using audio decoder module',
-                'answer code 200',
-                ' buffering done',
-                'Buffering '
-            )
-            # max_volume = 1000
-        else:
-            _playback_token_tuple = (
-                # 'Content-Type: audio',
-                ' Segment #',
-                'using audio filter module',
-                'using audio decoder module',
-                'answer code 200',
-                ' buffering done'
-            )
-
         ''' Windows only variables '''
         _vlc_stdout_log_file = ''
         _port = None
@@ -16,16 +16,15 @@ import os
 import random
 import signal
 import csv
-import tempfile
 from copy import deepcopy
-from sys import version as python_version, version_info, platform
+from sys import version as python_version, version_info, platform, stdin
 from os.path import join, basename, getmtime, getsize, exists
-from os import path, remove, rename
+from os import path, remove
 from platform import uname
 from time import sleep
 from datetime import datetime
 import glob
-import requests
+from importlib.util import find_spec
 try:
     import psutil
     HAVE_PSUTIL = True
@@ -62,7 +61,8 @@ elif platform.lower().startswith('darwin'):
                 HAVE_NATIVE_MEDIA = False
 from .player import PlayerCache
 from .config import HAS_REQUESTS, HAS_DNSPYTHON, Station
-from .common import StationsChanges, CsvReadWrite, STATES, M_STRINGS, player_start_stop_token, get_cached_icon_path
+from .common import StationsChanges, CsvReadWrite, STATES, M_STRINGS, player_start_stop_token
+from .scheduler import default_scheduler
 from .window_stack import Window_Stack
 from .config_window import PyRadioConfigWindow, PyRadioExtraParams, \
     PyRadioKeyboardConfig, PyRadioLocalized, PyRadioSelectEncodings, \
@@ -77,7 +77,6 @@ from .cjkwrap import cjklen, cjkcenter, cjkslices, is_wide
 from . import player
 from .install import version_string_to_list, get_github_tag, fix_pyradio_win_exe, get_a_linux_resource_opener
 from .html_help import HtmlHelp, is_graphical_environment_running
-from .browser import RadioBrowserConfigWindow
 from .schedule_win import PyRadioSimpleScheduleWindow
 from .simple_curses_widgets import SimpleCursesMenu
 from .messages_system import PyRadioMessagesSystem
@@ -85,17 +84,11 @@ from .server import PyRadioServer, HAS_NETIFACES
 from .keyboard import kbkey, kb2str, get_lkbkey, get_unicode_and_cjk_char, dequeue_input, input_queue, set_kb_letter, check_localized, add_l10n_to_functions_dict, set_kb_cjk
 from .tts import TTSManager, TTSManagerDummy, Priority, Context
 from .tts_text import tts_transform_to_string, TTS_WINDOWS_TEXT
-HAVE_CHARSET_NORMALIZER = True
-try:
-    from .m3u import parse_m3u
-except ModuleNotFoundError:
-    HAVE_CHARSET_NORMALIZER = False
-
-CAN_CHECK_FOR_UPDATES = True
-try:
-    from urllib.request import urlopen
-except ImportError:
-    CAN_CHECK_FOR_UPDATES = False
+''' Radio Browser (requests, dnspython), m3u (charset_normalizer),
+    station logos and the random playback pool (requests) are
+    imported on first use, to keep the start up time low '''
+HAVE_CHARSET_NORMALIZER = find_spec('charset_normalizer') is not None
+CAN_CHECK_FOR_UPDATES = find_spec('urllib.request') is not None
 
 locale.setlocale(locale.LC_ALL, "")
 
@@ -403,7 +396,9 @@ class PyRadio():
     _update_version = ''
     _update_version_do_display = ''
     _watch_theme_thread = _update_notification_thread = _update_stations_thread = None
-    stop_watch_theme_thread = stop_update_notification_thread = False
+    _logo_fetcher = _station_icon_url = None
+    _random_pool = None
+    stop_update_notification_thread = False
     _watch_theme_lock = threading.Lock()
     _update_notify_lock = threading.Lock()
     _update_stations_lock = threading.Lock()
@@ -608,6 +603,12 @@ class PyRadio():
         self._no_netifaces = False
         self._current_selection = 0
         self._force_print_all_lines = False
+        ''' rendered station lines, see _render_body_line '''
+        self._line_cache = {}
+        self._line_cache_key = None
+        self._line_ticks = None
+        ''' what the stations' window showed when last drawn '''
+        self._painted_view = None
         self._system_asked_to_terminate = False
         self._cnf.update_calculated_colors = self._update_calculated_colors
         self._theme = PyRadioTheme(self._cnf)
@@ -1770,12 +1771,14 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                 return
         if not display_terminal_icon:
             self.bodyWin.erase()
+            self.ws.damage()
         if self.player.ctrl_c_pressed:
             return
         if self._limited_height_mode or self._limited_width_mode:
             self._print_limited_info()
             return
         self._update_redisplay_list()
+        self._check_painted_view()
         end = len(self._redisplay_list)
         if end == 0:
             end = 1
@@ -1785,6 +1788,8 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                 start = st[-1]
                 # if logger.isEnabledFor(logging.DEBUG):
                 #     logger.debug('refreshBody(): start = {}'.format(start))
+        ''' windows below the first damaged one are left as they are '''
+        start = max(start, self.ws.first_damaged([x[0] for x in self._redisplay_list]))
         for n in range(start, end):
             if n == 1:
                 if self._theme_selector and not self._cnf.locked:
@@ -1799,6 +1804,8 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                 # if logger.isEnabledFor(logging.DEBUG):
                 #     logger.debug('Displaying mode {}'.format(self.ws.MODE_NAMES[self._redisplay_list[n][0]]))
                 self._redisplay[self._redisplay_list[n][0]]()
+        self.ws.repaired()
+        curses.doupdate()
 
         # logger.error('DE window mode = {}'.format(self.ws.window_mode))
         # logger.error('DE operation mode = {}'.format(self.ws.operation_mode))
@@ -1844,6 +1851,23 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
 
         self._update_history_positions_in_list()
 
+    def _check_painted_view(self):
+        ''' Damage the stations' window if what it shows has
+            changed since it was last drawn (e.g. by the player
+            or a background thread while a window was on top) '''
+        view = (
+            self._cnf.playlist_generation,
+            id(self.stations),
+            self.selection,
+            self.startPos,
+            self.playing,
+            self.bodyMaxY,
+            self.bodyMaxX
+        )
+        if view != self._painted_view:
+            self._painted_view = view
+            self.ws.damage(self.ws.NORMAL_MODE, self.ws.PLAYLIST_MODE)
+
     def refreshNoDepencency(self):
         col = curses.color_pair(13)
         self.outerBodyWin.bkgdset(' ', col)
@@ -2046,7 +2070,7 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
         column_text = None
         ticks = None
         if self.ws.window_mode == self.ws.PLAYLIST_MODE:
-            line = self._format_playlist_line(lineNum, pad, station)
+            line = self._render_body_line(lineNum, pad, station)[0]
             try:
                 self.bodyWin.addstr(lineNum, 0, line, col)
             except:
@@ -2055,22 +2079,19 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             if self._cnf.browsing_station_service and \
                     self._cnf._online_browser:
                 if ticks is None:
-                    ticks = self._cnf.online_browser.get_columns_separators(self.bodyMaxX, adjust_for_body=True)
+                    ticks = self._body_ticks()
                     if ticks:
                         column_num = ticks[0] - 3
                         if len(ticks) == 1:
                             column_num += 1
                 if station:
-                    line, column_text = self._cnf.online_browser.format_station_line(lineNum + self.startPos, pad, self.bodyMaxX)
+                    line, column_text = self._render_body_line(lineNum, pad, station)
                 else:
                     column_num = 0
                     played, line = self._cnf.online_browser.format_empty_line(self.bodyMaxX)
             else:
                 if station:
-                    if station[1] == '-':
-                        line = self._format_group_line(lineNum, pad, station)
-                    else:
-                        line = self._format_station_line("{0}. {1}".format(str(lineNum + self.startPos + 1).rjust(pad), station[0]))
+                    line = self._render_body_line(lineNum, pad, station)[0]
                 else:
                     line = ' ' * (self.bodyMaxX - 2)
 
@@ -2088,13 +2109,65 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                 pass
             if column_num > 0:
                 if ticks is None:
-                    ticks = self._cnf.online_browser.get_columns_separators(self.bodyMaxX, adjust_for_body=True)
+                    ticks = self._body_ticks()
                 for n in ticks:
                     self.bodyWin.chgat(lineNum, n, 1, curses.color_pair(13))
 
             if station and self._cnf.browsing_station_service and sep_col:
                 self._change_browser_ticks(lineNum, sep_col, all_ticks=ticks)
 
+    def _check_line_cache(self):
+        ''' Drop the rendered lines if the playlist, the
+            body width or the mode they were rendered for
+            have changed since '''
+        key = (
+            self._cnf.playlist_generation,
+            id(self.stations),
+            self.bodyMaxX,
+            self.ws.window_mode,
+            self._cnf.browsing_station_service,
+            self._cnf.open_register_list
+        )
+        if key != self._line_cache_key:
+            self._line_cache.clear()
+            self._line_ticks = None
+            self._line_cache_key = key
+
+    def _render_body_line(self, lineNum, pad, station):
+        ''' Return the text of a station (or playlist) line,
+            as a (line, column_text) tuple
+
+            Lines are only formatted once and then reused,
+            until _check_line_cache finds them outdated.
+            The line's colors are not part of the cache.
+        '''
+        self._check_line_cache()
+        i = lineNum + self.startPos
+        cached = self._line_cache.get(i)
+        if cached is not None and cached[0] is station and cached[1] == pad:
+            return cached[2]
+        if self.ws.window_mode == self.ws.PLAYLIST_MODE:
+            rendered = (self._format_playlist_line(lineNum, pad, station), None)
+        elif self._cnf.browsing_station_service:
+            rendered = self._cnf.online_browser.format_station_line(i, pad, self.bodyMaxX)
+        elif station[1] == '-':
+            rendered = (self._format_group_line(lineNum, pad, station), None)
+        else:
+            rendered = (self._format_station_line("{0}. {1}".format(str(i + 1).rjust(pad), station[0])), None)
+        if len(self._line_cache) > 4 * max(self.bodyMaxY, 50):
+            ''' keep about a few screens worth of lines '''
+            self._line_cache.clear()
+        self._line_cache[i] = (station, pad, rendered)
+        return rendered
+
+    def _body_ticks(self):
+        ''' Return the columns separators of RadioBrowser
+            lines, for the current body width '''
+        self._check_line_cache()
+        if self._line_ticks is None:
+            self._line_ticks = self._cnf.online_browser.get_columns_separators(self.bodyMaxX, adjust_for_body=True)
+        return self._line_ticks
+
     def _format_group_line(self, lineNum, pad, station):
         old_disp = ' ' + station[0] + ' '
         # if cjklen(to_disp) < self.maxX - (pad + 6):
@@ -2121,7 +2194,7 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
         ticks = all_ticks
         if self._cnf._online_browser:
             if ticks is None:
-                ticks = self._cnf.online_browser.get_columns_separators(self.bodyMaxX, adjust_for_body=True)
+                ticks = self._body_ticks()
         if ticks:
             for n in ticks:
                 self.bodyWin.chgat(lineNum, n, 1, sep_col)
@@ -2132,30 +2205,25 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             Parameters
             =========
             path    the path to the file
-                    if it's None, the thread is terminated
+                    if it's None, watching is terminated
         '''
         if self._watch_theme_thread:
-            self.stop_watch_theme_thread = True
+            self._watch_theme_thread.cancel()
             self._watch_theme_thread.join()
             self._watch_theme_thread = None
-            self.stop_watch_theme_thread = False
 
         if theme_path is None:
             return
 
-        a_path = theme_path
-        self._watch_theme_thread = threading.Thread(
-            target=self._wait_for_theme_to_change,
-            # args=(self._cnf,
-            # args=(path.basename(a_path).replace('.pyradio-theme', ''),
-            #       a_path,
-            args=(self._cnf.theme,
-                  self._cnf.theme_path,
-                  self._watch_theme_lock,
-                  lambda: self.stop_watch_theme_thread,
-                  self._auto_update_theme,
-                  self._cnf))
-        self._watch_theme_thread.start()
+        self._watch_theme_thread = default_scheduler.call_every(
+            .75,
+            self._theme_file_watcher(
+                self._cnf.theme,
+                self._cnf.theme_path,
+                self._auto_update_theme,
+                self._cnf
+            )
+        )
 
     def _auto_update_theme(self):
         logger.error('_auto_update_theme(): triggered! - updating theme: ' + self._cnf.theme)
@@ -2174,7 +2242,12 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             logger.info('_print_theme_download_error 1')
             self._print_theme_download_error()
 
-    def _wait_for_theme_to_change(self, theme, file, a_lock, stop, func, config):
+    def _theme_file_watcher(self, theme, file, func, config):
+        ''' Return a function that calls func when the
+            file of theme changes (modification time or size)
+
+            _watch_theme runs it periodically on the scheduler
+        '''
         a_file = file
         ret, ret_ind = config.is_project_theme(theme)
         if ret is not None:
@@ -2187,87 +2260,34 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                 logger.debug('Wathcing a non project theme: ' + theme)
 
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f'File watch thread started on: {a_file}')
+            logger.debug(f'File watch started on: {a_file}')
 
+        st_time = st_size = None
         showed = False
-        while not exists(a_file):
-            if logger.isEnabledFor(logging.DEBUG) and not showed:
-                logger.debug(f'Waiting for watched file to appear: {a_file}')
-                showed = True
-            for _ in range(0, 5):
-                sleep(.15)
-                if stop():
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f'File watch thread stopped on: {a_file}')
-                    return
 
-        if logger.isEnabledFor(logging.DEBUG) and showed:
-            logger.debug(f'Watched file appeared: {a_file}')
-            showed = False
-        st_time = cur_time = getmtime(a_file)
-        st_size = cur_size = getsize(a_file)
-        while True:
-            if exists(a_file):
-                for _n in range(0, 5):
-                    sleep(.15)
-                    if stop():
-                        break
-                try:
-                    cur_time = getmtime(a_file)
-                    showed = False
-                except:
-                    if logger.isEnabledFor(logging.DEBUG) and not showed:
-                        logger.debug(f'Watched file disappeared: {a_file}')
-                        showed = True
-                if st_time != cur_time:
-                    if stop():
-                        break
-                    try:
-                        st_time = cur_time = getmtime(a_file)
-                        st_size = cur_size = getsize(a_file)
-                        showed = False
-                    except:
-                        if logger.isEnabledFor(logging.DEBUG) and not showed:
-                            logger.debug(f'Watched file disappeared: {a_file}')
-                            showed = True
-                    if stop():
-                        break
-                    # with a_lock:
-                    #     func()
-                    func()
-                if stop():
-                    break
-                try:
-                    cur_size = getsize(a_file)
-                    showed = False
-                except:
-                    if logger.isEnabledFor(logging.DEBUG) and not showed:
-                        logger.debug(f'Watched file disappeared: {a_file}')
-                        showed = True
-                if st_size != cur_size:
-                    if stop():
-                        break
-                    st_time = cur_time = getmtime(a_file)
-                    st_size = cur_size = getsize(a_file)
-                    if stop():
-                        break
-                    # with a_lock:
-                    #     func()
-                    func()
-                if stop():
-                    break
-            else:
+        def check():
+            nonlocal st_time, st_size, showed
+            try:
+                cur_time = getmtime(a_file)
+                cur_size = getsize(a_file)
+            except OSError:
                 if logger.isEnabledFor(logging.DEBUG) and not showed:
-                    logger.debug(f'File watched does not exist: {a_file}')
-                    showed = True
-                for _n in range(0, 5):
-                    sleep(.15)
-                    if stop():
-                        if logger.isEnabledFor(logging.DEBUG):
-                            logger.debug(f'File watch thread stopped on: {a_file}')
-                        return
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f'File watch thread stopped on: {a_file}')
+                    if st_time is None:
+                        logger.debug(f'Waiting for watched file to appear: {a_file}')
+                    else:
+                        logger.debug(f'Watched file disappeared: {a_file}')
+                showed = True
+                return
+            if logger.isEnabledFor(logging.DEBUG) and showed:
+                logger.debug(f'Watched file appeared: {a_file}')
+            showed = False
+            if st_time is None:
+                st_time, st_size = cur_time, cur_size
+            elif st_time != cur_time or st_size != cur_size:
+                st_time, st_size = cur_time, cur_size
+                func()
+
+        return check
 
     def run(self):
         if logger.isEnabledFor(logging.INFO):
@@ -2444,6 +2464,12 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                             mpris_poll_enabled = self.ws.operation_mode == self.ws.NORMAL_MODE
                             mpris_poll_enabled = True
                             self._mpris.poll(mpris_poll_enabled)
+                            if self._mpris.wakeup_fd is not None:
+                                ''' sleep until a key, a command or a due
+                                    volume change, instead of waking up
+                                    every 100 ms '''
+                                while not self._mpris.wait(stdin.fileno()):
+                                    self._mpris.poll(mpris_poll_enabled)
                         continue
 
                     if remaining_keys > 0:
@@ -2452,6 +2478,7 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                         ret = self.keypress(c)  # Handle shortcut
                         if ret == -1:
                             return
+                        curses.doupdate()
                         continue
 
                     # Process input through get_unicode_and_cjk_char
@@ -2489,6 +2516,8 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
                         # Re-insert input in reverse order
                         deq = dequeue_input()
                         curses.ungetch(deq)
+                    ''' flush whatever the key left staged '''
+                    curses.doupdate()
 
                 except KeyboardInterrupt:
                     # ok
@@ -2608,7 +2637,7 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             self.tts.shutdown()
         self.log._stop_desktop_notification_thread = True
         if self._watch_theme_thread:
-            self.stop_watch_theme_thread = True
+            self._watch_theme_thread.cancel()
             self._watch_theme_thread.join()
         if self._update_notification_thread is not None:
             if self._update_notification_thread.is_alive():
@@ -2624,6 +2653,10 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             except AttributeError:
                 pass
         self.stop_update_notification_thread = True
+        if self._logo_fetcher is not None:
+            self._logo_fetcher.shutdown()
+        if self._random_pool is not None:
+            self._random_pool.shutdown()
         try:
             while self.log._desktop_notification_thread.is_alive():
                 self.log._stop_desktop_notification_thread = True
@@ -2926,32 +2959,38 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             self._cnf._online_browser.click(self.playing)
 
     def playbackTimeoutCounter(self, *args):
+        ''' Count the connection timeout down on the scheduler
+
+            Returns the ScheduledCall doing the count, so that
+            the player can cancel() and join() it; the stop flag
+            alone would let it run again once it is reset
+        '''
         timeout = args[0]
         station_name = args[1]
         stop = args[2]
         if stop():
-            return
+            return None
         not_showed = True
         lim = int((7 * timeout) / 10)
-        for n in range(timeout, -1, -1):
-            ''' 8 * .12 =~ 1 sec '''
-            for _ in range(0, 8):
-                sleep(.12)
-                if stop():
-                    return
+        n = timeout
+
+        def count_down():
+            nonlocal n, not_showed
+            if stop():
+                return False
             #if n <= 7:"
             if n <= lim:
-                if stop():
-                    return
                 self.log.write(msg_id=STATES.CONNECT, msg=M_STRINGS['connecting_'] + station_name)
                 self.log.write(msg_id=STATES.ANY, counter=f'{n}')
-            else:
-                if stop():
-                    return
-                if not_showed:
-                    self.log.write(msg_id=STATES.CONNECT, msg=M_STRINGS['connecting_'] + station_name)
-                    not_showed = False
-        self.connectionFailed()
+            elif not_showed:
+                self.log.write(msg_id=STATES.CONNECT, msg=M_STRINGS['connecting_'] + station_name)
+                not_showed = False
+            if n == 0:
+                self.connectionFailed()
+                return False
+            n -= 1
+
+        return default_scheduler.call_every(1, count_down)
 
     def connectionFailed(self):
         logger.error('connectionFailed called')
@@ -3007,6 +3046,8 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
         if from_update_thread:
             self.detect_if_player_exited = True
             self.player.stop_timeout_counter_thread = True
+            if self.player.connection_timeout_thread is not None:
+                self.player.connection_timeout_thread.cancel()
         with self.log.lock:
             self.log.counter = None
         self._update_status_bar_right()
@@ -3119,12 +3160,33 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
         self._prepare_next_current_player_id()
 
     def _download_station_image(self, url, station_name, stop):
-        threading.Thread(
-            target=self._thread_download_station_image,
-            args=(url, station_name, self._notification_icon, stop),
-        ).start()
-
-    def _notification_icon(self, a_name):
+        if self._logo_fetcher is None:
+            from .logos import StationLogoFetcher
+            self._logo_fetcher = StationLogoFetcher(self._cnf.logos_dir)
+        self._station_icon_url = url
+        self._logo_fetcher.fetch(
+            url, station_name,
+            callback=lambda a_name: self._notification_icon(a_name, url),
+            stop=stop
+        )
+        if self._logo_fetcher.PREFETCH:
+            ''' prefetch the logos of the stations around the
+                selected one, so that zapping finds them cached '''
+            sel = self.selection
+            neighbours = []
+            for i in range(1, self._logo_fetcher.PREFETCH + 1):
+                for n in (sel + i, sel - i):
+                    if 0 <= n < len(self.stations) and \
+                            self.stations[n][1] != '-' and \
+                            self.stations[n][Station.icon]:
+                        neighbours.append((self.stations[n][0], self.stations[n][Station.icon]))
+            self._logo_fetcher.prefetch(neighbours, stop=stop)
+
+    def _notification_icon(self, a_name, url=None):
+        if url is not None and url != self._station_icon_url:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Notification image: station changed; ignoring...')
+            return
         if path.exists(a_name):
             self._cnf.notification_image_file = a_name
             if logger.isEnabledFor(logging.DEBUG):
@@ -3133,66 +3195,6 @@ effectively putting <b>PyRadio</b> in <span style="font-weight:bold; color: Gree
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug('Notification image is invalid; reverting to default...')
 
-    def _thread_download_station_image(
-            self,
-            url,
-            station_name,
-            update_icon_name_function,
-            stop
-            ):
-        if url:
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug('+++ downloading icon...')
-            file_to_write = get_cached_icon_path(self._cnf.logos_dir, station_name, url)
-            if path.exists(file_to_write):
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('+++ icon download: aleready downloaded...')
-                update_icon_name_function(file_to_write)
-                return
-            if stop():
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('+++ icon download: asked to stop. Stopping...')
-                return
-            temp_file = tempfile.NamedTemporaryFile(delete=False, dir=self._cnf.logos_dir)
-            temp_file.close()
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            try:
-                response = requests.get(url, headers=headers, timeout=10)
-                # response = requests.get(url)
-            except requests.exceptions.RequestException as e:
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f'+++ icon download failed: {e}')
-                return
-            if stop():
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('+++ icon download: asked to stop. Stopping...')
-                return
-            if response.status_code == 200:
-                try:
-                    with open(temp_file.name, 'wb') as local_file:
-                        for chunk in response.iter_content(chunk_size=128):
-                            if stop():
-                                if logger.isEnabledFor(logging.DEBUG):
-                                    logger.debug('+++ icon download: asked to stop. Stopping...')
-                                return
-                            local_file.write(chunk)
-                except (FileNotFoundError, PermissionError, OSError):
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug('+++ icon download: error saving icon. Stopping...')
-                    return
-            if stop():
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('+++ icon download: asked to stop. Stopping...')
-                return
-            try:
-                rename(temp_file.name, file_to_write)
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug('+++ icon downloaded...')
-            except Exception as e:
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f'+++ icon downloaded, but {e}...')
-            update_icon_name_function(file_to_write)
-
     def _ask_to_delete_playlist(self):
         self._open_simple_message_by_key_and_mode(
             self.ws.DELETE_PLAYLIST_MODE,
@@ -3798,6 +3800,9 @@ ____Using |fallback| theme.''', Priority.HIGH)
             txt, self.ws.MESSAGING_MODE)
 
     def _print_vote_result(self):
+        ''' a successful vote updates the votes column of the
+            station in place; have its line rendered again '''
+        self._line_cache_key = None
         self._open_simple_message_by_key(
             'M_RB_VOTE_RESULT',
             self._cnf._online_browser.vote_result[0],
@@ -5105,10 +5110,18 @@ and |remove the file manually|.
     def play_random(self):
         # Pick a random radio station
         if self.number_of_items > 0:
-            while True:
-                rnd = random.randint(0, len(self.stations) - 1)
-                if self.stations[rnd][1] != '-':
-                    break
+            if self._random_pool is None:
+                from .validate_playlist import RandomStationPool
+                self._random_pool = RandomStationPool()
+            self._random_pool.set_playlist(self.stations, self._cnf.playlist_generation)
+            rnd = self._random_pool.take(exclude=self.playing)
+            if rnd is None or rnd >= len(self.stations) or \
+                    self.stations[rnd][1] == '-':
+                ''' no verified station yet '''
+                while True:
+                    rnd = random.randint(0, len(self.stations) - 1)
+                    if self.stations[rnd][1] != '-':
+                        break
             self.setStation(rnd)
             self.playSelection()
             self._put_selection_in_the_middle(force=True)
@@ -5487,6 +5500,12 @@ and |remove the file manually|.
                 return True
         return False
 
+    def _search_list_index(self):
+        ''' the StationsIndex of self._search_list, if any '''
+        if self._search_list is self._cnf.stations:
+            return self._cnf.search_index
+        return None
+
     def _apply_search_result(self, ret, reapply=False):
         def _apply_main_windows(ret):
             self.setStation(ret)
@@ -5599,6 +5618,8 @@ and |remove the file manually|.
             self._open_playlist(a_url)
 
     def _normal_mode_resize(self):
+        self._line_cache_key = None
+        self.ws.damage()
         if platform.startswith('win'):
             curses.resize_term(0, 0)
             try:
@@ -6168,6 +6189,7 @@ and |remove the file manually|.
         else:
             if self._browser_config_win is None:
                 self._show_connect_to_server_message()
+                from .browser import RadioBrowserConfigWindow
                 self._browser_config_win = RadioBrowserConfigWindow(
                     parent=parent,
                     init=init,
@@ -6228,7 +6250,8 @@ and |remove the file manually|.
                     self.bodyWin.untouchwin()
                     self._unselect_line(self._current_selection)
                     self._select_line(self.selection)
-                    self.bodyWin.refresh()
+                    self.bodyWin.noutrefresh()
+                    curses.doupdate()
                     return
         self.refreshBody()
 
@@ -6250,7 +6273,8 @@ and |remove the file manually|.
                     self.bodyWin.untouchwin()
                     self._unselect_line(self._current_selection)
                     self._select_line(self.selection)
-                    self.bodyWin.refresh()
+                    self.bodyWin.noutrefresh()
+                    curses.doupdate()
                     return
         self.refreshBody()
 
@@ -7277,6 +7301,7 @@ and |remove the file manually|.
                         txt='___Converting M3U playlist___',
                         mode_to_set=self.ws.operation_mode,
                         callback_function=self.refreshBody)
+                from .m3u import parse_m3u
                 stations, error = parse_m3u(playlist_to_try_to_open)
                 # logger.error(f'{stations = }')
                 if error:
@@ -10090,10 +10115,11 @@ _____"|f|" to see the |free| keys you can use.
                     ret = self.search.get_next(
                         self._search_list,
                         sel,
-                        search_function=self._cnf._online_browser.get_next
+                        search_function=self._cnf._online_browser.get_next,
+                        index=self._search_list_index()
                     )
                 else:
-                    ret = self.search.get_next(self._search_list, sel)
+                    ret = self.search.get_next(self._search_list, sel, index=self._search_list_index())
                 if ret is not None:
                     self._apply_search_result(ret, reapply=True)
             else:
@@ -10146,10 +10172,11 @@ _____"|f|" to see the |free| keys you can use.
                     ret = self.search.get_previous(
                         self._search_list,
                         sel,
-                        search_function=self._cnf._online_browser.get_previous
+                        search_function=self._cnf._online_browser.get_previous,
+                        index=self._search_list_index()
                     )
                 else:
-                    ret = self.search.get_previous(self._search_list, sel)
+                    ret = self.search.get_previous(self._search_list, sel, index=self._search_list_index())
                 if ret is not None:
                     self._apply_search_result(ret, reapply=True)
             else:
@@ -10201,10 +10228,11 @@ _____"|f|" to see the |free| keys you can use.
                     ret = self.search.get_next(
                         self._search_list,
                         sel,
-                        search_function=self._cnf._online_browser.get_next
+                        search_function=self._cnf._online_browser.get_next,
+                        index=self._search_list_index()
                     )
                 else:
-                    ret = self.search.get_next(self._search_list, sel)
+                    ret = self.search.get_next(self._search_list, sel, index=self._search_list_index())
                 if ret is None:
                     if self.search.string:
                         self.search.print_not_found()
@@ -12218,9 +12246,9 @@ _____"|f|" to see the |free| keys you can use.
                         except:
                             pass
         self.outerBodyWin.touchwin()
-        self.outerBodyWin.refresh()
+        self.outerBodyWin.noutrefresh()
         self.bodyWin.touchwin()
-        self.bodyWin.refresh()
+        self.bodyWin.noutrefresh()
 
     def _redisplay_config(self):
         self._config_win.parent = self.outerBodyWin
@@ -12530,6 +12558,8 @@ _____"|f|" to see the |free| keys you can use.
         self._force_exit = True
         self.stop_update_notification_thread = True
         self.player.stop_timeout_counter_thread = True
+        if self.player.connection_timeout_thread is not None:
+            self.player.connection_timeout_thread.cancel()
         if self.ws.operation_mode != self.ws.PLAYLIST_MODE:
             if self._cnf.dirty_playlist:
                 self._cnf.save_playlist_file()
@@ -12889,7 +12919,7 @@ _____"|f|" to see the |free| keys you can use.
         if num == -1:
             return
         self._set_rename_stations()
-        self._cnf.stations = list(self._reading_stations)
+        self._cnf.stations = self._reading_stations
         self._reading_stations = []
         self.stations = self._cnf.stations
         self._playlist_in_editor = stationFile
@@ -7,11 +7,6 @@ from platform import system
 import logging
 import json
 import datetime as dt
-from dateutil.relativedelta import relativedelta
-from dateutil.rrule import rrule, \
-    SU, MO, TU, WE, TH, FR, SA, \
-    DAILY, WEEKLY, MONTHLY
-from dateutil.parser import parser
 from enum import IntEnum
 
 locale.setlocale(locale.LC_ALL, '')    # set your locale
@@ -189,6 +184,11 @@ class PyRadioScheduleList():
         return [(datetime_to_my_time(x[1]), datetime_to_my_time(x[2])) for x in rep]
 
     def get_repeating_dates(self, in_date, count=None):
+        ''' dateutil is slow to import; only
+            repeating schedule items need it '''
+        from dateutil.rrule import rrule, \
+            SU, MO, TU, WE, TH, FR, SA, \
+            DAILY, WEEKLY, MONTHLY
         days = {
             'Sunday': SU,
             'Monday': MO,
@@ -795,7 +795,7 @@ class PyRadioScheduleItem():
                 [today.hour, today.minute, 0, 0]
 
     def _get_today_plus_one_hour(self):
-        today = dt.datetime.now() + relativedelta(hours=+1)
+        today = dt.datetime.now() + dt.timedelta(hours=1)
         return [today.year, today.month, today.day], \
             [today.hour, today.minute, 0, 0]
 
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from heapq import heappush, heappop
+from itertools import count
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledCall():
+    ''' A call registered with a Scheduler
+
+        cancel() prevents any further runs of the call and
+        join() waits for a run in progress to finish (it is
+        safe to call it from the call itself).
+
+        A repeating call also stops when it returns False.
+    '''
+
+    def __init__(self, func, args, interval=None):
+        self._func = func
+        self._args = args
+        self.interval = interval
+        self.cancelled = False
+        self._running = threading.RLock()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def join(self, timeout=None):
+        if self._running.acquire(timeout=-1 if timeout is None else timeout):
+            self._running.release()
+
+    def is_alive(self):
+        return not self.cancelled
+
+    def _run(self):
+        ''' run the call, return True if it has to run again '''
+        with self._running:
+            if self.cancelled:
+                return False
+            try:
+                ret = self._func(*self._args)
+            except Exception as e:
+                logger.error(f'scheduled call {self._func} failed: {e}')
+                ret = False
+            if ret is False or self.interval is None:
+                self.cancelled = True
+                return False
+            return True
+
+
+class Scheduler():
+    ''' Run calls at given times, on a small pool of threads
+
+        A single thread keeps the calls ordered by deadline
+        and sleeps until the first one is due, so there are
+        no wakeups while nothing is due. The calls themselves
+        run on the pool; a repeating call is registered again
+        after it returns, so that it never overlaps itself.
+
+        The thread and the pool are created on first use.
+    '''
+
+    def __init__(self, workers=2):
+        self._workers = workers
+        self._heap = []
+        self._counter = count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._executor = None
+
+    def call_later(self, delay, func, *args):
+        ''' Run func(*args) once, after delay seconds '''
+        return self._add(ScheduledCall(func, args), delay)
+
+    def call_every(self, interval, func, *args, first=None):
+        ''' Run func(*args) every interval seconds
+
+            The first run happens after "first" seconds
+            (default: interval).
+        '''
+        return self._add(
+            ScheduledCall(func, args, interval),
+            interval if first is None else first
+        )
+
+    def _add(self, call, delay):
+        with self._cond:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._workers,
+                    thread_name_prefix='scheduler'
+                )
+                self._thread = threading.Thread(
+                    target=self._loop,
+                    name='scheduler',
+                    daemon=True
+                )
+                self._thread.start()
+            self._push(call, monotonic() + max(delay, 0))
+        return call
+
+    def _push(self, call, deadline):
+        heappush(self._heap, (deadline, next(self._counter), call))
+        self._cond.notify()
+
+    def _loop(self):
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2].cancelled:
+                    heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline = self._heap[0][0]
+                now = monotonic()
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+                call = heappop(self._heap)[2]
+                try:
+                    self._executor.submit(self._dispatch, call, deadline)
+                except RuntimeError:
+                    ''' interpreter shutting down '''
+                    return
+
+    def _dispatch(self, call, deadline):
+        if call._run():
+            with self._cond:
+                if not call.cancelled:
+                    next_deadline = deadline + call.interval
+                    now = monotonic()
+                    if next_deadline <= now:
+                        ''' running late, do not try to catch up '''
+                        next_deadline = now + call.interval
+                    self._push(call, next_deadline)
+
+
+''' the scheduler shared by all periodic tasks '''
+default_scheduler = Scheduler()
@@ -2,11 +2,17 @@
 import locale
 import socket
 import logging
+import json
+import gzip
+import hashlib
+import threading
+import selectors
+import queue
 from os import remove
 from os.path import basename, exists
+from urllib.parse import urlsplit, parse_qs
 from sys import platform
-from time import sleep
-import requests
+from time import sleep, monotonic
 from .common import M_STRINGS
 
 locale.setlocale(locale.LC_ALL, "")
@@ -55,6 +61,7 @@ class IPs():
                 self._IPs.append(ip)
 
     def _get_public_ip(self):
+        import requests
         try:
             ip = requests.get('https://api.ipify.org').text
         except requests.exceptions.RequestException:
@@ -139,6 +146,176 @@ class IPsWithNumbers():
         '''
         return ip.lower() if self.ip_exists(ip) else 'localhost'
 
+class SSEBroadcaster():
+    ''' Server-Sent Events stream for the web interface
+
+        Subscribers are browser connections to /html/title;
+        they are kept open and get an event whenever one of
+        the published values (title, volume, recording and
+        playing state) changes.
+
+        Subscriber sockets are non blocking; a client that
+        cannot keep up is dropped (the browser will reconnect),
+        so that publishing never blocks the calling thread.
+    '''
+
+    ''' milliseconds the browser waits before reconnecting '''
+    RETRY = 3000
+
+    _headers = '''HTTP/1.1 200 OK
+Content-Type: text/event-stream; charset=UTF-8
+Cache-Control: no-cache
+Connection: keep-alive
+
+'''.encode('utf-8')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._last = {}
+
+    @property
+    def subscribers(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _frame(self, event, data):
+        out = ['event: ' + event]
+        for n in str(data).split('\n'):
+            out.append('data: ' + n)
+        return ('\n'.join(out) + '\n\n').encode('utf-8')
+
+    def _send(self, sock, data):
+        ''' Send data without blocking; return False if
+            the client is gone or cannot keep up '''
+        try:
+            return sock.send(data) == len(data)
+        except (OSError, socket.error):
+            return False
+
+    def subscribe(self, sock):
+        ''' Start a stream on sock, sending all current values '''
+        try:
+            sock.setblocking(False)
+        except (OSError, socket.error):
+            return False
+        with self._lock:
+            msg = self._headers + f'retry: {self.RETRY}\n\n'.encode('utf-8')
+            for event, data in self._last.items():
+                msg += self._frame(event, data)
+            if not self._send(sock, msg):
+                sock.close()
+                return False
+            self._subscribers.append(sock)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'SSE: subscriber added (total: {len(self._subscribers)})')
+        return True
+
+    def publish(self, event, data):
+        ''' Send an event to all subscribers, if its data
+            is different to what was last sent '''
+        with self._lock:
+            if self._last.get(event) == data:
+                return
+            self._last[event] = data
+            if not self._subscribers:
+                return
+            msg = self._frame(event, data)
+            dead = [x for x in self._subscribers if not self._send(x, msg)]
+            for n in dead:
+                self._subscribers.remove(n)
+                try:
+                    n.close()
+                except (OSError, socket.error):
+                    pass
+            if dead and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'SSE: {len(dead)} subscriber(s) removed (total: {len(self._subscribers)})')
+
+    def close(self):
+        with self._lock:
+            for n in self._subscribers:
+                try:
+                    n.close()
+                except (OSError, socket.error):
+                    pass
+            self._subscribers = []
+            self._last = {}
+
+class _RemoteControlConnection():
+    ''' A client connection to the remote control server
+
+        Owned by the server's selector loop; the request worker
+        only appends replies to it, through _ResponseSink.
+    '''
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.lock = threading.Lock()
+        self.inbuf = b''
+        self.outbuf = b''
+        ''' requests queued to the worker, not replied yet '''
+        self.pending = 0
+        ''' close the connection when all replies are sent '''
+        self.close_when_done = False
+        ''' hand the socket over to this SSEBroadcaster
+            when all replies are sent '''
+        self.stream_to = None
+        self.last_active = monotonic()
+
+
+class _ResponseSink():
+    ''' Stands in for the client socket while a request is handled
+
+        Only the first reply written is kept (a title update may
+        be written as the reply of a command; this is what the
+        web interface expects). If nothing is written, an empty
+        reply is sent, so that keep-alive clients do not hang.
+    '''
+
+    _empty_reply = b'HTTP/1.1 200 OK\nContent-Type: text/txt; charset=UTF-8\nContent-Length: 1\n\n\n'
+
+    def __init__(self, conn, keep_alive, wakeup):
+        self._conn = conn
+        self._keep_alive = keep_alive
+        self._wakeup = wakeup
+        self._done = False
+        self._lock = threading.Lock()
+
+    def sendall(self, data):
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+        if not self._keep_alive:
+            data = data.replace(PyRadioServer.KEEP_ALIVE_HEADER, b'Connection: close\n', 1)
+        self._reply(data)
+
+    def stream_to(self, broadcaster):
+        ''' Turn this connection into an event stream '''
+        with self._lock:
+            self._done = True
+        with self._conn.lock:
+            self._conn.stream_to = broadcaster
+        self._reply(b'')
+
+    def finish(self):
+        ''' Called when the request has been handled '''
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+        self._reply(self._empty_reply)
+
+    def _reply(self, data):
+        with self._conn.lock:
+            self._conn.outbuf += data
+            self._conn.pending -= 1
+            if not self._keep_alive:
+                self._conn.close_when_done = True
+        self._wakeup()
+
+
 class PyRadioServer():
     _filter_string = '''
                     <script>
@@ -415,6 +592,14 @@ div[id^='a_']:hover { underline: none;}
         }
     });
 
+    eventSource.addEventListener("/html/recording", (event) => {
+        js_fix_recording();
+    });
+
+    eventSource.addEventListener("/html/muted", (event) => {
+        js_fix_muted();
+    });
+
     eventSource.onerror = function(m) {
         error_count++;
         if ( error_count > 5 ) {
@@ -937,6 +1122,25 @@ Restricted Commands (Main mode only)
         '/perm_html': '<div class="alert alert-danger">Operation not permitted (not in <b>Main Mode</b>)</div>',
     }
 
+    ''' seconds an idle keep-alive connection stays open '''
+    IDLE_TIMEOUT = 30
+
+    ''' requests waiting to be executed; when the queue
+        is full, new requests get a 503 reply '''
+    MAX_QUEUED_REQUESTS = 32
+
+    MAX_REQUEST_SIZE = 64 * 1024
+
+    KEEP_ALIVE_HEADER = b'Connection: keep-alive, Keep-Alive\nKeep-Alive: timeout=30, max=1000\n'
+
+    _busy_reply = b'HTTP/1.1 503 Service Unavailable\nContent-Type: text/txt; charset=UTF-8\nConnection: close\nContent-Length: 12\n\nServer busy\n'
+
+    ''' JSON API replies larger than this are gzipped,
+        if the client accepts it '''
+    API_GZIP_MIN_SIZE = 1024
+
+    _too_large_reply = b'HTTP/1.1 413 Payload Too Large\nContent-Type: text/txt; charset=UTF-8\nConnection: close\nContent-Length: 18\n\nRequest too large\n'
+
     # sel = 0
     # _selected = -1
 
@@ -956,6 +1160,9 @@ Restricted Commands (Main mode only)
         self.sel = 0
         self._selected = -1
         self._empty_song_title_count = 0
+        self._sse = SSEBroadcaster()
+        ''' JSON API cache; {url: (etag, body, gzipped body)} '''
+        self._api_cache = {}
 
         self._path = ''
         self.has_netifaces = HAS_NETIFACES
@@ -1031,30 +1238,249 @@ Restricted Commands (Main mode only)
             logger.info(f'Remote Control Server listening on {self._bind_ip}:{self._bind_port}')
 
         self._create_report_file()
-        while True:
+        self._serve(server, dead_func)
+        server.close()
+        self._sse.close()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Remote Control Server exiting...')
+        # just in case...
+        self._remove_report_file()
+
+    def _serve(self, server, dead_func):
+        ''' The server's event loop
+
+            All client I/O is done here, without blocking, so
+            that a slow or stalled client does not delay anybody
+            else. Complete requests are put in a bounded queue and
+            executed one at a time by the request worker thread.
+        '''
+        self._stop_serving = False
+        self._requests = queue.Queue(maxsize=self.MAX_QUEUED_REQUESTS)
+        wakeup_r, wakeup_w = socket.socketpair()
+        wakeup_r.setblocking(False)
+        wakeup_w.setblocking(False)
+
+        def wakeup():
             try:
-                self.client_socket, address = server.accept()
-                request = self.client_socket.recv(1024)
-            except socket.error as e:
-                self._remove_report_file()
-                dead_func(e)
+                wakeup_w.send(b'\0')
+            except (OSError, socket.error):
+                ''' buffer full; loop already woken up '''
+                pass
+
+        worker = threading.Thread(
+            target=self._request_worker,
+            args=(wakeup, dead_func)
+        )
+        worker.start()
+        connections = {}
+        sel = selectors.DefaultSelector()
+        server.setblocking(False)
+        sel.register(server, selectors.EVENT_READ)
+        sel.register(wakeup_r, selectors.EVENT_READ)
+        try:
+            while not self._stop_serving:
+                for key, mask in sel.select(timeout=1):
+                    if key.fileobj is server:
+                        try:
+                            while True:
+                                client, address = server.accept()
+                                client.setblocking(False)
+                                conn = _RemoteControlConnection(client, address)
+                                connections[client] = conn
+                                sel.register(client, selectors.EVENT_READ, conn)
+                        except BlockingIOError:
+                            pass
+                        except (OSError, socket.error) as e:
+                            self._remove_report_file()
+                            dead_func(e)
+                            self._stop_serving = True
+                    elif key.fileobj is wakeup_r:
+                        try:
+                            while wakeup_r.recv(512):
+                                pass
+                        except (OSError, socket.error):
+                            pass
+                    elif key.data.sock.fileno() != -1:
+                        ''' not dropped earlier in this batch '''
+                        if mask & selectors.EVENT_READ:
+                            self._read_from_client(sel, connections, key.data)
+                        if mask & selectors.EVENT_WRITE and key.data.sock.fileno() != -1:
+                            self._write_to_client(sel, connections, key.data)
+                now = monotonic()
+                for conn in list(connections.values()):
+                    with conn.lock:
+                        has_output = bool(conn.outbuf)
+                        idle = conn.pending == 0 and not has_output
+                        done = idle and conn.close_when_done
+                        stream_to = conn.stream_to if idle else None
+                    if conn.sock.fileno() == -1 or done or \
+                            (idle and now - conn.last_active > self.IDLE_TIMEOUT):
+                        self._drop_client(sel, connections, conn)
+                    elif stream_to is not None:
+                        sel.unregister(conn.sock)
+                        del connections[conn.sock]
+                        stream_to.subscribe(conn.sock)
+                    else:
+                        sel.modify(
+                            conn.sock,
+                            selectors.EVENT_READ | selectors.EVENT_WRITE if has_output else selectors.EVENT_READ,
+                            conn
+                        )
+        finally:
+            ''' always stop the worker, even if the loop fails '''
+            self._requests.put(None)
+            worker.join()
+
+        ''' try to deliver the last replies (e.g. to /quit) '''
+        for conn in list(connections.values()):
+            try:
+                conn.sock.settimeout(1)
+                with conn.lock:
+                    conn.sock.sendall(conn.outbuf)
+            except (OSError, socket.error):
+                pass
+            self._drop_client(sel, connections, conn)
+        sel.close()
+        wakeup_r.close()
+        wakeup_w.close()
+
+    def _drop_client(self, sel, connections, conn):
+        try:
+            sel.unregister(conn.sock)
+        except (KeyError, ValueError):
+            pass
+        connections.pop(conn.sock, None)
+        try:
+            conn.sock.close()
+        except (OSError, socket.error):
+            pass
+
+    def _write_to_client(self, sel, connections, conn):
+        with conn.lock:
+            if not conn.outbuf:
+                return
+            try:
+                sent = conn.sock.send(conn.outbuf)
+            except BlockingIOError:
+                return
+            except (OSError, socket.error):
+                self._drop_client(sel, connections, conn)
+                return
+            conn.outbuf = conn.outbuf[sent:]
+        conn.last_active = monotonic()
+
+    def _read_from_client(self, sel, connections, conn):
+        try:
+            data = conn.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except (OSError, socket.error):
+            data = b''
+        if not data:
+            self._drop_client(sel, connections, conn)
+            return
+        conn.last_active = monotonic()
+        conn.inbuf += data
+        while conn.inbuf:
+            request, keep_alive = self._get_request(conn)
+            if request is None:
                 break
+            with conn.lock:
+                if conn.close_when_done or conn.stream_to is not None:
+                    ''' ignore requests after the last one '''
+                    conn.inbuf = b''
+                    break
+                try:
+                    self._requests.put_nowait((conn, request, keep_alive))
+                    conn.pending += 1
+                    if not keep_alive:
+                        conn.close_when_done = True
+                except queue.Full:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f'Remote Control Server busy; rejecting request from {conn.address[0]}:{conn.address[1]}')
+                    if conn.pending == 0:
+                        conn.outbuf += self._busy_reply
+                    conn.close_when_done = True
+                    conn.inbuf = b''
+                    break
+
+    def _get_request(self, conn):
+        ''' Extract a complete request from conn.inbuf
+
+            Returns
+            =======
+            (request, keep_alive)
+                request is the request line and headers (bytes),
+                or None if the request is not complete yet.
+        '''
+        buf = conn.inbuf
+        end = -1
+        for sep in (b'\r\n\r\n', b'\n\n'):
+            x = buf.find(sep)
+            if x > -1 and (end == -1 or x < end):
+                end = x
+                sep_len = len(sep)
+        if end == -1:
+            if len(buf) > self.MAX_REQUEST_SIZE:
+                with conn.lock:
+                    conn.outbuf += self._too_large_reply
+                    conn.close_when_done = True
+                conn.inbuf = b''
+            return None, False
+        head = buf[:end]
+        lines = head.decode('latin-1').splitlines()
+        headers = {}
+        for n in lines[1:]:
+            if ':' in n:
+                k, v = n.split(':', 1)
+                headers[k.strip().lower()] = v.strip().lower()
+        try:
+            body_len = int(headers.get('content-length', 0))
+        except ValueError:
+            body_len = 0
+        if len(buf) < end + sep_len + body_len:
+            if end + sep_len + body_len > self.MAX_REQUEST_SIZE:
+                with conn.lock:
+                    conn.outbuf += self._too_large_reply
+                    conn.close_when_done = True
+                conn.inbuf = b''
+            return None, False
+        conn.inbuf = buf[end + sep_len + body_len:]
+        connection = headers.get('connection', '')
+        if lines and lines[0].rstrip().endswith('HTTP/1.1'):
+            keep_alive = 'close' not in connection
+        else:
+            keep_alive = 'keep-alive' in connection
+        return head, keep_alive
+
+    def _request_worker(self, wakeup, dead_func):
+        ''' Execute the queued requests, one at a time '''
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            conn, request, keep_alive = item
+            sink = _ResponseSink(conn, keep_alive, wakeup)
+            with self.lock:
+                self.client_socket = sink
             self.error = None
-            self._handle_client_connection(address, request)
+            try:
+                self._handle_client_connection(conn.address, request)
+            except Exception:
+                logger.error('Remote Control Server: error handling request', exc_info=True)
+            with self.lock:
+                self.client_socket = None
+            sink.finish()
+            self._publish_state()
             if self.error is not None:
-                # self.client_socket.close()
                 self._remove_report_file()
                 dead_func(self.error)
-                break
-            if self._path == '/quit':
-                self.client_socket.close()
+                self._stop_serving = True
+                wakeup()
+            elif self._path == '/quit':
                 self._remove_report_file()
-                break
-        server.close()
-        if logger.isEnabledFor(logging.INFO):
-            logger.info('Remote Control Server exiting...')
-        # just in case...
-        self._remove_report_file()
+                self._stop_serving = True
+                wakeup()
 
     def _create_report_file(self):
         try:
@@ -1091,6 +1517,11 @@ Restricted Commands (Main mode only)
         if logger.isEnabledFor(logging.INFO):
             logger.info(f'Accepted connection from {address[0]}:{address[1]} -> {self._path}')
 
+        if self._path.startswith('/api/'):
+            self._is_html = False
+            self._handle_api_request(rcv)
+            return True
+
         # self._is_html = True if self._path.startswith('/html') else False
         if self._path.startswith('/html'):
             self._is_html = True
@@ -1101,7 +1532,13 @@ Restricted Commands (Main mode only)
             self._commands['/html_init']()
 
         elif self._path == '/title':
-            self.send_song_title(self.song_title())
+            if self._is_html:
+                ''' long lived event stream '''
+                self._sse.publish('/html/title', self._format_song_title(self.song_title()))
+                self._publish_state()
+                self.client_socket.stream_to(self._sse)
+            else:
+                self.send_song_title(self.song_title())
 
         elif self._path == '/favicon.ico':
             pass
@@ -1133,21 +1570,7 @@ Restricted Commands (Main mode only)
                 else:
                     self._send_text('Recording not supported')
             if self._is_html:
-                ''' 0: rec disabled, not recording
-                    1: rec enabled, not recording
-                    2: rec disabled, recording
-                    3: rec enabled, recording
-                '''
-                if self._player().recording == 0:
-                    if self._player().currently_recording:
-                        self._send_raw('2')
-                    else:
-                        self._send_raw('0')
-                else:
-                    if self._player().currently_recording:
-                        self._send_raw('3')
-                    else:
-                        self._send_raw('1')
+                self._send_raw(self._recording_status())
             else:
                 rec = ', currently recording' if self._player().currently_recording else ''
                 if self._player().recording == 0:
@@ -1808,12 +2231,208 @@ Restricted Commands (Main mode only)
 
         return True
 
-    def send_song_title(self, msg=None):
-        # logger.error(f'\n\n\n{msg = }\n\n\n')
-        # if not msg:
-        #     self._empty_song_title_count += 1
-        #     if self._empty_song_title_count > 3:
-        #         return
+    def _handle_api_request(self, request):
+        ''' Serve the versioned JSON API
+
+                /api/v1/stations    stations of the loaded playlist
+                /api/v1/playlists   available playlists
+                /api/v1/state       player state
+
+            The lists accept "?offset=x&limit=y" for paging.
+            Every reply carries an ETag; a request with a
+            matching If-None-Match header gets a 304 reply.
+        '''
+        headers = {}
+        for n in request.splitlines()[1:]:
+            if ':' in n:
+                k, v = n.split(':', 1)
+                headers[k.strip().lower()] = v.strip()
+        url = urlsplit(self._path)
+        path = url.path.rstrip('/')
+        query = parse_qs(url.query)
+        try:
+            offset = int(query.get('offset', ['0'])[0])
+            limit = query.get('limit', [None])[0]
+            if limit is not None:
+                limit = int(limit)
+            if offset < 0 or (limit is not None and limit < 0):
+                raise ValueError
+        except ValueError:
+            self._send_json({'error': 'invalid offset or limit'}, status='400 Bad Request')
+            return
+
+        if path == '/api/v1/stations':
+            items = self.lists()[0][-1]
+            tag = (self._cnf.playlist_generation, id(items), len(items), self.playlist_in_editor())
+            build = lambda: self._api_stations(items, offset, limit)
+        elif path == '/api/v1/playlists':
+            items = self.lists()[1][-1]
+            tag = (self._cnf.playlist_generation, id(items), len(items))
+            build = lambda: self._api_playlists(items, offset, limit)
+        elif path == '/api/v1/state':
+            ''' small and ever changing; tagged by its content '''
+            tag = None
+            build = self._api_state
+        else:
+            self._send_json({'error': 'not found'}, status='404 Not Found')
+            return
+
+        cached = self._api_cache.get(self._path)
+        if tag is None:
+            body = self._json_dumps(build())
+            etag = 'W/"' + hashlib.md5(body).hexdigest()[:16] + '"'
+            if cached and cached[0] == etag:
+                body = None
+        else:
+            etag = 'W/"' + hashlib.md5(repr(tag).encode('utf-8')).hexdigest()[:16] + '"'
+            body = None if cached and cached[0] == etag else self._json_dumps(build())
+        if body is None:
+            etag, body, gz_body = cached
+        else:
+            gz_body = None
+            if len(body) > self.API_GZIP_MIN_SIZE:
+                gz_body = gzip.compress(body, compresslevel=6)
+            if len(self._api_cache) > 64:
+                self._api_cache.clear()
+            self._api_cache[self._path] = (etag, body, gz_body)
+
+        if_none_match = headers.get('if-none-match', '')
+        if if_none_match:
+            ''' weak comparison, as per RFC 9110 '''
+            tags = [x.strip().replace('W/', '', 1) for x in if_none_match.split(',')]
+            if '*' in tags or etag.replace('W/', '', 1) in tags:
+                self._send_json(None, etag=etag, status='304 Not Modified')
+                return
+        if gz_body is not None and \
+                'gzip' in headers.get('accept-encoding', '').lower():
+            self._send_json(gz_body, etag=etag, encoding='gzip')
+        else:
+            self._send_json(body, etag=etag)
+
+    def _json_dumps(self, obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _api_page(self, items, offset, limit):
+        if limit is None:
+            return items[offset:]
+        return items[offset:offset+limit]
+
+    def _api_stations(self, items, offset, limit):
+        out = []
+        for i, n in enumerate(self._api_page(items, offset, limit), start=offset+1):
+            out.append({
+                'id': i,
+                'name': n[0],
+                'url': n[1],
+                'group': n[1] == '-'
+            })
+        return {
+            'version': 1,
+            'playlist': basename(self.playlist_in_editor()[:-4]),
+            'total': len(items),
+            'offset': offset,
+            'limit': limit,
+            'stations': out
+        }
+
+    def _api_playlists(self, items, offset, limit):
+        pl = basename(self.playlist_in_editor()[:-4])
+        out = []
+        for i, n in enumerate(self._api_page(items, offset, limit), start=offset+1):
+            out.append({
+                'id': i,
+                'name': n[0],
+                'loaded': n[0] == pl
+            })
+        return {
+            'version': 1,
+            'total': len(items),
+            'offset': offset,
+            'limit': limit,
+            'playlists': out
+        }
+
+    def _api_state(self):
+        ''' ids are 1-based, like the ones of the text
+            commands; 0 means nothing selected / playing
+        '''
+        selection, playing = self.sel()
+        title = self.song_title()
+        if title and title.split(': ')[0] in ('mpv', 'mplayer', 'vlc'):
+            title = ': '.join(title.split(': ')[1:])
+        try:
+            volume = self._player().volume
+        except AttributeError:
+            volume = -1
+        return {
+            'version': 1,
+            'playlist': basename(self.playlist_in_editor()[:-4]),
+            'radio_browser': bool(self._cnf.browsing_station_service),
+            'selection': selection + 1,
+            'playing': playing + 1,
+            'title': title if title else '',
+            'volume': volume,
+            'muted': bool(self.muted()),
+            'recording': int(self._recording_status())
+        }
+
+    def _send_json(self, body, etag=None, encoding=None, status='200 OK'):
+        ''' body is either bytes or an object to be serialized '''
+        if body is None:
+            body = b''
+        elif not isinstance(body, bytes):
+            body = self._json_dumps(body)
+        extra = ''
+        if etag:
+            extra += f'ETag: {etag}\n'
+        if encoding:
+            extra += f'Content-Encoding: {encoding}\n'
+        txt = f'''HTTP/1.1 {status}
+Content-Type: application/json; charset=UTF-8
+Cache-Control: no-cache
+Vary: Accept-Encoding
+{extra}Connection: keep-alive, Keep-Alive
+Keep-Alive: timeout=30, max=1000
+Content-Length: {len(body)}
+
+'''.encode('utf-8')
+        with self.lock:
+            try:
+                self.client_socket.sendall(txt + body)
+            except socket.error as e:
+                self.error = e
+
+    def _recording_status(self):
+        ''' 0: rec disabled, not recording
+            1: rec enabled, not recording
+            2: rec disabled, recording
+            3: rec enabled, recording
+        '''
+        if self._player().recording == 0:
+            if self._player().currently_recording:
+                return '2'
+            return '0'
+        if self._player().currently_recording:
+            return '3'
+        return '1'
+
+    def _publish_state(self):
+        ''' push playing, muted, recording and volume
+            changes to the event stream subscribers '''
+        if not callable(self.sel):
+            ''' server not started yet '''
+            return
+        try:
+            self._sse.publish('/html/playing', '1' if self.sel()[1] > -1 else '0')
+            self._sse.publish('/html/muted', '0' if self.muted() else '1')
+            self._sse.publish('/html/recording', self._recording_status())
+            self._sse.publish('/html/volume', str(self._player().volume))
+        except (AttributeError, TypeError, IndexError):
+            pass
+
+    def _format_song_title(self, msg):
+        if not msg:
+            msg = ''
         if msg.startswith('mpv: ') or \
                 msg.startswith('mplayer: ') or \
                 msg.startswith('vlc: '):
@@ -1821,13 +2440,24 @@ Restricted Commands (Main mode only)
             d_msg = ''.join(sp[1:])
         else:
             d_msg = msg
-        f_msg = 'retry: 150\nevent: /html/title\ndata: <b>' + d_msg + '</b>\n\n'
+        return '<b>' + d_msg + '</b>'
+
+    def send_song_title(self, msg=None):
+        # logger.error(f'\n\n\n{msg = }\n\n\n')
+        # if not msg:
+        #     self._empty_song_title_count += 1
+        #     if self._empty_song_title_count > 3:
+        #         return
+        d_msg = self._format_song_title(msg)
+        self._sse.publish('/html/title', d_msg)
+        self._publish_state()
+        f_msg = 'retry: 150\nevent: /html/title\ndata: ' + d_msg + '\n\n'
         b_msg = f_msg.encode('utf-8')
         txt = f'''HTTP/1.1 200 OK
 Content-Type: text/event-stream; charset=UTF-8
 Cache-Control: no-cache
 Connection: keep-alive, Keep-Alive
-Keep-Alive: timeout=1, max=1000
+Keep-Alive: timeout=30, max=1000
 Content-Length: {len(b_msg)}
 
 '''.encode('utf-8')
@@ -1850,7 +2480,7 @@ Content-Length: {len(b_msg)}
         txt = f'''HTTP/1.1 200 OK
 Content-Type: text/txt; charset=UTF-8
 Connection: keep-alive, Keep-Alive
-Keep-Alive: timeout=1, max=1000
+Keep-Alive: timeout=30, max=1000
 Content-Length: {len(b_msg)}
 
 '''.encode('utf-8')
@@ -1875,7 +2505,7 @@ Content-Length: {len(b_msg)}
         txt = f'''HTTP/1.1 200 OK
 Content-Type: text/txt; charset=UTF-8
 Connection: keep-alive, Keep-Alive
-Keep-Alive: timeout=1, max=1000
+Keep-Alive: timeout=30, max=1000
 Content-Length: {len(b_msg)}
 
 '''.encode('utf-8')
@@ -1893,7 +2523,7 @@ Content-Length: {len(b_msg)}
         txt = f'''HTTP/1.1 200 OK
 Content-Type: text/html; charset=UTF-8
 Connection: keep-alive, Keep-Alive
-Keep-Alive: timeout=1, max=1000
+Keep-Alive: timeout=30, max=1000
 Content-Length: {len(b_msg)}
 
 '''.encode('utf-8')
@@ -13,13 +13,9 @@ import logging
 import os
 import shlex
 import queue
+import socket
 from enum import Enum
 from datetime import datetime
-if platform.system().lower().startswith('win'):
-    try:
-        import win32com.client
-    except:
-        pass
 from .common import M_STRINGS
 from .tts_text import tts_transform_to_string
 
@@ -205,20 +201,280 @@ class TTSBase:
 
         return result
 
+class SSIPMessage:
+    """A message queued to speech-dispatcher"""
+
+    def __init__(self, msg_id):
+        self.msg_id = msg_id
+        self.ok = False
+        self._done = threading.Event()
+
+    def finish(self, ok):
+        self.ok = ok
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """Wait until the message is spoken or canceled"""
+        return self._done.wait(timeout)
+
+class SSIPConnection:
+    """
+    Persistent connection to speech-dispatcher (SSIP protocol)
+
+    Commands are sent over one socket instead of running spd-say
+    for every message. speech-dispatcher reports the end (or the
+    cancellation) of each message with an event, which the reader
+    thread passes on to the SSIPMessage returned by speak().
+    """
+
+    TIMEOUT = 5
+
+    def __init__(self):
+        self._sock = None
+        self._replies = queue.Queue()
+        self._command_lock = threading.Lock()
+        self._messages = {}
+        self._messages_lock = threading.Lock()
+        self.connected = False
+
+    @staticmethod
+    def address():
+        """Get speech-dispatcher's socket family and address"""
+        method, _, rest = os.environ.get('SPEECHD_ADDRESS', '').partition(':')
+        if method == 'inet_socket':
+            host, _, port = rest.partition(':')
+            return socket.AF_INET, (host or '127.0.0.1', int(port) if port else 6560)
+        if method == 'unix_socket' and rest:
+            return socket.AF_UNIX, rest
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if runtime_dir:
+            return socket.AF_UNIX, os.path.join(runtime_dir, 'speech-dispatcher', 'speechd.sock')
+        return socket.AF_UNIX, os.path.expanduser('~/.cache/speech-dispatcher/speechd.sock')
+
+    def connect(self, autospawn=True):
+        """Connect to speech-dispatcher, starting it if needed"""
+        family, address = self.address()
+        try:
+            self._sock = self._open(family, address)
+        except OSError:
+            if not autospawn:
+                raise
+            # This is what spd-say does when the server is not running
+            subprocess.run(
+                ['speech-dispatcher', '--spawn'],
+                capture_output=True,
+                timeout=self.TIMEOUT
+            )
+            self._sock = self._open(family, address)
+        self.connected = True
+        threading.Thread(
+            target=self._read,
+            daemon=True,
+            name="TTS-SSIP"
+        ).start()
+        user = os.environ.get('USER', 'user').replace(' ', '_')
+        self.command(f'SET self CLIENT_NAME {user}:pyradio:tts')
+        self.command('SET self NOTIFICATION end on')
+        self.command('SET self NOTIFICATION cancel on')
+
+    def _open(self, family, address):
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(self.TIMEOUT)
+        try:
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(None)
+        return sock
+
+    def command(self, line):
+        """Send a command, return the reply code and lines"""
+        with self._command_lock:
+            return self._send(line + '\r\n')[:2]
+
+    def set(self, name, value):
+        self.command(f'SET self {name} {value}')
+
+    def speak(self, text):
+        """Queue text for speaking, return its SSIPMessage"""
+        # A line starting with a dot is escaped by doubling the dot
+        lines = ['.' + line if line.startswith('.') else line
+                 for line in text.splitlines() or ['']]
+        with self._command_lock:
+            self._send('SPEAK\r\n')
+            return self._send('\r\n'.join(lines) + '\r\n.\r\n')[2]
+
+    def cancel(self):
+        """Cancel the message being spoken and all queued ones"""
+        self.command('CANCEL self')
+
+    def close(self):
+        if self._sock is None:
+            return
+        if self.connected:
+            self.connected = False
+            try:
+                self._sock.sendall(b'QUIT\r\n')
+            except OSError:
+                pass
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def _send(self, data):
+        """Send data and wait for the reply (command lock held)"""
+        if not self.connected:
+            raise ConnectionError('not connected to speech-dispatcher')
+        self._sock.sendall(data.encode('utf-8'))
+        try:
+            reply = self._replies.get(timeout=self.TIMEOUT)
+        except queue.Empty:
+            # the connection cannot be trusted any more
+            self.close()
+            raise TimeoutError('no reply from speech-dispatcher')
+        if reply is None:
+            raise ConnectionError('speech-dispatcher closed the connection')
+        code, lines, _ = reply
+        if not code.startswith('2'):
+            raise OSError(f'speech-dispatcher error: {code} {lines[-1]}')
+        return reply
+
+    def _read(self):
+        """Read replies and events; "NNN-data" lines continue, "NNN data" ends"""
+        lines = []
+        try:
+            for raw in self._sock.makefile('rb'):
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                lines.append(line[4:])
+                if line[3:4] != '-':
+                    self._dispatch(line[:3], lines)
+                    lines = []
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.connected = False
+            with self._messages_lock:
+                messages = list(self._messages.values())
+                self._messages.clear()
+            for message in messages:
+                message.finish(False)
+            self._replies.put(None)
+
+    def _dispatch(self, code, lines):
+        if code.startswith('7'):
+            # An event: message id, client id, event name
+            if code in ('702', '703'):
+                with self._messages_lock:
+                    message = self._messages.pop(lines[0], None)
+                if message is not None:
+                    message.finish(code == '702')
+            return
+        message = None
+        if code == '225':
+            # Message queued; register it before any of its events arrives
+            message = SSIPMessage(lines[0])
+            with self._messages_lock:
+                self._messages[message.msg_id] = message
+        self._replies.put((code, lines, message))
+
 class TTSLinux(TTSBase):
-    """Linux TTS implementation using user-configured command"""
+    """
+    Linux TTS implementation
+
+    Speaks through a persistent connection to speech-dispatcher;
+    falls back to running spd-say if it cannot connect.
+    """
 
     def __init__(self, config, volume, rate, pitch, verbosity, speak_volume, speak_volume_start):
         super().__init__(config, volume, rate, pitch, verbosity, speak_volume, speak_volume_start)
         self.retry_count = 0
         self.max_retries = 2
+        self._ssip = None
+        self._ssip_failed = False
+        self._ssip_settings = None
 
     def _calculate_volume(self):
         volume = int(self.volume())
         return str(2 * volume - 100)
 
+    def _connection(self):
+        """Return the connection to speech-dispatcher, None to use spd-say"""
+        if self._ssip is not None and self._ssip.connected:
+            return self._ssip
+        if self._ssip_failed:
+            return None
+        # Connect (or reconnect, if speech-dispatcher was restarted)
+        connection = SSIPConnection()
+        try:
+            connection.connect()
+        except (OSError, subprocess.SubprocessError) as e:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Cannot connect to speech-dispatcher ({e}), using spd-say")
+            connection.close()
+            self._ssip_failed = True
+            return None
+        self._ssip = connection
+        self._ssip_settings = None
+        return connection
+
+    def _cancel_speech(self):
+        """Cancel speech over the connection; return False if there is none"""
+        connection = self._ssip
+        if connection is None or not connection.connected:
+            return False
+        try:
+            connection.cancel()
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cannot cancel speech: {e}")
+        return True
+
+    def request_external_stop(self, priority=Priority.DIALOG):
+        """Request external stop, cancelling the message being spoken"""
+        super().request_external_stop(priority)
+        self._cancel_speech()
+
     def _execute_speech(self, text, priority=Priority.NORMAL):
         """Execute speech with priority-based blocking behavior"""
+        connection = self._connection()
+        if connection is None:
+            return self._execute_spd_say(text, priority)
+
+        # Clear external stop flag for the given priority
+        self._clear_external_stop(priority)
+        try:
+            settings = (self._calculate_volume(), self.rate(), self.pitch())
+            if settings != self._ssip_settings:
+                connection.set('LANGUAGE', 'en')
+                connection.set('VOLUME', settings[0])
+                connection.set('RATE', settings[1])
+                connection.set('PITCH', settings[2])
+                self._ssip_settings = settings
+            if priority == Priority.NAVIGATION:
+                # A new position replaces whatever is still being said
+                connection.cancel()
+            message = connection.speak(text)
+        except OSError as e:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"speech-dispatcher error: {e}")
+            connection.close()
+            return False
+
+        if priority in (Priority.HIGH, Priority.DIALOG, Priority.NAVIGATION):
+            # Wait for the end (or cancel) event; an external stop
+            # or a shutdown cancels the message, which ends the wait
+            message.wait()
+            if self._should_stop_externally(priority) or \
+                    self.state == TTSState.SHUTTING_DOWN:
+                return False
+            return message.ok
+        return True
+
+    def _execute_spd_say(self, text, priority=Priority.NORMAL):
+        """Execute speech by running spd-say"""
         try:
             # Clear external stop flag for the given priority
             self._clear_external_stop(priority)
@@ -371,6 +627,10 @@ class TTSLinux(TTSBase):
             # Clear all external stop flags
             self._clear_external_stop()
 
+            if self._cancel_speech():
+                # CANCEL returns once speech has stopped
+                return
+
             # Stop all speech using -S flag
             subprocess.run(['spd-say', '-S'], capture_output=True)
             # Anti-stutter delay
@@ -381,7 +641,10 @@ class TTSLinux(TTSBase):
         with self._lock:
             self.state = TTSState.SHUTTING_DOWN
             # Linux: Stop all speech immediately
-            subprocess.run(['spd-say', '-S'], capture_output=True)
+            if self._cancel_speech():
+                self._ssip.close()
+            else:
+                subprocess.run(['spd-say', '-S'], capture_output=True)
 
     def wait_for_shutdown(self, timeout=2.0):
         """Phase 2: Wait for complete shutdown (blocking)"""
@@ -396,6 +659,8 @@ class TTSWindows(TTSBase):
 
     def __init__(self, config, volume, rate, pitch, verbosity, speak_volume, speak_volume_start):
         super().__init__(config, volume, rate, pitch, verbosity, speak_volume, speak_volume_start)
+        # Imported here; win32com is slow to import
+        import win32com.client
         self.speaker = win32com.client.Dispatch("SAPI.SpVoice")
 
         # Try to set an English voice
@@ -872,6 +1137,7 @@ class TTSManager:
     def _check_windows_availability(self):
         """Check if Windows TTS is available via SAPI"""
         try:
+            import win32com.client
             speaker = win32com.client.Dispatch("SAPI.SpVoice")
             # Test with empty speech
             speaker.Speak("", 1)
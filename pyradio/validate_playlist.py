@@ -4,19 +4,38 @@ Playlist validation utilities with threading and host-aware throttling
 """
 import sys
 import locale
+import random
+import hashlib
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from os import remove
+from time import perf_counter
 from urllib.parse import urlparse
-from collections import defaultdict
 import requests
+from requests.adapters import HTTPAdapter
 
 from .common import Station, RichColorPrinter
 
 locale.setlocale(locale.LC_ALL, "")
 
 
-def check_url(url, referer_url, semaphore, timeout=5, read_bytes=1024):
+UrlCheck = namedtuple('UrlCheck', 'ok content_type signature latency')
+
+
+def check_url(url, referer_url, session, timeout=5, read_bytes=1024):
     """Check if URL provides actual playable audio stream using requests"""
+    return probe_url(url, referer_url, session, timeout, read_bytes).ok
+
+
+def probe_url(url, referer_url, session, timeout=5, read_bytes=1024):
+    """
+    Check if URL provides actual playable audio stream using requests
+
+    Returns an UrlCheck: the result, the Content-Type, the audio
+    signature found in the first bytes and the response time
+    """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Accept': 'audio/*, video/*, */*',
@@ -26,17 +45,21 @@ def check_url(url, referer_url, semaphore, timeout=5, read_bytes=1024):
     if referer_url:
         headers['Referer'] = referer_url
 
+    start = perf_counter()
     try:
-        with semaphore:
-            # USE REQUESTS INSTEAD OF URLLIB
-            response = requests.get(
-                url,
-                headers=headers,
-                timeout=timeout,
-                stream=True,  # Important for audio streams
-                allow_redirects=True  # AUTO-REDIRECTS!
-            )
-            response.raise_for_status()  # Raise exception for bad status codes
+        # USE THE HOST'S POOLED SESSION; closing the response
+        # returns the connection to the pool
+        with session.get(
+            url,
+            headers=headers,
+            timeout=timeout,
+            stream=True,  # Important for audio streams
+            allow_redirects=True  # AUTO-REDIRECTS!
+        ) as response:
+            latency = perf_counter() - start
+            content_type = response.headers.get('Content-Type', '').lower()
+            if not response.ok:
+                return UrlCheck(False, content_type, '', latency)
 
             # 1. READ FIRST BYTES
             data = b''
@@ -44,6 +67,7 @@ def check_url(url, referer_url, semaphore, timeout=5, read_bytes=1024):
                 if chunk:
                     data = chunk
                     break
+            signature = audio_signature(data)
 
             # 2. CHECK FOR HTML RESPONSES
             is_html = (data.startswith(b'<html') or
@@ -52,56 +76,57 @@ def check_url(url, referer_url, semaphore, timeout=5, read_bytes=1024):
                       b'<!' in data[:100])
 
             if is_html:
-                return False  # Server returned HTML, not audio
+                # Server returned HTML, not audio
+                return UrlCheck(False, content_type, signature, latency)
 
             # 3. CHECK CONTENT-TYPE - MUST be audio/video
-            content_type = response.headers.get('Content-Type', '').lower()
             is_media = any(media_type in content_type for media_type in
                          ['audio/', 'video/', 'application/ogg', 'application/vnd.apple.mpegurl'])
 
-            if is_media:
-                return True  # Content-Type confirms it's media
-
             # 4. CHECK FOR ICY METADATA (Shoutcast/Icecast)
             icy_headers = any(response.headers.get(h) for h in
                             ['icy-name', 'icy-genre', 'icy-url'])
 
-            if icy_headers:
-                return True  # ICY headers confirm it's a stream
-
             # 5. FINAL CHECK: VERIFY AUDIO SIGNATURES
-            return detect_audio_signatures(data)
+            return UrlCheck(
+                is_media or icy_headers or bool(signature),
+                content_type, signature, latency
+            )
 
     except requests.exceptions.RequestException:
-        return False
+        return UrlCheck(False, '', '', None)
     except Exception:
-        return False
+        return UrlCheck(False, '', '', None)
 
-def detect_audio_signatures(data):
-    """Check for actual audio stream signatures"""
+def audio_signature(data):
+    """Return the name of the audio stream signature found in data ('' if none)"""
     # Common audio format headers
     audio_patterns = [
-        (b'ID3', 0),           # MP3 metadata (start of data)
-        (b'\xFF\xFB', 0),      # MP3 frame sync
-        (b'\xFF\xF1', 0),      # AAC frame sync
-        (b'OggS', 0),          # OGG container
-        (b'fLaC', 0),          # FLAC
-        (b'#EXTM3U', 0),       # HLS playlist
-        (b'RIFF', 0),          # WAV
-        (b'\x00\x00\x00\x18ftyp', 4),  # MP4
+        (b'ID3', 0, 'mp3'),           # MP3 metadata (start of data)
+        (b'\xFF\xFB', 0, 'mp3'),      # MP3 frame sync
+        (b'\xFF\xF1', 0, 'aac'),      # AAC frame sync
+        (b'OggS', 0, 'ogg'),          # OGG container
+        (b'fLaC', 0, 'flac'),         # FLAC
+        (b'#EXTM3U', 0, 'hls'),       # HLS playlist
+        (b'RIFF', 0, 'wav'),          # WAV
+        (b'\x00\x00\x00\x18ftyp', 4, 'mp4'),  # MP4
     ]
 
-    for pattern, offset in audio_patterns:
+    for pattern, offset, name in audio_patterns:
         if len(data) > offset + len(pattern) and data[offset:offset+len(pattern)] == pattern:
-            return True
+            return name
 
     # For streams that might not have clear headers, check for non-text data
     if len(data) > 100:
         text_chars = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)) - {0x7f})
-        is_likely_binary = bool(data.translate(None, text_chars))
-        return is_likely_binary
+        if data.translate(None, text_chars):
+            return 'binary'
 
-    return False
+    return ''
+
+def detect_audio_signatures(data):
+    """Check for actual audio stream signatures"""
+    return bool(audio_signature(data))
 
 def print_statistics(total_count, online_count, groups_count, printer):
     """
@@ -155,8 +180,294 @@ def print_statistics(total_count, online_count, groups_count, printer):
 
     printer("[cyan]" + "="*50 + "[/cyan]")
 
-def check_playlist(file_path, mode="mark", threads=5, timeout=5, max_per_host=2, with_date=False, no_color=False, verbose=True):
-    """Validate a CSV or M3U playlist with host-aware throttling"""
+class ValidationCheckpoint:
+    """
+    Results of an interrupted validation
+
+    The file starts with a header line holding a hash of the
+    playlist's URLs, followed by one "index result" line per
+    checked station. Results are appended as soon as they are
+    known, so an interrupted run can be resumed.
+    """
+
+    def __init__(self, file_path, items):
+        self.file_path = file_path
+        digest = hashlib.sha1()
+        for st in items:
+            digest.update(st[Station.url].encode('utf-8', 'replace') + b'\n')
+        self._header = f"# {digest.hexdigest()} {len(items)}\n"
+        self._file = None
+
+    def read(self):
+        """Return {index: ok} of a previous run of the same playlist"""
+        results = {}
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                if f.readline() != self._header:
+                    return {}
+                for line in f:
+                    try:
+                        idx, ok = line.split()
+                        results[int(idx)] = ok == '1'
+                    except ValueError:
+                        # a line cut short by the interruption
+                        continue
+        except OSError:
+            return {}
+        return results
+
+    def open(self, results):
+        """Start a checkpoint holding results"""
+        try:
+            self._file = open(self.file_path, 'w', encoding='utf-8', buffering=1)
+            self._file.write(self._header)
+            self._file.writelines(f"{idx} {int(ok)}\n" for idx, ok in results.items())
+        except OSError:
+            self._file = None
+
+    def add(self, idx, ok):
+        if self._file:
+            self._file.write(f"{idx} {int(ok)}\n")
+
+    def close(self, remove_file=False):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if remove_file:
+            try:
+                remove(self.file_path)
+            except OSError:
+                pass
+
+
+class HostScheduler:
+    """
+    Feed stations to a thread pool without exceeding a global
+    and a per host number of concurrent checks
+
+    A station is only submitted when its host has a free slot,
+    so no worker thread is ever kept waiting for a host.
+    Each host gets its own session, so that connections are
+    reused.
+    """
+
+    def __init__(self, executor, budget, max_per_host, timeout):
+        self._executor = executor
+        self._budget = budget
+        self._max_per_host = max_per_host
+        self._timeout = timeout
+        self._pending = {}      # host -> deque of (idx, url, referer)
+        self._ready = deque()   # hosts with pending stations and free slots
+        self._running = {}      # host -> number of running checks
+        self._sessions = {}
+        self.futures = {}       # future -> (idx, host, url)
+
+    def add(self, idx, url, referer):
+        host = urlparse(url).hostname
+        if host not in self._pending:
+            self._pending[host] = deque()
+            self._running[host] = 0
+            self._ready.append(host)
+        self._pending[host].append((idx, url, referer))
+
+    def _session(self, host):
+        if host not in self._sessions:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._sessions[host] = session
+        return self._sessions[host]
+
+    def fill(self):
+        """Submit stations while there are free slots (round robin on hosts)"""
+        while self._ready and len(self.futures) < self._budget:
+            host = self._ready.popleft()
+            idx, url, referer = self._pending[host].popleft()
+            self._running[host] += 1
+            future = self._executor.submit(
+                probe_url, url, referer, self._session(host), self._timeout, 1024
+            )
+            self.futures[future] = (idx, host, url)
+            if self._pending[host] and self._running[host] < self._max_per_host:
+                self._ready.append(host)
+
+    def done(self, future):
+        """Release the slot of a finished check; return its index and url"""
+        idx, host, url = self.futures.pop(future)
+        self._running[host] -= 1
+        if self._pending[host] and self._running[host] == self._max_per_host - 1:
+            self._ready.append(host)
+        return idx, url
+
+    def close(self):
+        for session in self._sessions.values():
+            session.close()
+
+
+class RandomStationPool:
+    """
+    A few random stations of a playlist, already found to be online
+
+    A background thread probes random stations of the playlist
+    (the same stream header check as check_url, with a shorter
+    timeout) and keeps up to SIZE of the working ones, so that
+    random playback does not land on dead stations.
+
+    The pool is emptied whenever set_playlist() is given a new
+    playlist, and refilled after every take().
+    """
+
+    SIZE = 3
+    TIMEOUT = 3
+
+    # probes per refill, so that a mostly dead playlist
+    # is not probed over and over
+    MAX_PROBES = 20
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._pool = deque()
+        self._failed = set()
+        self._stations = None
+        self._key = None
+        self._thread = None
+        self._stop = False
+
+    def set_playlist(self, stations, generation):
+        """Use stations (the current playlist), empty the pool if it has changed"""
+        key = (generation, id(stations), len(stations))
+        with self._lock:
+            if key == self._key:
+                return
+            self._key = key
+            self._stations = stations
+            self._pool.clear()
+            self._failed.clear()
+        self._refill()
+
+    def take(self, exclude=-1):
+        """
+        Return the index of a verified station (never exclude),
+        or None if none is ready yet; refill the pool afterwards
+        """
+        index = None
+        with self._lock:
+            while self._pool:
+                candidate = self._pool.popleft()
+                if candidate != exclude:
+                    index = candidate
+                    break
+        self._refill()
+        return index
+
+    def shutdown(self):
+        with self._lock:
+            self._stop = True
+        self._session.close()
+
+    def _refill(self):
+        with self._lock:
+            if self._stop or not self._stations or \
+                    len(self._pool) >= self.SIZE or \
+                    (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(
+                target=self._fill,
+                args=(self._key, ),
+                name='random-pool',
+                daemon=True
+            )
+            self._thread.start()
+
+    def _candidate(self):
+        """Return a random station index not yet probed (lock held)"""
+        stations = self._stations
+        for _ in range(10):
+            idx = random.randrange(len(stations))
+            if stations[idx][Station.url] != '-' and \
+                    idx not in self._pool and idx not in self._failed:
+                return idx
+        return None
+
+    def _fill(self, key):
+        for _ in range(self.MAX_PROBES):
+            with self._lock:
+                if self._stop or key != self._key or \
+                        len(self._pool) >= self.SIZE:
+                    return
+                idx = self._candidate()
+                if idx is None:
+                    return
+                station = self._stations[idx]
+            url = station[Station.url]
+            referer = station[Station.referer] if len(station) > Station.referer else ''
+            try:
+                ok = probe_url(url, referer, self._session, self.TIMEOUT).ok
+            except Exception:
+                ok = False
+            with self._lock:
+                if key != self._key:
+                    return
+                if ok:
+                    self._pool.append(idx)
+                else:
+                    self._failed.add(idx)
+
+
+def _write_playlist(out_file, input_type, stations):
+    """Write stations (any iterable) to out_file; return an error or None"""
+    if input_type == "csv":
+        from .common import CsvReadWrite
+        if CsvReadWrite(out_file).write(items=stations) < 0:
+            return f'Cannot write "{out_file}".'
+        return None
+    from .m3u import list_to_m3u
+    error = list_to_m3u(stations, out_file)
+    if error:
+        return f'Cannot write "{out_file}"\n:  [red]{error}[/red].'
+    return None
+
+
+class StreamingPlaylistWriter:
+    """
+    Write a playlist in a thread of its own, from stations
+    put() to it while the validation is running
+    """
+
+    def __init__(self, out_file, input_type):
+        self.out_file = out_file
+        self.error = None
+        self._queue = Queue()
+        self._thread = threading.Thread(
+            target=self._write,
+            args=(input_type, ),
+            daemon=True
+        )
+        self._thread.start()
+
+    def _write(self, input_type):
+        self.error = _write_playlist(self.out_file, input_type, iter(self._queue.get, None))
+
+    def put(self, station):
+        self._queue.put(station)
+
+    def close(self):
+        """Finish the playlist; return an error or None"""
+        self._queue.put(None)
+        self._thread.join()
+        return self.error
+
+
+def check_playlist(file_path, mode="mark", threads=5, timeout=5, max_per_host=2, with_date=False, no_color=False, verbose=True, resume=True, health_file=None, recheck_hours=24):
+    """
+    Validate a CSV or M3U playlist with host-aware throttling
+
+    If health_file is given, the result of every check is saved in
+    it, and URLs checked less than recheck_hours ago are not checked
+    again (failed URLs are re-checked with backoff).
+    """
 
     items = []
     input_type = None
@@ -189,130 +500,138 @@ def check_playlist(file_path, mode="mark", threads=5, timeout=5, max_per_host=2,
         from datetime import datetime
         timestamp = datetime.now().strftime("-%Y-%m-%d-%H-%M-%S")
 
-    printer(f"[cyan]Checking {len(items)} stations using {threads} threads...[/cyan]")
-
-    # --- host-aware throttling setup ---
-    host_map = defaultdict(list)
-    for idx, st in enumerate(items):
-        host = urlparse(st[Station.url]).hostname
-        host_map[host].append((idx, st))
+    # --- results of an interrupted run ---
+    checkpoint = ValidationCheckpoint(f"{file_path}.checkpoint", items)
+    results = checkpoint.read() if resume else {}
+    if results:
+        printer(f'[cyan]Resuming: {len(results)} stations already checked[/cyan]')
+    checkpoint.open(results)
 
-    host_semaphores = {host: threading.BoundedSemaphore(max_per_host) for host in host_map}
+    # --- results of previous validations ---
+    health = None
+    if health_file:
+        from .common import StationHealthStore
+        health = StationHealthStore(health_file, window=recheck_hours * 3600)
+        health.read()
 
-    # --- threaded check ---
-    results_dict = {}   # idx -> (station, ok_flag)
-    futures = {}
+    printer(f"[cyan]Checking {len(items)} stations using {threads} threads...[/cyan]")
 
-    with ThreadPoolExecutor(max_workers=threads) as executor:
+    # --- output files, written while checking, in playlist order ---
+    if mode == "drop":
+        writers = (
+            StreamingPlaylistWriter(f"{file_path}.ok{timestamp}.{input_type}", input_type),
+            StreamingPlaylistWriter(f"{file_path}.bad{timestamp}.{input_type}", input_type)
+        )
+    else:
+        writers = (StreamingPlaylistWriter(f"{file_path}.validated{timestamp}.{input_type}", input_type), )
+
+    next_idx = 0
+    online_count = 0
+
+    def flush():
+        """write all stations whose result (and all before it) is known"""
+        nonlocal next_idx, online_count
+        while next_idx in results:
+            st = items[next_idx]
+            ok = results[next_idx]
+            if st[Station.url] == '-':
+                writers[0].put(st)
+            else:
+                if ok:
+                    online_count += 1
+                if mode == "drop":
+                    writers[0 if ok else 1].put(st)
+                else:
+                    if not ok:
+                        st = list(st)  # make copy
+                        st[Station.name] = "[X] " + st[Station.name]
+                    writers[0].put(st)
+            next_idx += 1
+
+    def report(idx, ok):
+        if verbose:
+            st = items[idx]
+            if st[Station.url] == '-':
+                printer(f"[cyan]{idx+1}[/cyan]. [cyan]GROUP[/cyan] {st[Station.name]}")
+            elif ok:
+                printer(f"[green]{idx+1}[/green]. [green]OK[/green] {st[Station.name]} ({st[Station.url]})")
+            else:
+                printer(f"[red]{idx+1}[/red]. [red]BROKEN[/red] {st[Station.name]} ({st[Station.url]})")
+
+    # --- host-aware throttled check ---
+    executor = ThreadPoolExecutor(max_workers=threads)
+    scheduler = HostScheduler(executor, threads, max_per_host, timeout)
+    cached_count = 0
+    try:
         for idx, st in enumerate(items):
-            # Check if it's a group header
-            if st[Station.url] == '-':  # Group header
-                results_dict[idx] = (st, True)  # Use None for group headers
-                if verbose:
-                    printer(f"[cyan]{idx+1}[/cyan]. [cyan]GROUP[/cyan] {st[Station.name]}")
+            if idx in results:
                 continue
-
             # do not check group headers
+            if st[Station.url] == '-':
+                results[idx] = True
+                report(idx, True)
+                continue
             url = st[Station.url].replace('https://', 'http://') if st[Station.http] else st[Station.url]
-            semaphore = host_semaphores[urlparse(url).hostname]
-            futures[executor.submit(check_url, url, st[Station.referer], semaphore, timeout, 1024)] = (idx, st)
-
-        for future in as_completed(futures):
-            idx, st = futures[future]
-            ok = False
-            try:
-                ok = future.result()
-            except Exception:
-                ok = False
-
-            # store result in dict
-            results_dict[idx] = (st, ok)
-
-            # print immediately
-            if verbose:
-                if ok:
-                    printer(f"[green]{idx+1}[/green]. [green]OK[/green] {st[Station.name]} ({st[Station.url]})")
-                else:
-                    printer(f"[red]{idx+1}[/red]. [red]BROKEN[/red] {st[Station.name]} ({st[Station.url]})")
-
-    # --- collect results in original order ---
-    ok_items, bad_items = [], []
-    for idx in range(len(items)):
-        st, ok_flag = results_dict[idx]
-        if ok_flag:
-            ok_items.append(st)
-        else:
-            bad_items.append(st)
-
-    # --- drop mode ---
-    if mode == "drop":
-        ok_file = f"{file_path}.ok{timestamp}.{input_type}"
-        bad_file = f"{file_path}.bad{timestamp}.{input_type}"
-        if input_type == "csv":
-            from .common import CsvReadWrite
-            ret = CsvReadWrite(ok_file).write(items=ok_items)
-            if ret < 0:
-                printer(f'[red]Error:[/red] Cannot write "{ok_file}".')
-                sys.exit(1)
-            printer(f'[green]Saved working stations to "{ok_file}"[/green]')
-            ret = CsvReadWrite(bad_file).write(items=bad_items)
-            if ret < 0:
-                printer(f'[red]Error:[/red] Cannot write "{bad_file}".')
-                sys.exit(1)
-            printer(f'[yellow]Saved failed stations to "{bad_file}"[/yellow]')
-        else:
-            from .m3u import list_to_m3u
-            error = list_to_m3u(ok_items, ok_file)
-            if error:
-                printer(f'[red]Error:[/red] Cannot write "{ok_file}"\n:  [red]{error}[/red].')
-                sys.exit(1)
-            printer(f'[green]Saved working stations to "{ok_file}"[/green]')
-            error = list_to_m3u(bad_items, bad_file)
-            if error:
-                printer(f'[red]Error:[/red] Cannot write "{bad_file}"\n:  [red]{error}[/red].')
-                sys.exit(1)
-            printer(f'[yellow]Saved failed stations to "{bad_file}"[/yellow]')
-
-        print_statistics(
-            len(items),
-            len(ok_items),
-            sum(1 for st in items if st[Station.url] == '-'),
-            printer
-        )
-
-        return
-
-    # --- mark mode (default) ---
-    marked_items = []
-    for idx, st in enumerate(items):
-        _, ok_flag = results_dict[idx]
-        if not ok_flag:
-            st = list(st)  # make copy
-            st[Station.name] = "[X] " + st[Station.name]
-        marked_items.append(st)
-
-    out_file = f"{file_path}.validated{timestamp}.{input_type}"
-    if input_type == "csv":
-        from .common import CsvReadWrite
-        ret = CsvReadWrite(out_file).write(items=marked_items)
-        if ret < 0:
-            printer(f'[red]Error:[/red] Cannot write "{out_file}".')
-            sys.exit(1)
-    else:
-        from .m3u import list_to_m3u
-        error = list_to_m3u(marked_items, out_file)
+            if health is not None and health.is_fresh(url):
+                results[idx] = health.get(url)['ok']
+                cached_count += 1
+                report(idx, results[idx])
+                continue
+            scheduler.add(idx, url, st[Station.referer])
+
+        if cached_count:
+            printer(f'[cyan]{cached_count} stations checked recently; not checking them again[/cyan]')
+
+        scheduler.fill()
+        flush()
+        while scheduler.futures:
+            finished, _ = wait(scheduler.futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                idx, url = scheduler.done(future)
+                try:
+                    check = future.result()
+                except Exception:
+                    check = UrlCheck(False, '', '', None)
+                ok = check.ok
+                if health is not None:
+                    health.update(url, *check)
+                results[idx] = ok
+                checkpoint.add(idx, ok)
+                report(idx, ok)
+            scheduler.fill()
+            flush()
+    except KeyboardInterrupt:
+        for future in scheduler.futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        checkpoint.close()
+        if health is not None:
+            health.write()
+        printer(f'\n[yellow]Validation interrupted; run the same command again to resume ({len(results)} of {len(items)} stations checked).[/yellow]')
+        sys.exit(1)
+    executor.shutdown()
+    scheduler.close()
+    if health is not None:
+        health.write()
+
+    # --- finish the output files ---
+    for a_writer in writers:
+        error = a_writer.close()
         if error:
-            printer(f'[red]Error:[/red] Cannot write "{out_file}".')
+            printer(f'[red]Error:[/red] {error}')
             sys.exit(1)
+    checkpoint.close(remove_file=True)
+
+    if mode == "drop":
+        printer(f'[green]Saved working stations to "{writers[0].out_file}"[/green]')
+        printer(f'[yellow]Saved failed stations to "{writers[1].out_file}"[/yellow]')
 
-    group_count = sum(1 for st in items if st[Station.url] == '-')
-    online_count = sum(1 for st in marked_items
-                  if st[Station.url] != '-' and not st[Station.name].startswith("[X]"))
     print_statistics(
         len(items),
         online_count,
-        group_count,
+        sum(1 for st in items if st[Station.url] == '-'),
         printer
     )
 
-    printer(f'[cyan]Validation results written to "{out_file}"[/cyan]')
+    if mode != "drop":
+        printer(f'[cyan]Validation results written to "{writers[0].out_file}"[/cyan]')
@@ -271,6 +271,8 @@ class Window_Stack(Window_Stack_Constants):
         self._dq = deque()
         super(Window_Stack_Constants, self).__init__()
         self._dq.append([self.NORMAL_MODE, self.NORMAL_MODE])
+        ''' modes whose windows have to be redrawn '''
+        self._damaged = set()
         self.lock = RLock()
 
     def __del__(self):
@@ -295,6 +297,7 @@ class Window_Stack(Window_Stack_Constants):
                 tmp = [a_mode, self._dq[-1][1]]
                 if self._dq[-1] != tmp:
                     self._dq.append([a_mode, self._dq[-1][1]])
+                    self._damaged.add(a_mode)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.debug('MODE: {0} -> {1} - {2}'.format(
                             self.mode_name(self._dq[-2][0]),
@@ -315,6 +318,7 @@ class Window_Stack(Window_Stack_Constants):
         with self.lock:
             if self._dq[-1] != tmp:
                 self._dq.append([a_mode, a_mode])
+                self._damaged.add(a_mode)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug('WIN MODE: {0} -> {1} - {2}'.format(
                         self.mode_name(self._dq[-2][0]),
@@ -382,6 +386,8 @@ class Window_Stack(Window_Stack_Constants):
 
             if len(self._dq) > 1:
                 tmp = self._dq.pop()
+                ''' the windows below are exposed '''
+                self._damaged.update(x[0] for x in self._dq)
                 if tmp[0] != self._dq[-1][0]:
                     logger.error('\n\nspeak!\n\n')
                     if not no_tts:
@@ -402,3 +408,34 @@ class Window_Stack(Window_Stack_Constants):
     def can_accept_remote_commands(self):
         # return not self.already_opened(self.NO_REMOTE_MODES)
         return self.operation_mode == self.NORMAL_MODE
+
+    def damage(self, *modes):
+        ''' Mark the windows of modes as needing a redraw
+
+            Without arguments, all the windows in the
+            stack are marked.
+        '''
+        with self.lock:
+            if modes:
+                self._damaged.update(modes)
+            else:
+                self._damaged.update(x[0] for x in self._dq)
+
+    def first_damaged(self, modes):
+        ''' Return the index of the first damaged mode in
+            modes (listed from the bottom of the stack up)
+
+            Windows above a damaged one have to be redrawn
+            as well, since they may cover it. The topmost
+            one is always redrawn.
+        '''
+        with self.lock:
+            for n, a_mode in enumerate(modes):
+                if a_mode in self._damaged:
+                    return n
+        return len(modes) - 1
+
+    def repaired(self):
+        ''' All damaged windows have been redrawn '''
+        with self.lock:
+            self._damaged.clear()
@@ -29,10 +29,14 @@ try:
     ole32 = ctypes.windll.ole32
     combase = ctypes.windll.combase
     user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
 except Exception:
     ole32 = None
     combase = None
     user32 = None
+    kernel32 = None
+
+QS_ALLINPUT = 0x04FF
 
 
 def _log_error(msg):
@@ -107,6 +111,9 @@ def _pump_win_messages_once():
 # --------------------------
 
 class _SMTCWinRTThread(object):
+    # the STA loop wakes up at least this often (msec)
+    WAIT_TIMEOUT = 1000
+
     def __init__(self, cmd_queue, state_queue):
         self.cmdq = cmd_queue
         self.stateq = state_queue
@@ -115,6 +122,15 @@ class _SMTCWinRTThread(object):
         self._stop = threading.Event()
         self._ready = threading.Event()
 
+        # Win32 auto-reset event, set when there is work for the STA loop
+        self._wake_event = None
+        try:
+            if kernel32 and wintypes:
+                kernel32.CreateEventW.restype = wintypes.HANDLE
+                self._wake_event = kernel32.CreateEventW(None, False, False, None) or None
+        except Exception:
+            _log_error("OS-MEDIA: SMTC: CreateEvent failed")
+
         # WinRT objects (STA thread only)
         self._player = None
         self._smtc = None
@@ -156,9 +172,37 @@ class _SMTCWinRTThread(object):
             _log_error("OS-MEDIA: SMTC: thread start failed")
             return False
 
+    def post(self, changed):
+        # Queue property changes for the STA thread (any thread)
+        self.stateq.put(changed)
+        self._wake()
+
+    def _wake(self):
+        if self._wake_event:
+            try:
+                kernel32.SetEvent(self._wake_event)
+            except Exception:
+                _log_error("OS-MEDIA: SMTC: SetEvent failed")
+
+    def _wait_for_work(self):
+        # Sleep until a state update is posted or a window message
+        # arrives, instead of polling
+        if self._wake_event and user32 and wintypes:
+            try:
+                handles = (wintypes.HANDLE * 1)(self._wake_event)
+                user32.MsgWaitForMultipleObjects(
+                    1, handles, False, self.WAIT_TIMEOUT, QS_ALLINPUT
+                )
+                return
+            except Exception:
+                _log_error("OS-MEDIA: SMTC: MsgWaitForMultipleObjects failed")
+                self._wake_event = None
+        time.sleep(0.01)
+
     def stop(self):
         try:
             self._stop.set()
+            self._wake()
             if self._thread and self._thread.is_alive():
                 self._thread.join()
             self._thread = None
@@ -256,7 +300,7 @@ class _SMTCWinRTThread(object):
 
                 _pump_win_messages_once()
                 if not did_work:
-                    time.sleep(0.01)
+                    self._wait_for_work()
 
 
         except Exception:
@@ -618,10 +662,10 @@ class WindowsSMTCController(MediaControls):
 
             # Best-effort initial snapshot (similar to how MPRIS starts with defaults)
             try:
-                self._stateq.put({"PlaybackStatus": "Stopped"})
-                self._stateq.put({"CanGoPrevious": False, "CanGoNext": False})
+                self._post_state({"PlaybackStatus": "Stopped"})
+                self._post_state({"CanGoPrevious": False, "CanGoNext": False})
                 # Provide an empty Metadata block so updater is initialized
-                self._stateq.put({"Metadata": {"xesam:title": "", "xesam:artist": []}})
+                self._post_state({"Metadata": {"xesam:title": "", "xesam:artist": []}})
             except Exception:
                 _log_error("OS-MEDIA: SMTC: initial snapshot failed")
 
@@ -723,8 +767,11 @@ class WindowsSMTCController(MediaControls):
             if art_url:
                 md["mpris:artUrl"] = art_url
 
-            self._stateq.put({"Metadata": md})
+            self._post_state({"Metadata": md})
         except Exception:
             _log_error("OS-MEDIA: SMTC: update_metadata failed")
 
+    def _post_state(self, changed):
+        self._thread.post(changed)
+
 
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import threading
+from time import sleep
+from concurrent.futures import Future
+
+from pyradio.common import get_cached_icon_path
+from pyradio.logos import StationLogoFetcher
+
+
+class ImmediateExecutor():
+    ''' run the download before submit returns, like a
+        worker finishing before the done callback is added '''
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_fetch_cached_logo_repeatedly(tmp_path):
+    url = 'http://example.com/logo.png'
+    logo = get_cached_icon_path(str(tmp_path), 'Example Radio', url)
+    with open(logo, 'wb') as f:
+        f.write(b'png')
+
+    fetcher = StationLogoFetcher(str(tmp_path))
+    results = []
+
+    def fetch_all():
+        for _ in range(50):
+            fetcher.fetch(url, 'Example Radio', callback=results.append)
+        while fetcher._pending:
+            sleep(0.01)
+        fetcher._executor = ImmediateExecutor()
+        for _ in range(50):
+            fetcher.fetch(url, 'Example Radio', callback=results.append)
+
+    t = threading.Thread(target=fetch_all, daemon=True)
+    t.start()
+    t.join(10)
+    try:
+        assert not t.is_alive(), 'fetch() deadlocked'
+    finally:
+        fetcher.shutdown()
+    ''' the pooled callbacks may still be running '''
+    for _ in range(100):
+        if len(results) == 100:
+            break
+        sleep(0.05)
+    assert results == [logo] * 100
+    assert fetcher._pending == {}
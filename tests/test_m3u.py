@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from pyradio.m3u import M3uReader
+
+
+def test_ascii_prefix_followed_by_utf8_names(tmp_path):
+    # more than SNIFF_SIZE bytes of plain ASCII before the first
+    # non-ASCII station name
+    lines = ['#EXTM3U']
+    i = 0
+    while sum(len(x) + 1 for x in lines) <= M3uReader.SNIFF_SIZE:
+        lines.append(f'#EXTINF:-1,Station {i}')
+        lines.append(f'http://example.com/stream{i}')
+        i += 1
+    names = ['Radio Zürich Ελληνικά', '日本語放送局', 'Café del Mar']
+    for n, name in enumerate(names):
+        lines.append(f'#EXTINF:-1,{name}')
+        lines.append(f'http://example.com/utf8/{n}')
+    m3u = tmp_path / 'list.m3u'
+    m3u.write_bytes('\n'.join(lines).encode('utf-8'))
+
+    reader = M3uReader(str(m3u), max_entries=0)
+    stations = [station for _, station in reader]
+
+    assert reader.error is None
+    assert reader.encoding == 'utf-8'
+    assert len(stations) == i + len(names)
+    assert [x[0] for x in stations[-len(names):]] == names